@@ -0,0 +1,151 @@
+"""Headless report generation: python -m generate_reports
+
+Renders report packets without starting the GUI and without importing any
+Qt module. It uses the same context builder, templates and report_tracking
+log as the Reports tab.
+
+Examples:
+  python -m generate_reports --template templates/loan_template.docx \\
+      --doc "Tamasuk=templates/template_तमसुक.docx" --members 000000001 000000002
+  python -m generate_reports --template-set packet.json --all-approved \\
+      --approved-from 2082-01-01 --approved-to 2082-03-32 --jobs 4 --output-dir out
+
+A template set is a JSON file:
+  {"primary": "templates/loan_template.docx",
+   "documents": {"Tamasuk": "templates/template_तमसुक.docx"}}
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m generate_reports",
+        description="Generate loan report packets without the GUI.",
+    )
+    members = parser.add_argument_group("members")
+    members.add_argument("--members", nargs="+", default=[], metavar="NUMBER", help="member numbers to generate for")
+    members.add_argument("--members-file", help="text file with one member number per line")
+    members.add_argument("--all-approved", action="store_true", help="every member with an approved loan")
+    members.add_argument("--loan-type", help="only approved loans of this type (with --all-approved)")
+    members.add_argument("--approved-from", help="approval date from, BS YYYY-MM-DD (with --all-approved)")
+    members.add_argument("--approved-to", help="approval date to, BS YYYY-MM-DD (with --all-approved)")
+
+    templates = parser.add_argument_group("templates")
+    templates.add_argument("--template", help="primary (loan application) template")
+    templates.add_argument("--doc", action="append", default=[], metavar="NAME=PATH",
+                           help="additional document, e.g. 'Tamasuk=templates/template_तमसुक.docx'")
+    templates.add_argument("--template-set", help="JSON file with 'primary' and 'documents'")
+
+    parser.add_argument("--merged", action="store_true", help="also write one combined packet .docx per member")
+    parser.add_argument("--output-dir", default="generated reports", help="where generated files go")
+    parser.add_argument("--jobs", type=int, default=0, help="render processes (1 = in-process, 0 = one per CPU)")
+    parser.add_argument("--batch-size", type=int, default=25, help="members per report_tracking transaction")
+    parser.add_argument("--db", help="database file (defaults to the app's database)")
+    parser.add_argument("--generated-by", default="cli", help="user recorded in report_tracking")
+    parser.add_argument("--entered-by", default="", help="entered-by name for the context cache key")
+    parser.add_argument("--approved-by", default="", help="approved-by name for the context cache key")
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    return parser.parse_args(argv)
+
+
+def load_templates(args):
+    """Return (primary_template, [(doc_name, template_path), ...])."""
+    primary, extra_docs = args.template, []
+    if args.template_set:
+        with open(args.template_set, encoding="utf-8") as fh:
+            template_set = json.load(fh)
+        base = Path(args.template_set).resolve().parent
+        resolve = lambda p: str(p if os.path.isabs(p) else base / p)
+        primary = primary or resolve(template_set["primary"])
+        extra_docs.extend((name, resolve(path)) for name, path in template_set.get("documents", {}).items())
+    for spec in args.doc:
+        name, sep, path = spec.partition("=")
+        if not sep or not name or not path:
+            raise SystemExit(f"--doc expects NAME=PATH, got {spec!r}")
+        extra_docs.append((name.strip(), path.strip()))
+
+    if not primary:
+        raise SystemExit("A primary template is required (--template or --template-set)")
+    for path in [primary] + [path for _, path in extra_docs]:
+        if not os.path.isfile(path):
+            raise SystemExit(f"Template not found: {path}")
+    return primary, extra_docs
+
+
+def load_members(args):
+    """Return [(member_number, member_name, loan_type), ...]."""
+    from models.loan_model import fetch_loan_info_members
+    from services.bulk_report_generation import select_bulk_members
+
+    if args.all_approved:
+        return select_bulk_members(args.loan_type, args.approved_from, args.approved_to)
+
+    numbers = list(args.members)
+    if args.members_file:
+        with open(args.members_file, encoding="utf-8") as fh:
+            numbers.extend(line.strip() for line in fh if line.strip())
+    if not numbers:
+        raise SystemExit("No members given (--members, --members-file or --all-approved)")
+
+    # Loan type decides the primary report's folder and file name
+    loans = {}
+    for member_number, member_name, loan_type, _ in fetch_loan_info_members():
+        loans.setdefault(member_number, (member_name, loan_type))
+    members = []
+    for number in dict.fromkeys(str(n).strip().zfill(9) for n in numbers):
+        member_name, loan_type = loans.get(number, ("", ""))
+        members.append((number, member_name, loan_type or "unknown"))
+    return members
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Configure logging before the app modules call basicConfig(level=DEBUG)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    from models.database import initialize_db, set_database_path, close_all_connections
+    from services.bulk_report_generation import generate_bulk
+    from services.parallel_render import set_render_workers, shutdown_render_pool
+
+    if args.db:
+        set_database_path(args.db)
+    initialize_db()
+    if args.jobs:
+        set_render_workers(args.jobs)
+
+    primary, extra_docs = load_templates(args)
+    members = load_members(args)
+    print(f"Generating {1 + len(extra_docs) + args.merged} document(s) for {len(members)} member(s) into {args.output_dir!r}")
+
+    def on_progress(done, total, member_number, stats):
+        print(f"  [{done}/{total}] {member_number}  ({stats['documents_per_sec']:.1f} docs/s)", flush=True)
+
+    approver = {"entered_by_name": args.entered_by, "approved_by_name": args.approved_by}
+    try:
+        stats = generate_bulk(
+            members, primary, extra_docs, args.generated_by, approver,
+            batch_size=args.batch_size, on_progress=on_progress, base_dir=args.output_dir,
+            merged=args.merged,
+        )
+    except KeyboardInterrupt:
+        print("Interrupted")
+        return 130
+    finally:
+        shutdown_render_pool()
+        close_all_connections()
+
+    print(f"Done: {stats['documents']} document(s) for {stats['members_done']} member(s) in "
+          f"{stats['elapsed']:.1f}s ({stats['documents_per_sec']:.1f} docs/s)")
+    for member_number, doc_name, error in stats["failures"]:
+        print(f"  FAILED {member_number} · {doc_name}: {error}", file=sys.stderr)
+    return 1 if stats["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,14 @@ Properly configured for PyInstaller bundling
 
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 from PyQt5.QtWidgets import QApplication, QDialog
 from PyQt5.QtGui import QIcon
 
-from models.database import initialize_db
-from models.user_model import create_user_table
+from models.database import initialize_db, close_all_connections
+from services.parallel_render import shutdown_render_pool
+from services.member_index import member_index
 
 
 # Add current directory to Python path for bundled app
@@ -61,9 +63,12 @@ def main():
     try:
         # Create application
         app = setup_application()
+        app.aboutToQuit.connect(close_all_connections)
+        app.aboutToQuit.connect(shutdown_render_pool)
+        from ui.setting_tab import apply_render_setting
+        apply_render_setting()
 
         main_window = None
-        create_user_table()
         
         # Import windows
         from ui.main_window import MainWindow
@@ -72,6 +77,8 @@ def main():
         # handle successful login
         def handle_login_success(username):
             nonlocal main_window
+            # Member completers search this in memory from here on
+            member_index.load()
             main_window =  MainWindow(username=username)
 
             # Set window icon
@@ -95,4 +102,6 @@ def main():
         sys.exit(1)
 
 if __name__ == '__main__':
+    # Report rendering worker processes re-enter here when frozen by PyInstaller
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
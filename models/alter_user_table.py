@@ -1,17 +1,5 @@
-from .database import get_connection
+from .database import initialize_db
 
 def alter_users_table_add_fullname():
-    conn = get_connection()
-    cur = conn.cursor()
-
-    try:
-        cur.execute("ALTER TABLE users ADD COLUMN full_name_nepali TEXT")
-        print("✅ Column full_name_nepali added to users table.")
-    except Exception as e:
-        if "duplicate column name" in str(e).lower():
-            print("⚠ Column already exists.")
-        else:
-            print("❌ Error altering users table:", e)
-    finally:
-        conn.commit()
-        conn.close()
+    """full_name_nepali is now added by the baseline migration."""
+    initialize_db()
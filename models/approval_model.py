@@ -1,4 +1,6 @@
-from models.database import get_connection
+from models.database import get_connection, transaction
+from utils.amount_to_words import convert_number_to_nepali_words
+from utils.converter import format_amount, parse_amount
 
 def save_approval_info(data):
     conn = get_connection()
@@ -15,3 +17,73 @@ def save_approval_info(data):
     ))
     conn.commit()
     conn.close()
+
+def approve_loans(approvals, approval_date, entered_by, entered_designation, approved_by, approved_designation):
+    """
+    Approve many pending loans at once, all or nothing.
+    approvals: list of (loan_id, member_number, approved_amount); amounts may
+    use Nepali or ASCII digits, commas and decimals.
+    Every loan is validated first; then all approval_info rows and loan_info
+    status updates are written in one transaction. Raises ValueError listing
+    every problem, with nothing written.
+    Returns: List of dicts (loan_id, member_number, approved_loan_amount,
+    approved_loan_amount_words) for the approved loans
+    """
+    if not approvals:
+        raise ValueError("स्वीकृत गर्न कुनै ऋण छानिएको छैन।")
+    approval_date = (approval_date or "").strip()
+    errors = []
+    if not approval_date:
+        errors.append("स्वीकृत मिति आवश्यक छ।")
+
+    approved, seen = [], set()
+    for loan_id, member_number, amount in approvals:
+        if loan_id in seen:
+            errors.append(f"{member_number}: एउटै ऋण दोहोरिएको छ।")
+            continue
+        seen.add(loan_id)
+        parsed = parse_amount(amount)
+        if parsed is None or parsed <= 0:
+            errors.append(f"{member_number}: अमान्य रकम '{str(amount or '').strip()}'")
+            continue
+        approved.append({
+            "loan_id": loan_id,
+            "member_number": member_number,
+            "approved_loan_amount": format_amount(parsed),
+            "approved_loan_amount_words": convert_number_to_nepali_words(int(parsed)),
+        })
+    if errors:
+        raise ValueError("\n".join(errors))
+
+    with transaction() as conn:
+        cursor = conn.cursor()
+        placeholders = ", ".join("?" for _ in approved)
+        cursor.execute(f"""
+            SELECT id, member_number FROM loan_info
+            WHERE status = 'pending' AND id IN ({placeholders})
+        """, [a["loan_id"] for a in approved])
+        pending = set(cursor.fetchall())
+        missing = [a["member_number"] for a in approved if (a["loan_id"], a["member_number"]) not in pending]
+        if missing:
+            raise ValueError(
+                "यी ऋणहरू फेला परेनन् वा पहिले नै स्वीकृत/रद्द गरिएका छन्: " + ", ".join(map(str, missing))
+            )
+
+        cursor.executemany("""
+            INSERT INTO approval_info (member_number, approval_date, entered_by, entered_post,
+                       approved_by, approved_post, approved_loan_amount, approved_loan_amount_words)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (a["member_number"], approval_date, entered_by, entered_designation,
+             approved_by, approved_designation, a["approved_loan_amount"], a["approved_loan_amount_words"])
+            for a in approved
+        ])
+        cursor.executemany("""
+            UPDATE loan_info
+            SET status = 'approved'
+            WHERE id = ? AND member_number = ? AND status = 'pending'
+        """, [(a["loan_id"], a["member_number"]) for a in approved])
+        if cursor.rowcount != len(approved):
+            # Another user approved one of them since the check above
+            raise ValueError("केही ऋणहरूको स्थिति बदलिएको छ। कृपया रिफ्रेश गरेर फेरि प्रयास गर्नुहोस्।")
+    return approved
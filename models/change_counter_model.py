@@ -0,0 +1,17 @@
+# models/change_counter_model.py
+"""Read the change_counters that triggers bump (see migrations 0005 and 0009)."""
+from models.database import get_connection
+
+
+def fetch_change_versions(tables):
+    """Tuple of the change counters of `tables`, in order; compare two to see if anything changed."""
+    conn = get_connection()
+    try:
+        placeholders = ", ".join("?" for _ in tables)
+        rows = dict(conn.execute(
+            f"SELECT table_name, version FROM change_counters WHERE table_name IN ({placeholders})",
+            list(tables),
+        ).fetchall())
+        return tuple(rows.get(table, 0) for table in tables)
+    finally:
+        conn.close()
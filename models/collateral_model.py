@@ -6,21 +6,6 @@ def save_collateral_info(data: dict, member_number:str):
         conn = get_connection()
         cursor = conn.cursor()
 
-        cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS collateral_basic (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    member_number TEXT,
-                    monthly_saving TEXT,
-                    child_saving TEXT,
-                    share_amount TEXT,
-                    total_saving TEXT )
-        """)
-        # Check if the table already exists and needs alteration
-        cursor.execute("PRAGMA table_info(collateral_basic)")
-        columns = [row[1] for row in cursor.fetchall()]
-        if 'share_amount' not in columns:
-            cursor.execute("ALTER TABLE collateral_basic ADD COLUMN share_amount TEXT")
-        
         # Insert or updte data            
         cursor.execute("""
             INSERT INTO collateral_basic (
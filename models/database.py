@@ -1,8 +1,12 @@
 # models/database.py
+import logging
 import sqlite3
 import os
 import sys
 import shutil
+import threading
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
 
 APP_NAME = "LoanApp"
@@ -51,8 +55,17 @@ def resource_path(relative_path):
         base_path = Path(__file__).parent.parent
     return base_path / relative_path
 
+_resolved_db_path = None
+
 def get_database_path():
-    """Return path to writable DB. Copy bundled DB to user folder if needed."""
+    """Return path to writable DB. Copy bundled DB to user folder if needed.
+
+    The path is resolved once per process; later calls return the cached value.
+    """
+    global _resolved_db_path
+    if _resolved_db_path is not None:
+        return _resolved_db_path
+
     user_dir = get_user_data_dir()
     user_db = user_dir / "loan_app.db"
 
@@ -63,249 +76,247 @@ def get_database_path():
             shutil.copy2(bundled_db, user_db)
         else:
             print(f"❌ Bundled DB not found at: {bundled_db}")
-    
-    return str(user_db)
 
-def get_connection():
-    db_path = get_database_path()
-    print(f"📦 Using database at: {db_path}")
-    return sqlite3.connect(db_path)
+    _resolved_db_path = str(user_db)
+    print(f"📦 Using database at: {_resolved_db_path}")
+    return _resolved_db_path
 
-def initialize_db():
-    conn = get_connection()
-    conn.execute("PRAGMA journal_mode=WAL;")
-
-    cur = conn.cursor()
-
-    # Create Member Table
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS member_info(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT,
-                member_number TEXT UNIQUE,
-                member_name TEXT,
-                address TEXT,
-                ward_no TEXT,
-                phone TEXT,
-                dob_bs TEXT,
-                citizenship_no TEXT,
-            father_name TEXT,
-                grandfather_name TEXT,
-                spouse_name TEXT,
-                spouse_phone TEXT,
-                business_name TEXT,
-                business_address TEXT,
-                job_name TEXT,
-                job_address TEXT
-                )        
-    """)
-    
-    
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS loan_info(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT,
-                loan_type TEXT,
-                interest_rate TEXT,
-                loan_duration TEXT,
-                repayment_duration TEXT,
-                loan_amount TEXT,
-                loan_amount_in_words TEXT,
-                loan_completion_year TEXT,
-                loan_completion_month TEXT,
-                loan_completion_day TEXT                               
-                )
-    """)
-
-    # Collateral Basic
-    # cur.execute("""
-    # CREATE TABLE IF NOT EXISTS collateral_basic (
-    #     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    #     member_number TEXT,
-    #     monthly_saving TEXT,
-    #     child_saving TEXT,
-    #     total_saving TEXT
-    #     )
-    # """)
+def set_database_path(db_path):
+    """Point the app at a different database file (CLI tools, scripts).
 
-    
-    #  Create TABLE for collateral affiliations
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS collateral_affiliations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT,
-                institution TEXT,
-                address TEXT,
-                postition TEXT,
-                estimated_income TEXT,
-                remarks TEXT
-                )
-    """)
-   
-    # Create table for collateral family details
-    cur.execute ("""
-        CREATE TABLE IF NOT EXISTS collateral_properties (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT,
-                owner_name TEXT,
-                father_or_spouse TEXT,
-                grandfather_or_father_inlaw TEXT,
-                district TEXT,
-                municipality_vdc TEXT,
-                sheet_no TEXT,
-                ward_no TEXT,
-                plot_no TEXT,
-                area TEXT,
-                land_type TEXT                
-                )
-    """)
-    
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS collateral_family_details(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT,
-                name TEXT,
-                age TEXT,
-                relation TEXT,
-                member_of_org TEXT,
-                occupation TEXT,
-                monthly_income TEXT
-                )
-    """)
-
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS collateral_income_expense(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            member_number TEXT,
-            field TEXT,
-            amount TEXT,
-            type TEXT
-            )
-    """)
-   
-    
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS approval_info (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            member_number TEXT NOT NULL,
-            approval_date TEXT,
-            entered_by TEXT,
-            entered_post TEXT,
-            approved_by TEXT,
-            approved_post TEXT,
-            remarks TEXT,
-            approved_loan_amount TEXT,
-            approved_loan_amount_words TEXT
-
-        );
-    """)
-
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS report_tracking (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            member_number TEXT NOT NULL,
-            report_type TEXT, 
-            generated_by TEXT,
-            file_path TEXT,
-            generated_date TEXT
-        );
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS collateral_projects (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            member_number TEXT NOT NULL,
-            project_name TEXT,
-            self_investment TEXT,
-            requested_loan_amount TEXT,
-            total_cost TEXT,
-            remarks TEXT
-        );
-    """)
-
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS loan_witness(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT NOT NULL,
-                name TEXT,
-                relation TEXT,
-                address_mun TEXT,
-                ward_no TEXT,
-                address_tole TEXT,
-                age TEXT
-                );
-    """)
-
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS organization_profile (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_name TEXT NOT NULL,
-            address TEXT,
-            logo_path TEXT
-        );
-    """)
-
-    cur.execute("""
-            CREATE TABLE IF NOT EXISTS loan_info (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT,
-                loan_type TEXT,
-                interest_rate TEXT,
-                loan_duration TEXT,
-                repayment_duration TEXT,
-                loan_amount TEXT,
-                loan_amount_in_words TEXT,
-                loan_completion_year TEXT,
-                loan_completion_month TEXT,
-                loan_completion_day TEXT,
-                status TEXT DEFAULT 'pending'
-                
-            )
-        """)
-    
-    cur.execute("""
-            CREATE TABLE  IF NOT EXISTS manjurinama_details (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT,
-                person_name TEXT,
-                grandfather_name TEXT,
-                father_name TEXT,
-                age TEXT,
-                district TEXT,
-                muncipality TEXT,
-                wada_no TEXT,
-                tole TEXT
-            )
-        """)
-    
-    cur.execute("""
-            CREATE TABLE IF NOT EXISTS guarantor_details(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT,
-                gurantor_member_number TEXT,
-                guarantor_name TEXT,
-                guarantor_address TEXT,
-                gurantor_ward TEXT,
-                guarantor_phone TEXT,
-                guarantor_citizenship TEXT,
-                guarantor_grandfather TEXT,
-                guarantor_father TEXT,
-                guarantor_issue_dist TEXT,
-                guarantor_age TEXT
-            )
-        """)
-    
+    Existing pooled connections are closed so the next call reconnects.
+    """
+    global _resolved_db_path
+    connection_manager.close_all()
+    _resolved_db_path = str(db_path)
 
 
-    # Extend this with other required tables 
+# PRAGMAs applied once when a pooled connection is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",
+)
 
-    # Add missing column if not exists (SQLite does not have IF NOT EXISTS for ALTER)
-    # So try-except to avoid error if column already exists
-    try:
-        cur.execute("ALTER TABLE loan_info ADD COLUMN status TEXT DEFAULT 'pending'")
-    except Exception as e:
-        print("Status column likely exists:", e)
-    
-    conn.commit()
-    conn.close()
 
-   
\ No newline at end of file
+class ConnectionManager:
+    """Keeps one persistent SQLite connection per thread.
+
+    sqlite3 connections may only be used from the thread that created them,
+    so each thread gets its own connection which is opened lazily, configured
+    once with CONNECTION_PRAGMAS and then reused for every later call.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._stats = {"opened": 0, "reused": 0, "closed": 0}
+
+    def _open(self):
+        conn = sqlite3.connect(get_database_path())
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self._connections.append(conn)
+            self._stats["opened"] += 1
+        self._local.conn = conn
+        self._local.depth = 0
+        self._local.wrappers = weakref.WeakSet()
+        return conn
+
+    def connection(self):
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return self._open()
+        with self._lock:
+            self._stats["reused"] += 1
+        return conn
+
+    def in_transaction_block(self):
+        """True while the current thread is inside transaction()."""
+        return getattr(self._local, "depth", 0) > 0
+
+    def _discard_leftovers(self, conn):
+        """Roll back writes a get_connection() caller never committed or rolled back."""
+        if conn.in_transaction:
+            # Only the code that made them may commit them
+            logging.warning("Rolling back uncommitted writes left on this thread's connection")
+            conn.rollback()
+
+    def pooled(self):
+        """Return a PooledConnection for this thread (what get_connection() hands out).
+
+        Outside transaction(), when no other wrapper on this thread is still
+        alive, writes left uncommitted by an earlier caller are rolled back so
+        the new caller's commit() can't commit them. A wrapper still alive
+        further up the stack may hold writes it hasn't committed yet, so
+        those are left alone.
+        """
+        conn = self.connection()
+        wrappers = self._local.wrappers
+        if not self.in_transaction_block() and not wrappers:
+            self._discard_leftovers(conn)
+        wrapper = PooledConnection(self, conn)
+        wrappers.add(wrapper)
+        return wrapper
+
+    def rollback_block(self):
+        """Undo the writes made so far in the innermost transaction() block.
+
+        The block itself carries on and still commits (or releases) whatever
+        it writes afterwards when it finishes.
+        """
+        depth = self._local.depth
+        if depth == 0:
+            raise RuntimeError("rollback_block() called outside transaction()")
+        self._local.conn.execute(f"ROLLBACK TO sp_{depth - 1}")
+
+    @contextmanager
+    def transaction(self):
+        """Run a block atomically on this thread's connection.
+
+        Every block opens a SAVEPOINT (the outermost one right after BEGIN),
+        so helpers can open their own transaction() while being called from a
+        larger one. Uncommitted writes left on the connection by earlier
+        get_connection() code are rolled back (with a warning) before the
+        outermost block begins. On connections from get_connection(),
+        commit()/close() are deferred until the outermost block finishes and
+        rollback() undoes only the innermost block's writes.
+        """
+        conn = self.connection()
+        depth = self._local.depth
+        savepoint = f"sp_{depth}"
+        if depth == 0:
+            self._discard_leftovers(conn)
+            conn.execute("BEGIN")
+        conn.execute(f"SAVEPOINT {savepoint}")
+        self._local.depth = depth + 1
+        try:
+            yield conn
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+        else:
+            if depth == 0:
+                conn.commit()
+            else:
+                conn.execute(f"RELEASE {savepoint}")
+        finally:
+            self._local.depth = depth
+
+    def stats(self):
+        """Return open/reuse counters for the pooled connections."""
+        with self._lock:
+            return {**self._stats, "active": len(self._connections)}
+
+    def close_thread_connection(self):
+        """Close the calling thread's connection (worker threads on exit)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+                self._stats["closed"] += 1
+        conn.close()
+        self._local.conn = None
+
+    def close_all(self):
+        """Close every pooled connection (call on application exit)."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._stats["closed"] += len(connections)
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # Connection belongs to a thread that already finished
+                pass
+        # Forget the per-thread handles so every thread reconnects lazily
+        self._local = threading.local()
+
+
+class PooledConnection:
+    """Thin wrapper returned by get_connection().
+
+    It forwards everything to the thread's pooled sqlite3 connection but
+    turns close() into a release: uncommitted work is rolled back (what
+    closing a real connection would do) and the connection stays open.
+    Inside transaction(), commit() and close() wait for the block to finish
+    and rollback() rolls back to the innermost block's savepoint.
+    """
+
+    def __init__(self, manager, conn):
+        self._manager = manager
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self, *args, **kwargs):
+        return self._conn.cursor(*args, **kwargs)
+
+    def execute(self, *args, **kwargs):
+        return self._conn.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        return self._conn.executemany(*args, **kwargs)
+
+    def commit(self):
+        if not self._manager.in_transaction_block():
+            self._conn.commit()
+
+    def rollback(self):
+        if self._manager.in_transaction_block():
+            self._manager.rollback_block()
+        else:
+            self._conn.rollback()
+
+    def close(self):
+        if not self._manager.in_transaction_block() and self._conn.in_transaction:
+            self._conn.rollback()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+connection_manager = ConnectionManager()
+
+def get_connection():
+    """Return the calling thread's pooled connection."""
+    return connection_manager.pooled()
+
+def transaction():
+    """Shortcut for connection_manager.transaction()."""
+    return connection_manager.transaction()
+
+def get_connection_stats():
+    return connection_manager.stats()
+
+def close_all_connections():
+    print(f"🔌 Connection stats: {connection_manager.stats()}")
+    connection_manager.close_all()
+
+def initialize_db():
+    """Bring the database schema up to date.
+
+    All DDL lives in models/migrations; on an up-to-date database this is a
+    single `PRAGMA user_version` read.
+    """
+    from models.migrations import migrate
+    return migrate()
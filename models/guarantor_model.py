@@ -1,33 +1,10 @@
 from models.database import get_connection
-import os
 
 def save_guranteer_details(data):
+    conn = None
     try:
         conn = get_connection()
-        db_path = conn if hasattr(conn, 'get_db_path') else "Unknown path"  # Fallback if path isn’t accessible
-        print(f"Using database connection: {db_path}")
         cursor = conn.cursor()
-        print(f"Attempting to create table 'guranteer_details'...")
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS guranteer_details (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_number TEXT,
-                guarantor_member_number TEXT,
-                guarantor_name TEXT,
-                guarantor_address TEXT,
-                guarantor_ward TEXT,
-                guarantor_phone TEXT,
-                guarantor_citizenship TEXT,
-                guarantor_grandfather TEXT,
-                guarantor_father TEXT,
-                guarantor_issue_dist TEXT,
-                guarantor_age TEXT
-            )
-        """)
-        print("Table creation executed, checking table existence...")
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='guranteer_details';")
-        table_exists = cursor.fetchone()
-        print(f"Table 'guranteer_details' exists: {bool(table_exists)}")
         print("Inserting data...")
         cursor.execute("""
             INSERT INTO guranteer_details (
@@ -1,4 +1,6 @@
 from models.database import get_connection
+from models.member_model import refresh_search_keys
+from services.member_index import member_index
 import sqlite3
 import logging
 
@@ -81,10 +83,12 @@ def save_or_update_member_info(data: dict):
             
         ))
     
+    refresh_search_keys(conn)
     print(f"🔄 Saving/Updating: {data['member_number']}")
     conn.commit()
     print("✅ DB commit complete")
     conn.close()
+    member_index.upsert(data['member_number'], data['member_name'])
 
 def save_loan_info(data):
     conn = get_connection()
@@ -153,47 +157,89 @@ def save_loan_info(data):
         conn.close()  
     
 def fetch_all_loans():
+    """
+    Loans for LoanListTab, latest approval first, from loan_summary.
+    Returns: List of tuples (member_number, member_name, loan_type, loan_amount,
+    approved_loan_amount, status, approval_date)
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
     query = """
     SELECT
-        m.member_number,
-        m.member_name,
-        l.loan_type,
-        l.loan_amount,
-        a.approved_loan_amount,
-        CASE
-            WHEN a.approved_loan_amount IS NOT NULL THEN 'Approved'
-            ELSE 'Pending'
-        END as status,
-        COALESCE(a.approval_date, '')
-    FROM member_info m
-    JOIN loan_info l ON m.member_number = l.member_number
-    LEFT JOIN approval_info a ON m.member_number = a.member_number
-    ORDER BY a.approval_date DESC        
+        member_number,
+        member_name,
+        loan_type,
+        loan_amount,
+        approved_loan_amount,
+        UPPER(SUBSTR(status, 1, 1)) || LOWER(SUBSTR(status, 2)) AS status,
+        COALESCE(approval_date, '')
+    FROM loan_summary
+    WHERE member_id IS NOT NULL
+    ORDER BY approval_date DESC
     """
     cursor.execute(query)
     rows = cursor.fetchall()
     conn.close()
     return rows
 
-def fetch_loan_info_members():
+def fetch_pending_loans():
+    """Pending loans for ApprovalTab, by loan id.
+    Returns: List of tuples (id, member_number, member_name, loan_type, loan_amount,
+    loan_amount_in_words, status)
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT l.id, l.member_number, m.member_name, l.loan_type, l.loan_amount, l.loan_amount_in_words, l.status
+            FROM loan_info l
+            LEFT JOIN member_info m ON l.member_number = m.member_number
+            WHERE l.status = 'pending'
+            ORDER BY l.id
+        """)
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
+def fetch_loan_info_members(status=None, loan_type=None, approval_date_from=None, approval_date_to=None):
     """
-    Fetch members with loan details from the loan_info table for ReportsTab.
+    Fetch members with loan details from the loan_summary table for ReportsTab.
+    Optional filters (used by bulk report generation): loan status, loan
+    type, and an inclusive BS approval date range ('YYYY-MM-DD') matched
+    against every approval_info row of the member.
     Returns: List of tuples (member_number, member_name, loan_type, status)
     """
     conn = get_connection()
     cursor = conn.cursor()
     try:
-        query = """
-            SELECT l.member_number, m.member_name, l.loan_type, l.status
-            FROM loan_info l
-            JOIN member_info m ON l.member_number = m.member_number
-            WHERE l.status IN ('pending', 'active', 'approved')
-            ORDER BY l.member_number
+        conditions = ["status IN ('pending', 'active', 'approved')", "member_id IS NOT NULL"]
+        params = []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if loan_type:
+            conditions.append("loan_type = ?")
+            params.append(loan_type)
+        # Any approval in the range, not just the latest one loan_summary carries
+        if approval_date_from or approval_date_to:
+            approval_conditions = ["a.member_number = loan_summary.member_number"]
+            if approval_date_from:
+                approval_conditions.append("REPLACE(a.approval_date, '/', '-') >= ?")
+                params.append(approval_date_from)
+            if approval_date_to:
+                approval_conditions.append("REPLACE(a.approval_date, '/', '-') <= ?")
+                params.append(approval_date_to)
+            conditions.append(
+                f"EXISTS (SELECT 1 FROM approval_info a WHERE {' AND '.join(approval_conditions)})"
+            )
+        query = f"""
+            SELECT member_number, member_name, loan_type, status
+            FROM loan_summary
+            WHERE {' AND '.join(conditions)}
+            ORDER BY member_number
         """
-        cursor.execute(query)
+        cursor.execute(query, params)
         members = cursor.fetchall()
         logging.debug(f"Fetched members from loan_info: {members}")  # Log the raw data
         logging.debug(f"Number of members fetched: {len(members)}")
@@ -1,19 +1,8 @@
-from models.database import get_connection
+from models.database import get_connection, initialize_db
 
 def create_loan_scheme_table():
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-            CREATE TABLE IF NOT EXISTS loan_schemes (
-                   id INTEGER PRIMARY KEY AUTOINCREMENT,
-                   loan_type TEXT UNIQUE,
-                   interest_rate REAL
-                   )
-    """)
-
-    conn.commit()
-    conn.close()
+    """Ensure the loan_schemes table is current (schema lives in models/migrations)."""
+    initialize_db()
 
 
 def add_or_update_loan_scheme(loan_type, interest_rate):
@@ -4,20 +4,6 @@ def save_manjurinama_details(data):
     try:
         conn = get_connection()
         cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE  IF NOT EXISTS manjurinama_details (
-                       id INTEGER PRIMARY KEY AUTOINCREMENT,
-                       member_number TEXT,
-                       person_name TEXT,
-                       grandfather_name TEXT,
-                       father_name TEXT,
-                       age TEXT,
-                       district TEXT,
-                       muncipality TEXT,
-                       wada_no TEXT,
-                       tole TEXT
-                       )
-        """)
         cursor.execute("""
             INSERT INTO manjurinama_details(member_number,
                        person_name,
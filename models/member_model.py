@@ -1,6 +1,50 @@
 # models/member_model.py
 
 from models.database import get_connection
+from services.member_index import member_index
+from utils.search_keys import member_keys
+
+
+def refresh_search_keys(conn):
+    """Recompute the member_search_keys rows the member_info triggers marked stale.
+
+    Call it on the connection that wrote member_info, before committing, so
+    the keys land in the same transaction. Updates the member_search FTS
+    index too when there is one. Returns the number of members keyed.
+    """
+    rows = conn.execute("""
+        SELECT k.member_id, k.name_key, k.number_key, k.family_key, k.contact_key, k.address_key,
+               m.member_number, m.member_name, m.father_name, m.grandfather_name,
+               m.phone, m.citizenship_no, m.address
+        FROM member_search_keys k
+        JOIN member_info m ON m.id = k.member_id
+        WHERE k.stale = 1
+    """).fetchall()
+    if not rows:
+        return 0
+
+    keyed = [(row[0], *member_keys(*row[6:])) for row in rows]
+    has_index = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='member_search'"
+    ).fetchone()
+    if has_index:
+        # External-content FTS5 needs the old values to remove a row
+        conn.executemany("""
+            INSERT INTO member_search(member_search, rowid, name_key, number_key, family_key, contact_key, address_key)
+            VALUES ('delete', ?, ?, ?, ?, ?, ?)
+        """, [row[:6] for row in rows if row[1] is not None])
+    conn.executemany("""
+        UPDATE member_search_keys
+        SET name_key = ?, number_key = ?, family_key = ?, contact_key = ?, address_key = ?, stale = 0
+        WHERE member_id = ?
+    """, [(*keys[1:], keys[0]) for keys in keyed])
+    if has_index:
+        conn.executemany("""
+            INSERT INTO member_search(rowid, name_key, number_key, family_key, contact_key, address_key)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, keyed)
+    return len(rows)
+
 
 def save_member_info(data):
     conn = get_connection()
@@ -53,9 +97,11 @@ def save_member_info(data):
         data.get("facebook_detail"),
         data.get("whatsapp_detail")
     ))
+    refresh_search_keys(conn)
 
     conn.commit()
     conn.close()
+    member_index.upsert(data.get("member_number"), data.get("member_name"))
 
 
 def update_member_info(data):
@@ -104,9 +150,70 @@ def update_member_info(data):
         data["whatsapp_detail"],
         data["member_number"]
     ))
+    refresh_search_keys(conn)
 
     conn.commit()
     conn.close()
+    member_index.upsert(data.get("member_number"), data.get("member_name"))
+
+MEMBER_LIST_COLUMNS = [
+    "member_number", "member_name", "address", "ward_no", "phone", "dob_bs", "citizenship_no",
+    "father_name", "grandfather_name", "spouse_name", "spouse_phone", "business_name",
+    "business_address", "job_name", "job_address", "email", "profession",
+    "facebook_detail", "whatsapp_detail",
+]
+
+
+def fetch_member_page(after=None, limit=50, keyword=None, order_by="member_number", descending=False):
+    """One page of members (as dicts), ordered by `order_by`, then member_number.
+
+    Keyset pagination: pass the last member_number of the previous page as
+    `after` to get the next one; for another order_by column its value is
+    read from that member's row. order_by is one of MEMBER_LIST_COLUMNS
+    (member_number, the default, is the indexed order). keyword filters on
+    the normalized search keys (see services.member_lookup), in the
+    database.
+    """
+    from services.member_lookup import member_filter
+    if order_by not in MEMBER_LIST_COLUMNS:
+        raise ValueError(f"Unknown member column: {order_by}")
+    keys, after_keys = ["m.member_number"], ["?"]
+    if order_by != "member_number":
+        # NULLs as '' so the row-value comparison below never sees a NULL
+        keys.insert(0, f"COALESCE(m.{order_by}, '')")
+        after_keys.insert(0, f"(SELECT COALESCE(a.{order_by}, '') FROM member_info a WHERE a.member_number = ?)")
+    direction, beyond = ("DESC", "<") if descending else ("ASC", ">")
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        condition, params = member_filter(cur, keyword)
+        if after is not None:
+            condition += f" AND ({', '.join(keys)}) {beyond} ({', '.join(after_keys)})"
+            params.extend([after] * len(keys))
+        cur.execute(f"""
+            SELECT {", ".join(f"m.{c}" for c in MEMBER_LIST_COLUMNS)}
+            FROM member_info m
+            WHERE {condition}
+            ORDER BY {", ".join(f"{key} {direction}" for key in keys)}
+            LIMIT ?
+        """, (*params, limit))
+        return [dict(zip(MEMBER_LIST_COLUMNS, row)) for row in cur.fetchall()]
+    finally:
+        conn.close()
+
+
+def count_members(keyword=None):
+    """Number of members, or of members matching keyword."""
+    from services.member_lookup import member_filter
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        condition, params = member_filter(cur, keyword)
+        cur.execute(f"SELECT COUNT(*) FROM member_info m WHERE {condition}", params)
+        return cur.fetchone()[0]
+    finally:
+        conn.close()
+
 
 def fetch_all_members():
     """ m['member_number'], m['member_name'], m['phone'], m['dob_bs'], m['citizenship_no'],
@@ -158,3 +265,4 @@ def delete_member(member_number):
     cur.execute("DELETE FROM member_info WHERE member_number=?", (member_number,))
     conn.commit()
     conn.close()
+    member_index.remove(member_number)
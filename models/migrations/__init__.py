@@ -0,0 +1,57 @@
+# models/migrations/__init__.py
+"""Versioned schema migrations.
+
+The schema version lives in SQLite's `PRAGMA user_version`. Each migration
+file exposes VERSION, DESCRIPTION and upgrade(conn); add new files to
+MIGRATIONS in order. When the database is already current, migrate()
+costs a single PRAGMA read.
+"""
+import logging
+
+from models.migrations import (
+    m0001_baseline_schema, m0002_member_number_indexes, m0003_member_search_fts,
+    m0004_member_search_keys, m0005_change_counters,
+    m0006_loan_summary, m0007_import_checkpoints, m0008_loan_summary_pending,
+    m0009_member_insert_counter,
+)
+
+MIGRATIONS = [
+    m0001_baseline_schema,
+    m0002_member_number_indexes,
+    m0003_member_search_fts,
+    m0004_member_search_keys,
+    m0005_change_counters,
+    m0006_loan_summary,
+    m0007_import_checkpoints,
+    m0008_loan_summary_pending,
+    m0009_member_insert_counter,
+]
+
+LATEST_VERSION = MIGRATIONS[-1].VERSION
+
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate():
+    """Apply pending migrations, each in its own transaction.
+
+    Returns the schema version the database ends up on.
+    """
+    from models.database import connection_manager, transaction
+
+    current = get_schema_version(connection_manager.connection())
+    if current >= LATEST_VERSION:
+        return current
+
+    for migration in MIGRATIONS:
+        if migration.VERSION <= current:
+            continue
+        logging.info(f"Applying migration {migration.VERSION}: {migration.DESCRIPTION}")
+        with transaction() as tx_conn:
+            migration.upgrade(tx_conn)
+            # user_version is part of the DB header, so it commits with the migration
+            tx_conn.execute(f"PRAGMA user_version = {int(migration.VERSION)}")
+        current = migration.VERSION
+    return current
@@ -0,0 +1,225 @@
+# models/migrations/m0001_baseline_schema.py
+"""Baseline schema.
+
+Collects every CREATE TABLE / ALTER TABLE that used to run on each launch
+(initialize_db, create_user_table, create_loan_scheme_table) or on each
+save (collateral_basic, guranteer_details, manjurinama_details). Written
+to be safe on any older database: tables are created when missing and
+missing columns are added, so installs created from the bundled DB or by
+reset_database.py end up with the same shape.
+"""
+from models.migrations.utils import ensure_table, table_columns, table_exists
+
+VERSION = 1
+DESCRIPTION = "Baseline schema"
+
+PK = ("id", "INTEGER PRIMARY KEY AUTOINCREMENT")
+
+TABLES = {
+    "member_info": [
+        PK,
+        ("date", "TEXT"),
+        ("member_number", "TEXT UNIQUE"),
+        ("member_name", "TEXT"),
+        ("address", "TEXT"),
+        ("ward_no", "TEXT"),
+        ("phone", "TEXT"),
+        ("dob_bs", "TEXT"),
+        ("citizenship_no", "TEXT"),
+        ("father_name", "TEXT"),
+        ("grandfather_name", "TEXT"),
+        ("spouse_name", "TEXT"),
+        ("spouse_phone", "TEXT"),
+        ("business_name", "TEXT"),
+        ("business_address", "TEXT"),
+        ("job_name", "TEXT"),
+        ("job_address", "TEXT"),
+        ("email", "TEXT"),
+        ("profession", "TEXT"),
+        ("facebook_detail", "TEXT"),
+        ("whatsapp_detail", "TEXT"),
+    ],
+    "loan_info": [
+        PK,
+        ("member_number", "TEXT"),
+        ("loan_type", "TEXT"),
+        ("interest_rate", "TEXT"),
+        ("loan_duration", "TEXT"),
+        ("repayment_duration", "TEXT"),
+        ("loan_amount", "TEXT"),
+        ("loan_amount_in_words", "TEXT"),
+        ("loan_completion_year", "TEXT"),
+        ("loan_completion_month", "TEXT"),
+        ("loan_completion_day", "TEXT"),
+        ("status", "TEXT DEFAULT 'pending'"),
+    ],
+    "collateral_basic": [
+        PK,
+        ("member_number", "TEXT"),
+        ("monthly_saving", "TEXT"),
+        ("child_saving", "TEXT"),
+        ("share_amount", "TEXT"),
+        ("total_saving", "TEXT"),
+    ],
+    "collateral_affiliations": [
+        PK,
+        ("member_number", "TEXT"),
+        ("institution", "TEXT"),
+        ("address", "TEXT"),
+        ("postition", "TEXT"),
+        ("estimated_income", "TEXT"),
+        ("remarks", "TEXT"),
+    ],
+    "collateral_properties": [
+        PK,
+        ("member_number", "TEXT"),
+        ("owner_name", "TEXT"),
+        ("father_or_spouse", "TEXT"),
+        ("grandfather_or_father_inlaw", "TEXT"),
+        ("district", "TEXT"),
+        ("municipality_vdc", "TEXT"),
+        ("sheet_no", "TEXT"),
+        ("ward_no", "TEXT"),
+        ("plot_no", "TEXT"),
+        ("area", "TEXT"),
+        ("land_type", "TEXT"),
+    ],
+    "collateral_family_details": [
+        PK,
+        ("member_number", "TEXT"),
+        ("name", "TEXT"),
+        ("age", "TEXT"),
+        ("relation", "TEXT"),
+        ("member_of_org", "TEXT"),
+        ("occupation", "TEXT"),
+        ("monthly_income", "TEXT"),
+    ],
+    "collateral_income_expense": [
+        PK,
+        ("member_number", "TEXT"),
+        ("field", "TEXT"),
+        ("amount", "TEXT"),
+        ("type", "TEXT"),
+    ],
+    "collateral_projects": [
+        PK,
+        ("member_number", "TEXT NOT NULL"),
+        ("project_name", "TEXT"),
+        ("self_investment", "TEXT"),
+        ("requested_loan_amount", "TEXT"),
+        ("total_cost", "TEXT"),
+        ("remarks", "TEXT"),
+    ],
+    "approval_info": [
+        PK,
+        ("member_number", "TEXT NOT NULL"),
+        ("approval_date", "TEXT"),
+        ("entered_by", "TEXT"),
+        ("entered_post", "TEXT"),
+        ("approved_by", "TEXT"),
+        ("approved_post", "TEXT"),
+        ("remarks", "TEXT"),
+        ("approved_loan_amount", "TEXT"),
+        ("approved_loan_amount_words", "TEXT"),
+    ],
+    "report_tracking": [
+        PK,
+        ("member_number", "TEXT NOT NULL"),
+        ("report_type", "TEXT"),
+        ("generated_by", "TEXT"),
+        ("file_path", "TEXT"),
+        ("generated_date", "TEXT"),
+    ],
+    "loan_witness": [
+        PK,
+        ("member_number", "TEXT NOT NULL"),
+        ("name", "TEXT"),
+        ("relation", "TEXT"),
+        ("address_mun", "TEXT"),
+        ("ward_no", "TEXT"),
+        ("address_tole", "TEXT"),
+        ("age", "TEXT"),
+    ],
+    "organization_profile": [
+        PK,
+        ("company_name", "TEXT NOT NULL"),
+        ("address", "TEXT"),
+        ("logo_path", "TEXT"),
+    ],
+    "manjurinama_details": [
+        PK,
+        ("member_number", "TEXT"),
+        ("person_name", "TEXT"),
+        ("grandfather_name", "TEXT"),
+        ("father_name", "TEXT"),
+        ("age", "TEXT"),
+        ("district", "TEXT"),
+        ("muncipality", "TEXT"),
+        ("wada_no", "TEXT"),
+        ("tole", "TEXT"),
+    ],
+    "guranteer_details": [
+        PK,
+        ("member_number", "TEXT"),
+        ("guarantor_member_number", "TEXT"),
+        ("guarantor_name", "TEXT"),
+        ("guarantor_address", "TEXT"),
+        ("guarantor_ward", "TEXT"),
+        ("guarantor_phone", "TEXT"),
+        ("guarantor_citizenship", "TEXT"),
+        ("guarantor_grandfather", "TEXT"),
+        ("guarantor_father", "TEXT"),
+        ("guarantor_issue_dist", "TEXT"),
+        ("guarantor_age", "TEXT"),
+    ],
+    "users": [
+        PK,
+        ("username", "TEXT UNIQUE"),
+        ("password", "TEXT"),
+        ("role", "TEXT"),
+        ("post", "TEXT"),
+        ("full_name_nepali", "TEXT"),
+        ("email", "TEXT"),
+        ("reset_code", "TEXT DEFAULT NULL"),
+    ],
+    "loan_schemes": [
+        PK,
+        ("loan_type", "TEXT UNIQUE"),
+        ("interest_rate", "REAL"),
+    ],
+}
+
+
+def upgrade(conn):
+    had_users_email = "email" in table_columns(conn, "users")
+    had_generated_date = "generated_date" in table_columns(conn, "report_tracking")
+
+    for table, columns in TABLES.items():
+        ensure_table(conn, table, columns)
+
+    # Older user tables got a placeholder email when the column was added
+    if table_exists(conn, "users") and not had_users_email:
+        conn.execute("UPDATE users SET email = 'default@example.com' WHERE email IS NULL")
+
+    # reset_database.py / the first bundled DB called this column `date`
+    if not had_generated_date and "date" in table_columns(conn, "report_tracking"):
+        conn.execute("UPDATE report_tracking SET generated_date = date WHERE generated_date IS NULL")
+
+    # initialize_db() used to create an unused `guarantor_details` table with
+    # misspelt columns next to the `guranteer_details` table the app actually
+    # reads and writes. Fold any rows it holds into the real table and drop it.
+    if table_exists(conn, "guarantor_details"):
+        conn.execute("""
+            INSERT INTO guranteer_details (
+                member_number, guarantor_member_number, guarantor_name,
+                guarantor_address, guarantor_ward, guarantor_phone,
+                guarantor_citizenship, guarantor_grandfather, guarantor_father,
+                guarantor_issue_dist, guarantor_age
+            )
+            SELECT member_number, gurantor_member_number, guarantor_name,
+                   guarantor_address, gurantor_ward, guarantor_phone,
+                   guarantor_citizenship, guarantor_grandfather, guarantor_father,
+                   guarantor_issue_dist, guarantor_age
+            FROM guarantor_details
+        """)
+        conn.execute("DROP TABLE guarantor_details")
@@ -0,0 +1,31 @@
+# models/migrations/m0002_member_number_indexes.py
+"""Indexes for the member_number lookups done by reports, approval and checks.
+
+Only member_info had an index on member_number (its UNIQUE constraint), so
+every per-member fetch on the child tables was a full table scan.
+"""
+
+VERSION = 2
+DESCRIPTION = "Index member_number on child tables"
+
+INDEXES = [
+    ("idx_loan_info_member_number", "loan_info(member_number)"),
+    ("idx_loan_info_status_member", "loan_info(status, member_number)"),
+    ("idx_approval_info_member_number", "approval_info(member_number)"),
+    ("idx_collateral_basic_member_number", "collateral_basic(member_number)"),
+    ("idx_collateral_affiliations_member_number", "collateral_affiliations(member_number)"),
+    ("idx_collateral_properties_member_number", "collateral_properties(member_number)"),
+    ("idx_collateral_family_member_number", "collateral_family_details(member_number)"),
+    ("idx_collateral_income_expense_member_number", "collateral_income_expense(member_number)"),
+    ("idx_collateral_projects_member_number", "collateral_projects(member_number)"),
+    ("idx_loan_witness_member_number", "loan_witness(member_number)"),
+    ("idx_guranteer_details_member_number", "guranteer_details(member_number)"),
+    ("idx_manjurinama_details_member_number", "manjurinama_details(member_number)"),
+    ("idx_report_tracking_member_number", "report_tracking(member_number)"),
+    ("idx_report_tracking_generated_date", "report_tracking(generated_date)"),
+]
+
+
+def upgrade(conn):
+    for name, target in INDEXES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
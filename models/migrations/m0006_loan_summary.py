@@ -0,0 +1,115 @@
+# models/migrations/m0006_loan_summary.py
+"""loan_summary: one row per loan with what the loan list and report pickers show.
+
+LoanListTab joined member_info, loan_info and approval_info on
+member_number for every load, and the LEFT JOIN to approval_info repeated
+a loan once per approval of its member. loan_summary is keyed by loan id
+and kept current by triggers on the three tables, so readers need no
+joins:
+
+  - member_id/member_name come from member_info (member_id is NULL when
+    the loan's member doesn't exist, matching the old inner joins);
+  - approved_loan_amount/approval_date come from the member's latest
+    approval_info row (approvals aren't linked to a loan, only to a
+    member), with the date's '/' normalized to '-' so it sorts and
+    range-filters with an index.
+"""
+
+VERSION = 6
+DESCRIPTION = "Trigger-maintained loan summary"
+
+LATEST_APPROVAL = """
+    SELECT {column} FROM approval_info a
+    WHERE a.member_number = {member_number}
+    ORDER BY a.id DESC LIMIT 1
+"""
+
+
+def _latest_approval(column, member_number):
+    return f"({LATEST_APPROVAL.format(column=column, member_number=member_number)})"
+
+
+def _summary_select(loan):
+    """SELECT of the loan_summary row for loan_info row `loan` (new, or l in a FROM)."""
+    return f"""
+        SELECT {loan}.id, {loan}.member_number,
+               (SELECT m.id FROM member_info m WHERE m.member_number = {loan}.member_number),
+               (SELECT m.member_name FROM member_info m WHERE m.member_number = {loan}.member_number),
+               {loan}.loan_type, {loan}.loan_amount, {loan}.status,
+               {_latest_approval("a.approved_loan_amount", f"{loan}.member_number")},
+               {_latest_approval("REPLACE(a.approval_date, '/', '-')", f"{loan}.member_number")}
+    """
+
+
+SUMMARY_COLUMNS = """
+    loan_id, member_number, member_id, member_name, loan_type, loan_amount, status,
+    approved_loan_amount, approval_date
+"""
+
+
+def _refresh_approval(member_number):
+    return f"""
+        UPDATE loan_summary SET
+            approved_loan_amount = {_latest_approval("a.approved_loan_amount", "loan_summary.member_number")},
+            approval_date = {_latest_approval("REPLACE(a.approval_date, '/', '-')", "loan_summary.member_number")}
+        WHERE member_number = {member_number};
+    """
+
+
+def _refresh_member(member_number):
+    return f"""
+        UPDATE loan_summary SET
+            member_id = (SELECT m.id FROM member_info m WHERE m.member_number = loan_summary.member_number),
+            member_name = (SELECT m.member_name FROM member_info m WHERE m.member_number = loan_summary.member_number)
+        WHERE member_number = {member_number};
+    """
+
+
+TRIGGERS = {
+    "loan_summary_loan_insert": f"AFTER INSERT ON loan_info BEGIN INSERT INTO loan_summary ({SUMMARY_COLUMNS}) {_summary_select('new')}; END",
+    "loan_summary_loan_update": f"""AFTER UPDATE ON loan_info BEGIN
+        DELETE FROM loan_summary WHERE loan_id = old.id;
+        INSERT INTO loan_summary ({SUMMARY_COLUMNS}) {_summary_select('new')};
+    END""",
+    "loan_summary_loan_delete": "AFTER DELETE ON loan_info BEGIN DELETE FROM loan_summary WHERE loan_id = old.id; END",
+    "loan_summary_member_insert": f"AFTER INSERT ON member_info BEGIN {_refresh_member('new.member_number')} END",
+    "loan_summary_member_update": f"""AFTER UPDATE OF member_number, member_name ON member_info BEGIN
+        {_refresh_member('old.member_number')}
+        {_refresh_member('new.member_number')}
+    END""",
+    "loan_summary_member_delete": f"AFTER DELETE ON member_info BEGIN {_refresh_member('old.member_number')} END",
+    "loan_summary_approval_insert": f"AFTER INSERT ON approval_info BEGIN {_refresh_approval('new.member_number')} END",
+    "loan_summary_approval_update": f"""AFTER UPDATE ON approval_info BEGIN
+        {_refresh_approval('old.member_number')}
+        {_refresh_approval('new.member_number')}
+    END""",
+    "loan_summary_approval_delete": f"AFTER DELETE ON approval_info BEGIN {_refresh_approval('old.member_number')} END",
+}
+
+INDEXES = [
+    ("idx_loan_summary_member_number", "loan_summary(member_number)"),
+    ("idx_loan_summary_approval_date", "loan_summary(approval_date)"),
+    ("idx_loan_summary_status_member", "loan_summary(status, member_number)"),
+]
+
+
+def upgrade(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS loan_summary (
+            loan_id INTEGER PRIMARY KEY,
+            member_number TEXT,
+            member_id INTEGER,
+            member_name TEXT,
+            loan_type TEXT,
+            loan_amount TEXT,
+            status TEXT,
+            approved_loan_amount TEXT,
+            approval_date TEXT
+        )
+    """)
+    for name, target in INDEXES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+    for name, body in TRIGGERS.items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+    conn.execute("DELETE FROM loan_summary")
+    conn.execute(f"INSERT INTO loan_summary ({SUMMARY_COLUMNS}) {_summary_select('l')} FROM loan_info l")
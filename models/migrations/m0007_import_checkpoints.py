@@ -0,0 +1,27 @@
+# models/migrations/m0007_import_checkpoints.py
+"""import_checkpoints: how far a resumable member import got through a file.
+
+services.member_import commits a resumable import one chunk at a time and
+upserts the file's row here in the same transaction, so after a cancel or
+a crash the committed members and the checkpoint always agree. Re-running
+the same file (matched by content hash, not path) skips the rows up to
+last_row; the row is deleted once the file has been imported to the end.
+"""
+
+VERSION = 7
+DESCRIPTION = "Resumable import checkpoints"
+
+
+def upgrade(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS import_checkpoints (
+            file_key TEXT PRIMARY KEY,
+            file_name TEXT,
+            last_row INTEGER NOT NULL,
+            rows_read INTEGER NOT NULL DEFAULT 0,
+            inserted INTEGER NOT NULL DEFAULT 0,
+            skipped INTEGER NOT NULL DEFAULT 0,
+            duplicates INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        ) WITHOUT ROWID
+    """)
@@ -0,0 +1,65 @@
+# models/migrations/m0008_loan_summary_pending.py
+"""loan_summary: a pending loan carries no approval.
+
+Migration 0006 gave every loan its member's latest approval_info row, so a
+member's pending second loan showed the first loan's approval date and
+amount. approval_info still isn't linked to a loan, only to a member, so
+the rule is now: a loan that is still pending has no approval; any other
+loan carries its member's latest approval. The loan and approval triggers
+are replaced and the table backfilled again; the member triggers from
+0006 are unchanged.
+"""
+from models.migrations.m0006_loan_summary import LATEST_APPROVAL, SUMMARY_COLUMNS
+
+VERSION = 8
+DESCRIPTION = "No approval on pending loans in loan_summary"
+
+
+def _approval(column, loan):
+    """The latest approval's `column` for loan row `loan`, or NULL while the loan is pending."""
+    latest = LATEST_APPROVAL.format(column=column, member_number=f"{loan}.member_number")
+    return f"CASE WHEN {loan}.status = 'pending' THEN NULL ELSE ({latest}) END"
+
+
+def _summary_select(loan):
+    """SELECT of the loan_summary row for loan_info row `loan` (new, or l in a FROM)."""
+    return f"""
+        SELECT {loan}.id, {loan}.member_number,
+               (SELECT m.id FROM member_info m WHERE m.member_number = {loan}.member_number),
+               (SELECT m.member_name FROM member_info m WHERE m.member_number = {loan}.member_number),
+               {loan}.loan_type, {loan}.loan_amount, {loan}.status,
+               {_approval("a.approved_loan_amount", loan)},
+               {_approval("REPLACE(a.approval_date, '/', '-')", loan)}
+    """
+
+
+def _refresh_approval(member_number):
+    return f"""
+        UPDATE loan_summary SET
+            approved_loan_amount = {_approval("a.approved_loan_amount", "loan_summary")},
+            approval_date = {_approval("REPLACE(a.approval_date, '/', '-')", "loan_summary")}
+        WHERE member_number = {member_number};
+    """
+
+
+TRIGGERS = {
+    "loan_summary_loan_insert": f"AFTER INSERT ON loan_info BEGIN INSERT INTO loan_summary ({SUMMARY_COLUMNS}) {_summary_select('new')}; END",
+    "loan_summary_loan_update": f"""AFTER UPDATE ON loan_info BEGIN
+        DELETE FROM loan_summary WHERE loan_id = old.id;
+        INSERT INTO loan_summary ({SUMMARY_COLUMNS}) {_summary_select('new')};
+    END""",
+    "loan_summary_approval_insert": f"AFTER INSERT ON approval_info BEGIN {_refresh_approval('new.member_number')} END",
+    "loan_summary_approval_update": f"""AFTER UPDATE ON approval_info BEGIN
+        {_refresh_approval('old.member_number')}
+        {_refresh_approval('new.member_number')}
+    END""",
+    "loan_summary_approval_delete": f"AFTER DELETE ON approval_info BEGIN {_refresh_approval('old.member_number')} END",
+}
+
+
+def upgrade(conn):
+    for name, body in TRIGGERS.items():
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        conn.execute(f"CREATE TRIGGER {name} {body}")
+    conn.execute("DELETE FROM loan_summary")
+    conn.execute(f"INSERT INTO loan_summary ({SUMMARY_COLUMNS}) {_summary_select('l')} FROM loan_info l")
@@ -0,0 +1,32 @@
+# models/migrations/m0009_member_insert_counter.py
+"""Count member_info inserts and renumbers that change what loan views show.
+
+Migration 0005 left member inserts out so bulk member imports wouldn't
+wake the loan views, but a loan can be entered before its member: adding
+that member fills in the member name the views show (and renumbering a
+member moves its loans to the new number), and the counter didn't move.
+These triggers bump member_info's counter only when the member has loans,
+so importing members without loans still doesn't.
+"""
+
+VERSION = 9
+DESCRIPTION = "Count member inserts that loan views show"
+
+LOANS_OF = "EXISTS (SELECT 1 FROM loan_info l WHERE l.member_number = {member_number})"
+
+TRIGGERS = {
+    "member_info_changes_insert": f"AFTER INSERT ON member_info WHEN {LOANS_OF.format(member_number='new.member_number')}",
+    "member_info_changes_renumber": (
+        f"AFTER UPDATE OF member_number ON member_info WHEN "
+        f"{LOANS_OF.format(member_number='old.member_number')} OR {LOANS_OF.format(member_number='new.member_number')}"
+    ),
+}
+
+
+def upgrade(conn):
+    for name, event in TRIGGERS.items():
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN
+                UPDATE change_counters SET version = version + 1 WHERE table_name = 'member_info';
+            END
+        """)
@@ -0,0 +1,33 @@
+# models/migrations/utils.py
+"""Small helpers shared by the migration files."""
+
+
+def table_exists(conn, table):
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def table_columns(conn, table):
+    """Return the column names of a table (empty list if it doesn't exist)."""
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def ensure_table(conn, table, columns):
+    """Create `table` with `columns`, or add whichever columns are missing.
+
+    `columns` is a list of (name, declaration) pairs. SQLite has no
+    ADD COLUMN IF NOT EXISTS, so existing columns are checked first.
+    """
+    existing = table_columns(conn, table)
+    if not existing:
+        column_sql = ",\n    ".join(f"{name} {decl}" for name, decl in columns)
+        conn.execute(f"CREATE TABLE {table} (\n    {column_sql}\n)")
+        return
+
+    for name, decl in columns:
+        if name not in existing:
+            # ALTER TABLE cannot add PRIMARY KEY / UNIQUE columns
+            decl = decl.replace("UNIQUE", "").replace("NOT NULL", "")
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
@@ -1,5 +1,5 @@
 
-from models.database import get_connection
+from models.database import get_connection, transaction
 import logging
 import nepali_datetime
 import sqlite3
@@ -32,6 +32,31 @@ def save_report_log(data):
     finally:
         conn.close()
 
+def save_report_logs(rows):
+    """Insert many report log entries in a single transaction.
+
+    Each row is a dict like save_report_log() takes; an optional
+    "generated_date" keeps the time the document was actually produced.
+    """
+    if not rows:
+        return 0
+    now = nepali_datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    params = [
+        (row["member_number"], row["report_type"], row["file_path"], row["generated_by"], row.get("generated_date") or now)
+        for row in rows
+    ]
+    try:
+        with transaction() as conn:
+            conn.executemany(f"""
+                INSERT INTO {TABLE_NAME} (member_number, report_type, file_path, generated_by, generated_date)
+                VALUES (?, ?, ?, ?, ?)
+            """, params)
+        logging.debug(f"Saved {len(params)} report logs")
+        return len(params)
+    except sqlite3.Error as e:
+        logging.error(f"Error saving report logs: {e}")
+        raise
+
 def fetch_all_report_logs(date_filter=None):
     conn = get_connection()
     cursor = conn.cursor()
@@ -40,9 +65,9 @@ def fetch_all_report_logs(date_filter=None):
             cursor.execute(f"""
                 SELECT member_number, report_type, file_path, generated_by, generated_date
                 FROM {TABLE_NAME}
-                WHERE date(generated_date) = ?
+                WHERE generated_date >= ? AND generated_date < ?
                 ORDER BY generated_date DESC
-            """, (date_filter,))
+            """, (date_filter, f"{date_filter}~"))  # '~' sorts after any time suffix; keeps the index usable
         else:
             cursor.execute(f"""
                 SELECT member_number, report_type, file_path, generated_by, generated_date
@@ -1,7 +1,7 @@
 
 import sqlite3
 from hashlib import sha256
-from models.database import get_connection
+from models.database import get_connection, initialize_db
 import random
 import string
 import smtplib
@@ -11,21 +11,8 @@ import logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def create_user_table():
-    conn = get_connection()
-    cur = conn.cursor()
-    # Check if table exists and add columns if missing
-    cur.execute("PRAGMA table_info(users)")
-    columns = {row[1] for row in cur.fetchall()}  # Set of column names
-    if 'email' not in columns:
-        cur.execute("ALTER TABLE users ADD COLUMN email TEXT")
-        logging.info("Added 'email' column to users table")
-        # Set a default email for existing users to avoid NULL issues
-        cur.execute("UPDATE users SET email = 'default@example.com' WHERE email IS NULL")
-    if 'reset_code' not in columns:
-        cur.execute("ALTER TABLE users ADD COLUMN reset_code TEXT DEFAULT NULL")
-        logging.info("Added 'reset_code' column to users table")
-    conn.commit()
-    conn.close()
+    """Ensure the users table is current (schema lives in models/migrations)."""
+    initialize_db()
 
 def hash_password(password):
     return sha256(password.encode()).hexdigest()
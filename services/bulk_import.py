@@ -0,0 +1,277 @@
+# services/bulk_import.py
+"""Bulk import of loans, collateral, guarantors and approvals from Excel.
+
+Each importable table has a spec in TABLE_SPECS: the sheet it is read
+from, the columns that must be filled, member_validation rules for the
+rest, defaults, lowercased columns, and amount-in-words columns filled
+from an amount when left blank. The columns themselves come from the
+table (PRAGMA table_info), as for the member template.
+
+A workbook holds one sheet per table, and tables are loaded in
+IMPORT_ORDER, so approvals are checked against the loans just imported.
+Per table:
+
+  1. the sheet is streamed, normalized and validated a chunk at a time
+     and executemany'd into a temp staging table;
+  2. one INSERT ... SELECT joins the staging table to member_info (and
+     loan_info when the spec requires a loan), resolving every
+     member_number reference set-based; rows that don't resolve are
+     reported, a row repeated within the sheet is imported once, and
+     rows identical to one already in the table are skipped, so fixing a
+     sheet and importing the file again only adds what's missing;
+  3. all of it is one transaction, so a failed or cancelled table leaves
+     nothing behind while the tables before it stay imported.
+"""
+import logging
+import time
+
+import pandas as pd
+
+from models.database import transaction
+from services.member_import import (
+    DEFAULT_CHUNK_SIZE, ImportCancelled, chunk_records, chunked, find_header, new_stats,
+    read_rows, record_cell_errors, record_error, update_throughput,
+)
+from services.member_validation import RULE_TYPES, validate_frame
+from utils.amount_to_words import convert_number_to_nepali_words
+from utils.search_keys import DEVANAGARI_DIGITS
+
+TABLE_SPECS = {
+    "loan_info": {
+        "sheet": "Loans",
+        "required": ("member_number", "loan_type", "loan_amount"),
+        "checks": {"loan_amount": "amount"},
+        "defaults": {"status": "pending"},
+        "lowercase": ("status",),
+        "words": {"loan_amount_in_words": "loan_amount"},
+    },
+    "collateral_properties": {
+        "sheet": "Collateral Properties",
+        "required": ("member_number", "owner_name"),
+        "checks": {"ward_no": "ward"},
+    },
+    "collateral_family_details": {
+        "sheet": "Family Details",
+        "required": ("member_number", "name", "relation"),
+        "checks": {"monthly_income": "amount"},
+    },
+    "guranteer_details": {
+        "sheet": "Guarantors",
+        "required": ("member_number", "guarantor_name"),
+        "checks": {"guarantor_ward": "ward", "guarantor_phone": "phone"},
+        "number_columns": ("member_number", "guarantor_member_number"),
+    },
+    "approval_info": {
+        "sheet": "Approvals",
+        "required": ("member_number", "approval_date", "approved_loan_amount"),
+        "checks": {"approval_date": "bs_date", "approved_loan_amount": "amount"},
+        "words": {"approved_loan_amount_words": "approved_loan_amount"},
+        # An approval is for a loan, so the member must have one
+        "requires": "loan_info",
+    },
+}
+# Tables another spec "requires" come first
+IMPORT_ORDER = [
+    "loan_info", "collateral_properties", "collateral_family_details", "guranteer_details", "approval_info",
+]
+
+STAGING_TABLE = "temp.bulk_import_staging"
+DUPLICATE_ROW = "Duplicate of an earlier row in the sheet"
+
+
+def table_columns(conn, table):
+    """Columns of `table` an import may fill (id is automatic)."""
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})") if row[1] != "id"]
+
+
+def column_type(table, column):
+    """Template description of a column: its rule's type, required, default or derived."""
+    spec = TABLE_SPECS[table]
+    text = RULE_TYPES.get(spec.get("checks", {}).get(column), "Text")
+    if column in spec.get("number_columns", ("member_number",)):
+        text = "Member Number (existing member)" if column == "member_number" else "Member Number"
+    if column in spec["required"]:
+        text += " (Required)"
+    elif column in spec.get("defaults", {}):
+        text += f" (default {spec['defaults'][column]})"
+    elif column in spec.get("words", {}):
+        text += f" (blank: from {spec['words'][column]})"
+    return text
+
+
+def sheet_names(path):
+    if str(path).lower().endswith(".xls"):
+        return pd.ExcelFile(path).sheet_names
+    import openpyxl
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+def amount_in_words(amount):
+    """Nepali words for an amount cell (Nepali or ASCII digits, commas); None if not a number."""
+    try:
+        return convert_number_to_nepali_words(int(float(str(amount).translate(DEVANAGARI_DIGITS).replace(",", ""))))
+    except (TypeError, ValueError):
+        return None
+
+
+def _complete(records, spec):
+    """Fill defaults and amount-in-words columns the sheet left blank."""
+    for record in records:
+        for column, value in spec.get("defaults", {}).items():
+            record[column] = record.get(column) or value
+        for column in spec.get("lowercase", ()):
+            if record.get(column):
+                record[column] = record[column].lower()
+        for column, source in spec.get("words", {}).items():
+            if not record.get(column) and record.get(source):
+                record[column] = amount_in_words(record[source])
+
+
+def _drop_duplicates(conn, columns, stats):
+    """Keep the first staged copy of each repeated row; report the others as duplicates."""
+    later_copies = f"""
+        row_number NOT IN (SELECT MIN(row_number) FROM {STAGING_TABLE} GROUP BY {", ".join(columns)})
+    """
+    for (row_number,) in conn.execute(
+        f"SELECT row_number FROM {STAGING_TABLE} WHERE {later_copies} ORDER BY row_number"
+    ).fetchall():
+        stats["duplicates"] += 1
+        record_error(stats, row_number, DUPLICATE_ROW)
+    conn.execute(f"DELETE FROM {STAGING_TABLE} WHERE {later_copies}")
+
+
+def _unresolved(conn, spec, stats):
+    """Report staged rows whose member (or, if required, member's loan) doesn't exist."""
+    for row_number, member_number in conn.execute(f"""
+        SELECT s.row_number, s.member_number FROM {STAGING_TABLE} s
+        WHERE NOT EXISTS (SELECT 1 FROM member_info m WHERE m.member_number = s.member_number)
+        ORDER BY s.row_number
+    """):
+        stats["unresolved"] += 1
+        record_error(stats, row_number, f"Member {member_number} not found")
+    if spec.get("requires"):
+        for row_number, member_number in conn.execute(f"""
+            SELECT s.row_number, s.member_number FROM {STAGING_TABLE} s
+            WHERE EXISTS (SELECT 1 FROM member_info m WHERE m.member_number = s.member_number)
+              AND NOT EXISTS (SELECT 1 FROM {spec['requires']} r WHERE r.member_number = s.member_number)
+            ORDER BY s.row_number
+        """):
+            stats["unresolved"] += 1
+            record_error(stats, row_number, f"Member {member_number} has no {spec['requires']} row")
+
+
+def import_table(path, table, sheet=None, chunk_size=DEFAULT_CHUNK_SIZE, on_progress=None, is_cancelled=None):
+    """Import one table's sheet (default: the spec's sheet) in one transaction.
+
+    Returns the member_import stats plus table, unresolved (rows whose
+    member_number didn't resolve) and already_present (rows identical to
+    an existing one, not inserted again); duplicates counts rows repeating
+    an earlier row of the sheet. Raises ValueError when the sheet
+    has no usable header row; cancelling between chunks rolls the table
+    back and sets cancelled.
+    """
+    spec = TABLE_SPECS[table]
+    stats = new_stats()
+    stats.update({"table": table, "unresolved": 0, "already_present": 0})
+    start = time.perf_counter()
+    rows = read_rows(path, stats, sheet=sheet or spec["sheet"])
+    try:
+        with transaction() as conn:
+            known = table_columns(conn, table)
+            mapping = find_header(rows, set(known), required=spec["required"])
+            columns = list(dict.fromkeys([*mapping.values(), *spec.get("defaults", {}), *spec.get("words", {})]))
+            conn.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+            conn.execute(f"""
+                CREATE TABLE {STAGING_TABLE} (row_number INTEGER, {", ".join(f"{c} TEXT" for c in columns)})
+            """)
+            stage_sql = (
+                f"INSERT INTO {STAGING_TABLE} (row_number, {', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in range(len(columns) + 1))})"
+            )
+            for chunk in chunked(rows, chunk_size):
+                if is_cancelled and is_cancelled():
+                    stats["cancelled"] = True
+                    raise ImportCancelled()
+                stats["last_row"] = chunk[-1][0]
+                row_numbers, records = chunk_records(chunk, mapping, spec.get("number_columns", ("member_number",)))
+                if records:
+                    stats["rows_read"] += len(records)
+                    frame = pd.DataFrame(records, index=row_numbers, columns=list(mapping.values()))
+                    bad = record_cell_errors(stats, validate_frame(frame, spec["required"], spec.get("checks")))
+                    clean = [
+                        (row_number, record)
+                        for row_number, record, is_bad in zip(row_numbers, records, bad.to_numpy())
+                        if not is_bad
+                    ]
+                    _complete([record for _, record in clean], spec)
+                    conn.executemany(stage_sql, [
+                        [row_number] + [record.get(c) for c in columns] for row_number, record in clean
+                    ])
+                if on_progress:
+                    on_progress(update_throughput(stats, start))
+
+            _drop_duplicates(conn, columns, stats)
+            _unresolved(conn, spec, stats)
+            resolves = "JOIN member_info m ON m.member_number = s.member_number"
+            if spec.get("requires"):
+                resolves += f" WHERE EXISTS (SELECT 1 FROM {spec['requires']} r WHERE r.member_number = s.member_number)"
+            else:
+                resolves += " WHERE true"
+            present = f"""
+                EXISTS (SELECT 1 FROM {table} t WHERE t.member_number = s.member_number
+                        AND {" AND ".join(f"t.{c} IS s.{c}" for c in columns)})
+            """
+            stats["already_present"] = conn.execute(
+                f"SELECT COUNT(*) FROM {STAGING_TABLE} s {resolves} AND {present}"
+            ).fetchone()[0]
+            cursor = conn.execute(f"""
+                INSERT INTO {table} ({", ".join(columns)})
+                SELECT {", ".join(f"s.{c}" for c in columns)} FROM {STAGING_TABLE} s
+                {resolves} AND NOT {present}
+                ORDER BY s.row_number
+            """)
+            stats["inserted"] = cursor.rowcount
+            stats["skipped"] += stats["already_present"]
+            conn.execute(f"DROP TABLE {STAGING_TABLE}")
+    except ImportCancelled:
+        stats.update({"inserted": 0, "already_present": 0})
+    finally:
+        rows.close()
+
+    update_throughput(stats, start)
+    logging.info(
+        f"Bulk import of {table} from {path}: {stats['inserted']} inserted, {stats['unresolved']} unresolved, "
+        f"{stats['already_present']} already present, {stats['duplicates']} repeated, "
+        f"{stats['skipped']} skipped of {stats['rows_read']} rows "
+        f"in {stats['elapsed']:.1f}s ({stats['rows_per_sec']:.0f} rows/s)"
+    )
+    return stats
+
+
+def import_tables(path, tables=None, chunk_size=DEFAULT_CHUNK_SIZE, on_progress=None, is_cancelled=None):
+    """Import every table whose sheet is in the workbook, in IMPORT_ORDER.
+
+    tables limits the import to those tables. Each table is its own
+    transaction; cancelling stops after rolling back the current one.
+    Callbacks:
+      on_progress(table, stats)   after each chunk of each table
+      is_cancelled()              checked between chunks
+
+    Returns {table: stats} for the tables attempted.
+    """
+    present = set(sheet_names(path))
+    results = {}
+    for table in IMPORT_ORDER:
+        if (tables and table not in tables) or TABLE_SPECS[table]["sheet"] not in present:
+            continue
+        results[table] = stats = import_table(
+            path, table, chunk_size=chunk_size, is_cancelled=is_cancelled,
+            on_progress=(lambda stats, table=table: on_progress(table, stats)) if on_progress else None,
+        )
+        if stats["cancelled"]:
+            break
+    return results
@@ -0,0 +1,117 @@
+# services/bulk_report_generation.py
+"""Generate report packets for many approved members in one run.
+
+Members come from fetch_loan_info_members() (approved loans, optionally
+filtered by loan type and approval date range). They are processed in
+batches: every packet in a batch is rendered, then all of the batch's
+report_tracking rows are written in one transaction. Contexts are built
+directly rather than through the interactive context cache, so a bulk run
+doesn't evict the entries the Reports tab is using.
+"""
+import logging
+import time
+
+from models.loan_model import fetch_loan_info_members
+from models.report_tracking_model import save_report_logs
+from services.prepare_report_contexts import prepare_report_context
+from services.report_generation import OUTPUT_BASE_DIR, generate_packet, plan_packet
+
+DEFAULT_BATCH_SIZE = 25
+
+
+def select_bulk_members(loan_type=None, approval_date_from=None, approval_date_to=None):
+    """Return [(member_number, member_name, loan_type), ...] for approved loans.
+
+    A member with several approved loans appears once (first loan type).
+    """
+    rows = fetch_loan_info_members(
+        status="approved",
+        loan_type=loan_type or None,
+        approval_date_from=approval_date_from or None,
+        approval_date_to=approval_date_to or None,
+    )
+    members, seen = [], set()
+    for member_number, member_name, member_loan_type, _ in rows:
+        if member_number in seen:
+            continue
+        seen.add(member_number)
+        members.append((member_number, member_name, member_loan_type))
+    return members
+
+
+def generate_bulk(members, primary_template, extra_docs, generated_by, approver=None,
+                  batch_size=DEFAULT_BATCH_SIZE, on_progress=None, is_cancelled=None,
+                  base_dir=OUTPUT_BASE_DIR, merged=False):
+    """Render a packet per member and log each batch in one transaction.
+
+    members is what select_bulk_members() returns; extra_docs is a list of
+    (doc_name, template_path) pairs as for plan_packet(); merged=True also
+    writes each member's combined packet file. Callbacks:
+      on_progress(done, total, member_number, stats)   after each member
+      is_cancelled()                                   checked between members
+
+    Returns a stats dict: members, members_done, members_failed, documents,
+    failures [(member_number, doc_name, error)], elapsed seconds,
+    documents_per_sec, members_per_sec and cancelled.
+    """
+    approver = approver or {}
+    stats = {
+        "members": len(members), "members_done": 0, "members_failed": 0,
+        "documents": 0, "failures": [], "elapsed": 0.0,
+        "documents_per_sec": 0.0, "members_per_sec": 0.0, "cancelled": False,
+    }
+    start = time.perf_counter()
+
+    for batch_start in range(0, len(members), batch_size):
+        batch = members[batch_start:batch_start + batch_size]
+        report_log = []
+        for member_number, _, loan_type in batch:
+            if is_cancelled and is_cancelled():
+                stats["cancelled"] = True
+                break
+            try:
+                context = prepare_report_context(
+                    member_number,
+                    approver.get("entered_by_name", ""),
+                    approver.get("entered_by_post", ""),
+                    approver.get("approved_by_name", ""),
+                    approver.get("approved_by_post", ""),
+                )
+                documents = plan_packet(member_number, loan_type or "", primary_template, extra_docs,
+                                        base_dir=base_dir, merged=merged)
+                result = generate_packet(
+                    member_number, documents, generated_by, approver,
+                    context=context, report_log=report_log,
+                )
+            except Exception as e:
+                logging.error(f"Bulk generation failed for {member_number}: {e}")
+                result = {"context_found": True, "generated": [], "failed": [("packet", str(e))]}
+
+            if not result["context_found"]:
+                result["failed"] = [("packet", "No data found for member")]
+            stats["documents"] += len(result["generated"])
+            stats["failures"].extend((member_number, doc_name, error) for doc_name, error in result["failed"])
+            stats["members_done"] += 1
+            stats["members_failed"] += bool(result["failed"])
+            if on_progress:
+                on_progress(stats["members_done"], stats["members"], member_number, _throughput(stats, start))
+
+        # One report_tracking transaction per batch
+        try:
+            save_report_logs(report_log)
+        except Exception as e:
+            logging.error(f"Failed to log batch starting at {batch_start}: {e}")
+            stats["failures"].append(("", "report_tracking", str(e)))
+        if stats["cancelled"]:
+            break
+
+    return _throughput(stats, start)
+
+
+def _throughput(stats, start):
+    elapsed = time.perf_counter() - start
+    stats["elapsed"] = elapsed
+    if elapsed > 0:
+        stats["documents_per_sec"] = stats["documents"] / elapsed
+        stats["members_per_sec"] = stats["members_done"] / elapsed
+    return stats
@@ -0,0 +1,504 @@
+# services/member_import.py
+"""Streaming Excel import of members into member_info.
+
+The one engine behind ExcelHandler.import_data (the generated template)
+and import_service.import_members_from_excel (legacy rosters). Rows are
+streamed from the workbook (openpyxl read_only / values_only, so the sheet
+is never held in memory), normalized and validated a chunk at a time (as
+a DataFrame, see services.member_validation), and each chunk's clean
+rows are written with executemany and keyed for search. By default
+the whole import is one transaction; a resumable import commits each chunk
+together with a checkpoint (import_checkpoints, keyed by the file's
+content hash), and re-running the same file carries on after the last
+committed chunk.
+
+upsert_members is the mode for re-importing an updated roster: the file
+is bulk-loaded into a temp staging table, and a few set-based statements
+classify its rows as new, changed or unchanged and apply them with one
+INSERT ... ON CONFLICT(member_number) DO UPDATE that only touches rows
+whose values differ.
+
+The header row is found by looking for a member_number column in the
+first rows, so both the template (headers on row 6, "Member Number") and
+plain sheets (headers on row 1, "member_number") are read. Columns that
+aren't member_info columns are ignored.
+"""
+import hashlib
+import logging
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+from nepali_datetime import date as nepali_date
+
+from models.database import get_connection, transaction
+from models.member_model import refresh_search_keys
+from services.member_index import member_index
+from services.member_validation import (
+    DUPLICATE_IN_FILE, REQUIRED_COLUMNS, describe_errors, error_rows, validate_members,
+)
+
+# Large enough that pandas' per-call overhead in validation stays small
+DEFAULT_CHUNK_SIZE = 5000
+HEADER_SCAN_ROWS = 20
+# Bound parameters per statement, under the 999 limit of SQLite before 3.32
+MAX_SQL_PARAMS = 900
+# Stop collecting row errors past this many; they are still counted
+MAX_ERRORS = 1000
+# The template's second header row describes each column ("Type: Text ...")
+TYPE_HINT_PREFIX = "Type:"
+
+
+def member_columns(conn):
+    """member_info columns an import may fill (id and date are automatic)."""
+    return [row[1] for row in conn.execute("PRAGMA table_info(member_info)") if row[1] not in ("id", "date")]
+
+
+def normalize_header(value):
+    return str(value).replace("\xa0", "").strip().lower().replace(" ", "_") if value is not None else ""
+
+
+def normalize_value(value):
+    """Cell value as stored: stripped text, integral floats without '.0', dates as YYYY-MM-DD."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y-%m-%d")
+    value = str(value).strip()
+    return value or None
+
+
+def normalize_member_number(value):
+    """Member numbers are stored zero-padded to 9 digits."""
+    value = normalize_value(value)
+    if value and value.isdigit() and len(value) < 9:
+        return value.zfill(9)
+    return value
+
+
+def read_rows(path, stats=None, sheet=None):
+    """Yield (row_number, values) for every row of a sheet (default: the first), streaming.
+
+    If stats is given, stats["total_rows"] is set to the sheet's row count
+    when the file declares one (it drives the ETA; None when unknown).
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".xls":
+        # openpyxl can't read the old binary format; pandas (with xlrd) can
+        frame = pd.read_excel(path, sheet_name=sheet or 0, header=None, dtype=object)
+        if stats is not None:
+            stats["total_rows"] = len(frame)
+        for row_number, values in enumerate(frame.itertuples(index=False, name=None), 1):
+            yield row_number, tuple(None if pd.isna(v) else v for v in values)
+        return
+
+    import openpyxl
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        if stats is not None:
+            # From the sheet's <dimension> tag; costs nothing, may be missing
+            stats["total_rows"] = worksheet.max_row
+        for row_number, values in enumerate(worksheet.iter_rows(values_only=True), 1):
+            yield row_number, values
+    finally:
+        workbook.close()
+
+
+def file_key(path):
+    """Content hash identifying a file across renames and re-selections."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+CHECKPOINT_COUNTS = ("rows_read", "inserted", "skipped", "duplicates")
+
+
+def load_checkpoint(key):
+    """The saved checkpoint dict for a file key (last_row plus counts), or None."""
+    row = get_connection().execute(
+        f"SELECT last_row, {', '.join(CHECKPOINT_COUNTS)} FROM import_checkpoints WHERE file_key = ?", (key,)
+    ).fetchone()
+    if row is None:
+        return None
+    return dict(zip(("last_row",) + CHECKPOINT_COUNTS, row))
+
+
+def _save_checkpoint(conn, key, path, stats):
+    conn.execute(
+        f"""INSERT INTO import_checkpoints (file_key, file_name, last_row, {', '.join(CHECKPOINT_COUNTS)}, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(file_key) DO UPDATE SET
+                file_name = excluded.file_name, last_row = excluded.last_row,
+                rows_read = excluded.rows_read, inserted = excluded.inserted,
+                skipped = excluded.skipped, duplicates = excluded.duplicates,
+                updated_at = excluded.updated_at""",
+        (key, Path(path).name, stats["last_row"]) + tuple(stats[c] for c in CHECKPOINT_COUNTS),
+    )
+
+
+def clear_checkpoint(key):
+    """Forget a file's checkpoint, so the next import starts from the top."""
+    with transaction() as conn:
+        conn.execute("DELETE FROM import_checkpoints WHERE file_key = ?", (key,))
+
+
+def find_header(rows, known_columns, required=REQUIRED_COLUMNS):
+    """Consume rows up to the header; return {cell index: table column}.
+
+    The header is the first row with a member_number column; every column
+    in `required` must be there.
+    """
+    for row_number, values in rows:
+        headers = [normalize_header(v) for v in values]
+        if "member_number" in headers:
+            mapping = {}
+            for index, header in enumerate(headers):
+                if header in known_columns and header not in mapping.values():
+                    mapping[index] = header
+            missing = [c for c in required if c not in mapping.values()]
+            if missing:
+                raise ValueError(f"Missing columns: {', '.join(missing)}")
+            return mapping
+        if row_number >= HEADER_SCAN_ROWS:
+            break
+    raise ValueError("Could not find valid column headers (no member_number column)")
+
+
+def new_stats():
+    return {
+        "rows_read": 0, "inserted": 0, "skipped": 0, "duplicates": 0, "errors": [], "error_count": 0,
+        "column_errors": {}, "last_row": 0, "total_rows": None, "resumed_from": 0, "resumed_rows": 0,
+        "elapsed": 0.0, "rows_per_sec": 0.0, "eta": None, "cancelled": False,
+    }
+
+
+def record_error(stats, row_number, message):
+    stats["skipped"] += 1
+    stats["error_count"] += 1
+    if len(stats["errors"]) < MAX_ERRORS:
+        stats["errors"].append((row_number, message))
+
+
+def record_cell_errors(stats, errors):
+    """Skip the rows of an error matrix that have errors; returns their mask."""
+    bad = error_rows(errors)
+    if bad.any():
+        for column, count in errors.ne("").sum().items():
+            if count:
+                stats["column_errors"][column] = stats["column_errors"].get(column, 0) + int(count)
+        for row_number, row in errors[bad].iterrows():
+            record_error(stats, row_number, describe_errors(row))
+    return bad
+
+
+def update_throughput(stats, start):
+    """Update elapsed, rows_per_sec and eta (seconds left, when the sheet size is known)."""
+    stats["elapsed"] = time.perf_counter() - start
+    if stats["elapsed"] > 0:
+        # Only rows read by this run; a resumed import starts its clock late
+        stats["rows_per_sec"] = (stats["rows_read"] - stats["resumed_rows"]) / stats["elapsed"]
+        sheet_rows_per_sec = (stats["last_row"] - stats["resumed_from"]) / stats["elapsed"]
+        if stats["total_rows"] and sheet_rows_per_sec > 0:
+            stats["eta"] = max(stats["total_rows"] - stats["last_row"], 0) / sheet_rows_per_sec
+    return stats
+
+
+def chunked(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def chunk_records(chunk, mapping, number_columns=("member_number",)):
+    """Normalize a chunk of (row_number, values) into (row_numbers, records).
+
+    record maps table columns to values; number_columns hold member
+    numbers and are zero-padded. Blank rows and the template's type-hint
+    row are dropped.
+    """
+    row_numbers, records = [], []
+    for row_number, values in chunk:
+        if not values or all(v is None or str(v).strip() == "" for v in values):
+            continue
+        record = {}
+        for index, column in mapping.items():
+            value = values[index] if index < len(values) else None
+            record[column] = normalize_member_number(value) if column in number_columns else normalize_value(value)
+        if str(record["member_number"] or "").startswith(TYPE_HINT_PREFIX):
+            continue
+        row_numbers.append(row_number)
+        records.append(record)
+    return row_numbers, records
+
+
+def validate_chunk(chunk, mapping, seen, stats):
+    """Normalize a chunk of (row_number, values); return {member_number: (row_number, record)}.
+
+    record maps member_info columns to values. Blank rows and the
+    template's type-hint row are dropped silently; the rest are checked
+    together by member_validation.validate_members, and rows with any bad
+    cell (missing required field, bad phone/ward/date, member number
+    repeated earlier in the file) are skipped with an error naming the
+    cells. stats["column_errors"] counts bad cells per column.
+    """
+    stats["last_row"] = chunk[-1][0]
+    row_numbers, records = chunk_records(chunk, mapping)
+    if not records:
+        return {}
+
+    stats["rows_read"] += len(records)
+    frame = pd.DataFrame(records, index=row_numbers, columns=list(mapping.values()))
+    errors = validate_members(frame, seen)
+    seen.update(frame["member_number"].dropna())
+    bad = record_cell_errors(stats, errors)
+    stats["duplicates"] += int((errors["member_number"] == DUPLICATE_IN_FILE).sum())
+    return {
+        record["member_number"]: (row_number, record)
+        for row_number, record, is_bad in zip(row_numbers, records, bad.to_numpy())
+        if not is_bad
+    }
+
+
+def _existing_numbers(conn, numbers):
+    existing = set()
+    # A chunk has more numbers than older SQLite builds allow parameters (999)
+    for batch in chunked(numbers, MAX_SQL_PARAMS):
+        placeholders = ", ".join("?" for _ in batch)
+        existing.update(
+            row[0] for row in conn.execute(
+                f"SELECT member_number FROM member_info WHERE member_number IN ({placeholders})", batch
+            )
+        )
+    return existing
+
+
+def _write_chunk(conn, sql, columns, today, valid, stats):
+    """Insert a validated chunk, skipping member numbers already in the database."""
+    if not valid:
+        return
+    for number in _existing_numbers(conn, list(valid)):
+        row_number, _ = valid.pop(number)
+        stats["duplicates"] += 1
+        record_error(stats, row_number, "Duplicate member number")
+    cursor = conn.executemany(sql, [
+        [today] + [record[c] for c in columns[1:]] for _, record in valid.values()
+    ])
+    stats["inserted"] += cursor.rowcount
+    # Key each chunk as it lands, so memory doesn't grow with the file
+    refresh_search_keys(conn)
+
+
+class ImportCancelled(Exception):
+    """Raised inside an import transaction to roll it back."""
+
+
+def import_members(path, chunk_size=DEFAULT_CHUNK_SIZE, on_progress=None, is_cancelled=None,
+                   resumable=False):
+    """Import members from an .xlsx (or .xls) file.
+
+    Existing member numbers are left untouched and reported as duplicates.
+    By default the import is one transaction. With resumable=True each
+    chunk commits with a checkpoint: a cancelled or interrupted import
+    keeps what it committed, and importing the same file again resumes
+    after the last committed row (counts carry over; errors listed are
+    this run's).
+    Callbacks:
+      on_progress(stats)   after each chunk
+      is_cancelled()       checked between chunks; cancelling rolls back
+                           (resumable: stops after the committed chunk)
+
+    Returns a stats dict: rows_read, inserted, skipped, duplicates, errors
+    [(row_number, message)] (first MAX_ERRORS), error_count, last_row and
+    total_rows (sheet rows; total None when the file doesn't say),
+    resumed_from (sheet row the run started after), elapsed seconds,
+    rows_per_sec, eta (seconds, or None) and cancelled. Raises ValueError
+    when the sheet has no usable header row.
+    """
+    stats = new_stats()
+    start = time.perf_counter()
+    key = file_key(path) if resumable else None
+    checkpoint = load_checkpoint(key) if resumable else None
+    if checkpoint:
+        stats.update({c: checkpoint[c] for c in CHECKPOINT_COUNTS})
+        stats["resumed_from"] = checkpoint["last_row"]
+        stats["resumed_rows"] = checkpoint["rows_read"]
+
+    today = nepali_date.today().strftime("%Y-%m-%d")
+    source = read_rows(path, stats)
+    rows = source
+    try:
+        mapping = find_header(rows, set(member_columns(get_connection())))
+        columns = ["date"] + list(mapping.values())
+        sql = (
+            f"INSERT OR IGNORE INTO member_info ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        seen = set()
+        if stats["resumed_from"]:
+            rows = (row for row in rows if row[0] > stats["resumed_from"])
+            stats["last_row"] = stats["resumed_from"]
+        chunks = chunked(rows, chunk_size)
+
+        if resumable:
+            for chunk in chunks:
+                if is_cancelled and is_cancelled():
+                    stats["cancelled"] = True
+                    break
+                with transaction() as conn:
+                    _write_chunk(conn, sql, columns, today, validate_chunk(chunk, mapping, seen, stats), stats)
+                    _save_checkpoint(conn, key, path, stats)
+                if on_progress:
+                    on_progress(update_throughput(stats, start))
+            if not stats["cancelled"]:
+                clear_checkpoint(key)
+        else:
+            try:
+                with transaction() as conn:
+                    for chunk in chunks:
+                        if is_cancelled and is_cancelled():
+                            stats["cancelled"] = True
+                            raise ImportCancelled()
+                        _write_chunk(conn, sql, columns, today, validate_chunk(chunk, mapping, seen, stats), stats)
+                        if on_progress:
+                            on_progress(update_throughput(stats, start))
+            except ImportCancelled:
+                stats["inserted"] = 0
+    finally:
+        source.close()
+
+    if stats["inserted"]:
+        member_index.refresh()
+    update_throughput(stats, start)
+    logging.info(
+        f"Member import from {path}: {stats['inserted']} inserted, {stats['skipped']} skipped "
+        f"of {stats['rows_read']} rows in {stats['elapsed']:.1f}s ({stats['rows_per_sec']:.0f} rows/s)"
+        + (f", resumed after row {stats['resumed_from']}" if stats["resumed_from"] else "")
+        + (", cancelled" if stats["cancelled"] else "")
+    )
+    return stats
+
+
+STAGING_TABLE = "temp.member_import_staging"
+
+
+def _staged_changes(conn, compared):
+    """(member_number, column, old, new) for each staged value that differs from member_info."""
+    if not compared:
+        return []
+    differs = " OR ".join(f"(s.{c} IS NOT NULL AND s.{c} IS NOT m.{c})" for c in compared)
+    pairs = ", ".join(f"s.{c}, m.{c}" for c in compared)
+    changes = []
+    for row in conn.execute(f"""
+        SELECT s.member_number, {pairs}
+        FROM {STAGING_TABLE} s JOIN member_info m ON m.member_number = s.member_number
+        WHERE {differs}
+        ORDER BY s.row_number
+    """):
+        for i, column in enumerate(compared):
+            new, old = row[1 + 2 * i], row[2 + 2 * i]
+            if new is not None and new != old:
+                changes.append((row[0], column, old, new))
+    return changes
+
+
+def upsert_members(path, chunk_size=DEFAULT_CHUNK_SIZE, on_progress=None, is_cancelled=None):
+    """Insert new members and update changed ones from an .xlsx (or .xls) file.
+
+    Rows are validated as in import_members and staged a chunk at a time;
+    cancelling while staging rolls everything back. The staged rows are
+    then applied in the same transaction: new member numbers are inserted,
+    existing members are updated only where a non-blank cell differs from
+    the stored value (a blank cell never clears a field), and the rest are
+    left alone. Running the same file twice changes nothing the second
+    time, so an interrupted upsert is simply run again.
+
+    Returns the import_members stats plus changed and unchanged counts,
+    changes [(member_number, column, old, new)] and inserted_members
+    [(member_number, member_name)] for the diff report; duplicates counts
+    in-file repeats only.
+    """
+    stats = new_stats()
+    stats.update({"changed": 0, "unchanged": 0, "changes": [], "inserted_members": []})
+    start = time.perf_counter()
+    today = nepali_date.today().strftime("%Y-%m-%d")
+    rows = read_rows(path, stats)
+    try:
+        with transaction() as conn:
+            mapping = find_header(rows, set(member_columns(conn)))
+            columns = list(mapping.values())
+            compared = [c for c in columns if c != "member_number"]
+            conn.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+            conn.execute(f"""
+                CREATE TABLE {STAGING_TABLE} (
+                    row_number INTEGER,
+                    member_number TEXT PRIMARY KEY,
+                    {", ".join(f"{c} TEXT" for c in compared)}
+                )
+            """)
+            stage_sql = (
+                f"INSERT INTO {STAGING_TABLE} (row_number, {', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in range(len(columns) + 1))})"
+            )
+            seen = set()
+            for chunk in chunked(rows, chunk_size):
+                if is_cancelled and is_cancelled():
+                    stats["cancelled"] = True
+                    raise ImportCancelled()
+                valid = validate_chunk(chunk, mapping, seen, stats)
+                conn.executemany(stage_sql, [
+                    [row_number] + [record[c] for c in columns] for row_number, record in valid.values()
+                ])
+                if on_progress:
+                    on_progress(update_throughput(stats, start))
+
+            staged = conn.execute(f"SELECT COUNT(*) FROM {STAGING_TABLE}").fetchone()[0]
+            stats["inserted_members"] = conn.execute(f"""
+                SELECT s.member_number, s.member_name FROM {STAGING_TABLE} s
+                WHERE NOT EXISTS (SELECT 1 FROM member_info m WHERE m.member_number = s.member_number)
+                ORDER BY s.row_number
+            """).fetchall()
+            stats["changes"] = _staged_changes(conn, compared)
+            stats["inserted"] = len(stats["inserted_members"])
+            stats["changed"] = len({change[0] for change in stats["changes"]})
+            stats["unchanged"] = staged - stats["inserted"] - stats["changed"]
+
+            update = ", ".join(f"{c} = COALESCE(excluded.{c}, member_info.{c})" for c in compared)
+            differs = " OR ".join(
+                f"(excluded.{c} IS NOT NULL AND excluded.{c} IS NOT member_info.{c})" for c in compared
+            )
+            # "WHERE true" keeps SQLite from reading ON CONFLICT as a join constraint
+            conn.execute(
+                f"""INSERT INTO member_info (date, {', '.join(columns)})
+                    SELECT ?, {', '.join(columns)} FROM {STAGING_TABLE} WHERE true
+                    ON CONFLICT(member_number) DO """
+                + (f"UPDATE SET {update} WHERE {differs}" if compared else "NOTHING"),
+                (today,),
+            )
+            conn.execute(f"DROP TABLE {STAGING_TABLE}")
+            refresh_search_keys(conn)
+    except ImportCancelled:
+        stats.update({"inserted": 0, "changed": 0, "unchanged": 0, "changes": [], "inserted_members": []})
+    finally:
+        rows.close()
+
+    if stats["inserted"] or stats["changed"]:
+        member_index.refresh()
+    update_throughput(stats, start)
+    logging.info(
+        f"Member upsert from {path}: {stats['inserted']} inserted, {stats['changed']} changed, "
+        f"{stats['unchanged']} unchanged, {stats['skipped']} skipped of {stats['rows_read']} rows "
+        f"in {stats['elapsed']:.1f}s ({stats['rows_per_sec']:.0f} rows/s)"
+    )
+    return stats
@@ -0,0 +1,267 @@
+# services/member_index.py
+"""In-memory member index for search-as-you-type completers.
+
+Holds every member's number and name in sorted arrays so a keystroke is a
+few bisects, with no database round-trip:
+
+  - name words, normalized with utils.search_keys (so Devanagari,
+    romanized and Nepali-digit input all match), as a sorted list of
+    unique tokens with an array of member slots per token;
+  - member numbers as stored and without leading zeros, as sorted lists
+    with parallel slot arrays.
+
+It is loaded once at login (load()) and kept current by the member_model
+save/delete functions (upsert()/remove()); imports that bypass them call
+refresh() on their worker thread, which rebuilds the index there and swaps
+it in, so the GUI thread keeps searching the old one meanwhile. No Qt
+dependency.
+"""
+import heapq
+import sys
+import threading
+from array import array
+from bisect import bisect_left, insort
+
+from models.database import get_connection
+from utils.search_keys import DEVANAGARI_DIGITS, search_key
+
+SEARCH_LIMIT = 20
+_PREFIX_END = "\U0010ffff"
+
+
+class MemberIndex:
+    """Prefix index over member names and numbers."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._replay = None         # upserts/removes made while load() builds a new index
+        self._reset()
+
+    def _reset(self):
+        self.loaded = False
+        self._members = []          # slot -> (member_number, member_name, first name token) or None once removed
+        self._ordered = 0           # slots below this are in (member_name, member_number) order
+        self._slot_of = {}          # member_number -> slot
+        self._tokens = []           # sorted unique name tokens
+        self._postings = {}         # token -> array of slots
+        self._numbers = []          # sorted member numbers
+        self._number_slots = array("I")
+        self._short_numbers = []    # sorted member numbers without leading zeros
+        self._short_slots = array("I")
+
+    def load(self, rows=None):
+        """(Re)build the index from member_info, or from (member_number, member_name) rows.
+
+        The new index is built without holding the lock and swapped in at the
+        end; upserts and removes made meanwhile are applied to it again.
+        """
+        with self._lock:
+            self._replay = []
+        if rows is None:
+            conn = get_connection()
+            try:
+                rows = conn.execute("SELECT member_number, member_name FROM member_info").fetchall()
+            except Exception:
+                with self._lock:
+                    self._replay = None
+                raise
+            finally:
+                conn.close()
+
+        # Slots are handed out in name order, so a search can return the
+        # first matches in slot order instead of sorting all of them
+        rows = sorted(
+            ((member_number or "").strip(), member_name or "") for member_number, member_name in rows
+        )
+        rows.sort(key=lambda row: row[1])  # stable: by name, then number
+        members, slot_of, postings, numbers, shorts = [], {}, {}, [], []
+        for member_number, member_name in rows:
+            if not member_number or member_number in slot_of:
+                continue
+            slot = len(members)
+            tokens = self._name_tokens(member_name)
+            members.append((member_number, member_name or "", tokens[0] if tokens else ""))
+            slot_of[member_number] = slot
+            for token in set(tokens):
+                postings.setdefault(token, array("I")).append(slot)
+            numbers.append((member_number, slot))
+            shorts.append((member_number.lstrip("0"), slot))
+        numbers.sort()
+        shorts.sort()
+
+        with self._lock:
+            self._reset()
+            self._members = members
+            self._ordered = len(members)
+            self._slot_of = slot_of
+            self._postings = postings
+            self._tokens = sorted(postings)
+            self._numbers = [n for n, _ in numbers]
+            self._number_slots = array("I", (s for _, s in numbers))
+            self._short_numbers = [n for n, _ in shorts]
+            self._short_slots = array("I", (s for _, s in shorts))
+            self.loaded = True
+            replay, self._replay = self._replay or [], None
+            for edit, args in replay:
+                edit(*args)
+            return len(self._slot_of)
+
+    def refresh(self):
+        """Rebuild a loaded index from the database on the calling thread.
+
+        For imports, which run in a worker: searches use the old index until
+        the new one is ready. An index that isn't loaded yet is left for the
+        next search to load.
+        """
+        if self.loaded:
+            self.load()
+
+    def invalidate(self):
+        """Drop the index; the next search reloads it from the database."""
+        with self._lock:
+            self._reset()
+
+    @staticmethod
+    def _name_tokens(member_name):
+        # Interned, so a name shared by thousands of members is stored once
+        return [sys.intern(token) for token in search_key(member_name).split()]
+
+    def upsert(self, member_number, member_name):
+        """Add a member, or update its name. A no-op until the index is loaded."""
+        member_number = str(member_number or "").strip()
+        if not member_number:
+            return
+        with self._lock:
+            if self._replay is not None:
+                self._replay.append((self._upsert, (member_number, member_name)))
+            if self.loaded:
+                self._upsert(member_number, member_name)
+
+    def _upsert(self, member_number, member_name):
+        self._remove(member_number)
+        slot = len(self._members)
+        tokens = self._name_tokens(member_name)
+        self._members.append((member_number, member_name or "", tokens[0] if tokens else ""))
+        self._slot_of[member_number] = slot
+        for token in set(tokens):
+            if token not in self._postings:
+                self._postings[token] = array("I")
+                insort(self._tokens, token)
+            self._postings[token].append(slot)
+        self._insert_number(self._numbers, self._number_slots, member_number, slot)
+        self._insert_number(self._short_numbers, self._short_slots, member_number.lstrip("0"), slot)
+
+    def remove(self, member_number):
+        member_number = str(member_number or "").strip()
+        with self._lock:
+            if self._replay is not None:
+                self._replay.append((self._remove, (member_number,)))
+            if self.loaded:
+                self._remove(member_number)
+
+    def _remove(self, member_number):
+        slot = self._slot_of.pop(member_number, None)
+        if slot is None:
+            return
+        member_name = self._members[slot][1]
+        self._members[slot] = None
+        for token in set(self._name_tokens(member_name)):
+            slots = self._postings.get(token)
+            if slots is None:
+                continue
+            del slots[bisect_left(slots, slot)]  # postings are in slot order
+            if not slots:
+                del self._postings[token]
+                del self._tokens[bisect_left(self._tokens, token)]
+        self._delete_number(self._numbers, self._number_slots, member_number, slot)
+        self._delete_number(self._short_numbers, self._short_slots, member_number.lstrip("0"), slot)
+
+    @staticmethod
+    def _insert_number(keys, slots, key, slot):
+        position = bisect_left(keys, key)
+        keys.insert(position, key)
+        slots.insert(position, slot)
+
+    @staticmethod
+    def _delete_number(keys, slots, key, slot):
+        position = bisect_left(keys, key)
+        while position < len(keys) and keys[position] == key:
+            if slots[position] == slot:
+                del keys[position]
+                del slots[position]
+                return
+            position += 1
+
+    @staticmethod
+    def _prefix_range(keys, prefix):
+        return bisect_left(keys, prefix), bisect_left(keys, prefix + _PREFIX_END)
+
+    def _word_slots(self, word):
+        """Slots of members with a name token or number starting with word."""
+        found = set()
+        lo, hi = self._prefix_range(self._tokens, word)
+        for token in self._tokens[lo:hi]:
+            found.update(self._postings[token])
+        if word.isdigit():
+            lo, hi = self._prefix_range(self._numbers, word)
+            found.update(self._number_slots[lo:hi])
+            short = word.lstrip("0")
+            if short:
+                lo, hi = self._prefix_range(self._short_numbers, short)
+                found.update(self._short_slots[lo:hi])
+        return found
+
+    def search(self, keyword, limit=SEARCH_LIMIT):
+        """Return up to `limit` (member_number, member_name) pairs matching every typed word.
+
+        An exact member number comes first, then names whose first word
+        matches the first typed word, then the rest, each by name.
+        """
+        words = search_key(keyword).split()
+        if not words:
+            return []
+        if not self.loaded:
+            self.load()
+        with self._lock:
+            candidates = None
+            for word in sorted(words, key=len, reverse=True):  # longest word is usually the most selective
+                slots = self._word_slots(word)
+                candidates = slots if candidates is None else candidates & slots
+                if not candidates:
+                    return []
+
+            best = []
+            digits = keyword.strip().translate(DEVANAGARI_DIGITS)
+            if digits.isdigit() and len(digits) <= 9:
+                exact = self._slot_of.get(digits.zfill(9))
+                if exact in candidates:
+                    candidates.discard(exact)
+                    best.append(exact)
+
+            first = words[0]
+            slots = sorted(candidates)
+            late = bisect_left(slots, self._ordered)  # slots added since load, in no order
+            for first_matches in (True, False):
+                if len(best) >= limit:
+                    break
+                group = []
+                for slot in slots[:late]:
+                    if self._members[slot][2].startswith(first) == first_matches:
+                        group.append(slot)
+                        if len(group) >= limit:
+                            break
+                group.extend(slot for slot in slots[late:] if self._members[slot][2].startswith(first) == first_matches)
+                best.extend(heapq.nsmallest(limit - len(best), group, key=lambda slot: self._members[slot][1::-1]))
+            return [self._members[slot][:2] for slot in best[:limit]]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "members": len(self._slot_of),
+                "slots": len(self._members),
+                "tokens": len(self._tokens),
+            }
+
+
+member_index = MemberIndex()
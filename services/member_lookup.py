@@ -1,39 +1,196 @@
 # services/member_lookup.py
-from models.database import get_connection
+"""Member search for the search boxes.
 
-def fetch_member_data(keyword):
+Searches run on the normalized keys in member_search_keys (see migration
+0004 and utils.search_keys), so Devanagari, romanized and mixed-script
+queries, and Nepali or ASCII digits, all find the same members. The keys
+are searched through the member_search FTS5 index as prefix queries ranked
+by bm25 (unranked when the prefix is too short to narrow the members
+down). A keyword of digits also matches the member number with its leading
+zeros left off. Without FTS5 (no member_search index, or an SQLite that
+can't load it) the keys are searched with LIKE; other errors are raised.
+"""
+import logging
+import sqlite3
+
+from models.database import get_connection, transaction
+from models.member_model import refresh_search_keys
+from utils.search_keys import DEVANAGARI_DIGITS, search_key
+
+SEARCH_LIMIT = 20
+# Rank by bm25 only when at most this many members match; scoring every
+# match of a one-letter prefix costs more than the LIKE scan it replaces
+RANKED_MATCHES = 2000
+
+KEY_COLUMNS = ["name_key", "number_key", "family_key", "contact_key", "address_key"]
+# OperationalErrors meaning the FTS index can't be used here, so LIKE is searched instead
+FTS_UNAVAILABLE_ERRORS = ("no such module", "no such table")
+
+
+def build_match_query(keyword):
+    """Turn what the user typed into an FTS5 query: every normalized word, as a prefix.
+
+    Normalized words contain only letters and digits; quoting them keeps
+    FTS5 from reading a word like 'and' or 'near' as an operator.
+    """
+    return " ".join(f'"{word}"*' for word in search_key(keyword).split())
+
+
+def _exact_member_number(keyword):
+    """The member_number a keyword of digits could be, zero-padded like stored numbers."""
+    keyword = keyword.strip().translate(DEVANAGARI_DIGITS)
+    if keyword.isdigit() and len(keyword) <= 9:
+        return keyword.zfill(9)
+    return None
+
+
+def _refresh_stale_keys(cur):
+    """Key members written by code that didn't refresh the keys itself."""
+    cur.execute("SELECT 1 FROM member_search_keys WHERE stale = 1 LIMIT 1")
+    if cur.fetchone():
+        with transaction() as conn:
+            refresh_search_keys(conn)
+
+
+def _has_fts_index(cur):
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'member_search'")
+    return cur.fetchone() is not None
+
+
+def _search_fts(cur, match, columns, limit):
+    cur.execute(
+        "SELECT count(*) FROM (SELECT 1 FROM member_search WHERE member_search MATCH ? LIMIT ?)",
+        (match, RANKED_MATCHES + 1),
+    )
+    if cur.fetchone()[0] <= RANKED_MATCHES:
+        cur.execute(f"""
+            SELECT {columns}
+            FROM member_search s
+            JOIN member_info m ON m.id = s.rowid
+            WHERE member_search MATCH ?
+            ORDER BY s.rank, m.member_name
+            LIMIT ?
+        """, (match, limit))
+        return cur.fetchall()
+
+    # Too broad to rank (first letter or two typed): name and number hits
+    # first, then anything else, both unranked
+    rows = []
+    for query in (f"{{name_key number_key}} : ({match})", match):
+        cur.execute(f"""
+            SELECT {columns}
+            FROM member_search s
+            JOIN member_info m ON m.id = s.rowid
+            WHERE member_search MATCH ?
+            LIMIT ?
+        """, (query, limit))
+        rows.extend(row for row in cur.fetchall() if row not in rows)
+        if len(rows) >= limit >= 0:
+            break
+    return rows[:limit] if limit >= 0 else rows
+
+
+def _search_like(cur, words, columns, limit):
+    haystack = " || ' ' || ".join(f"COALESCE(k.{c}, '')" for c in KEY_COLUMNS)
+    conditions = " AND ".join(f"(' ' || {haystack}) LIKE ?" for _ in words)
+    cur.execute(f"""
+        SELECT {columns}
+        FROM member_search_keys k
+        JOIN member_info m ON m.id = k.member_id
+        WHERE {conditions}
+        ORDER BY m.member_name ASC
+        LIMIT ?
+    """, (*[f"% {word}%" for word in words], limit))
+    return cur.fetchall()
+
+
+def member_filter(cur, keyword):
+    """SQL condition on member_info m (and its parameters) for members matching keyword.
+
+    Used by the paged member queries, which order and page the matches
+    themselves. An empty keyword matches every member.
+    """
+    keyword = (keyword or "").strip()
+    words = search_key(keyword).split()
+    if not words:
+        return "1", []
+    _refresh_stale_keys(cur)
+    if _has_fts_index(cur):
+        condition = "m.id IN (SELECT rowid FROM member_search WHERE member_search MATCH ?)"
+        params = [build_match_query(keyword)]
+    else:
+        haystack = " || ' ' || ".join(f"COALESCE(k.{c}, '')" for c in KEY_COLUMNS)
+        likes = " AND ".join(f"(' ' || {haystack}) LIKE ?" for _ in words)
+        condition = f"m.id IN (SELECT k.member_id FROM member_search_keys k WHERE {likes})"
+        params = [f"% {word}%" for word in words]
+    exact = _exact_member_number(keyword)
+    if exact:
+        condition = f"({condition} OR m.member_number = ?)"
+        params.append(exact)
+    return condition, params
+
+
+def search_members(keyword, columns="m.member_number, m.member_name", limit=SEARCH_LIMIT):
+    """Return up to `limit` member_info rows (as tuples of `columns`) best matching keyword.
+
+    An exact member number match comes first, then the ranked matches on
+    the normalized keys. limit=None returns every match.
+    """
+    keyword = (keyword or "").strip()
+    words = search_key(keyword).split()
+    if not words:
+        return []
+    limit = -1 if limit is None else limit
     conn = get_connection()
     cur = conn.cursor()
+    try:
+        _refresh_stale_keys(cur)
+        rows = []
+        exact = _exact_member_number(keyword)
+        if exact:
+            cur.execute(f"SELECT {columns}, m.id FROM member_info m WHERE m.member_number = ?", (exact,))
+            rows = [row[:-1] for row in cur.fetchall()]
+        matches = None
+        if _has_fts_index(cur):
+            try:
+                matches = _search_fts(cur, build_match_query(keyword), columns, limit)
+            except sqlite3.OperationalError as e:
+                # The index exists but this SQLite can't use it (built without
+                # FTS5); anything else, like a locked database, is a real fault
+                if not str(e).startswith(FTS_UNAVAILABLE_ERRORS):
+                    raise
+                logging.warning(f"FTS member search unavailable, using LIKE: {e}")
+        if matches is None:
+            matches = _search_like(cur, words, columns, limit)
+        for row in matches:
+            if row not in rows:
+                rows.append(row)
+        return rows[:limit] if limit >= 0 else rows
+    finally:
+        conn.close()
 
-    cur.execute("""
-        SELECT * FROM member_info 
-            WHERE member_number = ? OR member_name LIKE ?
-            LIMIT 1
-    """, (keyword, f"%{keyword}%"))
-    
-    row = cur.fetchone()
-    conn.close()
 
-    if row:
-        columns = [desc[0] for desc in cur.description]
-        return dict(zip(columns, row))
-    return None
+def search_member_numbers(keyword):
+    """Member numbers of every member matching keyword, best matches first."""
+    return [(row[0] or "").strip() for row in search_members(keyword, columns="m.member_number", limit=None)]
 
-def fetch_members_matching(keyword):
+
+def fetch_member_data(keyword):
     conn = get_connection()
     cur = conn.cursor()
-    cur.execute("""
-        SELECT member_number, member_name 
-        FROM member_info
-        WHERE member_name LIKE ? OR member_number LIKE ?
-        ORDER BY member_name ASC
-        LIMIT 20
-    """, (f"%{keyword}%", f"%{keyword}%"))
-    
-    rows = cur.fetchall()
+    cur.execute("SELECT * FROM member_info WHERE member_number = ?", (keyword,))
+    row = cur.fetchone()
+    columns = [desc[0] for desc in cur.description]
     conn.close()
+    if row:
+        return dict(zip(columns, row))
+
+    matches = search_members(keyword, columns="m.*", limit=1)
+    if matches:
+        return dict(zip(columns, matches[0]))
+    return None
 
-    if rows:
-        return [{"member_number": r[0].strip(), "member_name": r[1]} for r in rows]
-    return []
 
+def fetch_members_matching(keyword):
+    rows = search_members(keyword)
+    return [{"member_number": (r[0] or "").strip(), "member_name": r[1]} for r in rows]
@@ -0,0 +1,145 @@
+# services/member_validation.py
+"""Column-wise validation of rows before they are imported.
+
+Rows are checked as a pandas DataFrame (one row per sheet row, one column
+per table column, values as services.member_import normalizes them), one
+vectorized expression per rule. The result is an error matrix
+of the same shape: each cell holds the message for that field, or "" when
+it is fine, so a caller can report exactly which cells are wrong and hand
+only the clean rows on.
+
+COLUMN_TYPES (member_info) and RULE_TYPES (services.bulk_import) are the
+human descriptions of the same rules; the import templates print them
+under each header.
+"""
+import functools
+
+import pandas as pd
+from nepali_datetime import MAXYEAR, MINYEAR, date as nepali_date
+
+from utils.search_keys import DEVANAGARI_DIGITS
+
+COLUMN_TYPES = {
+    'member_number': 'Text (Unique, Required)',
+    'member_name': 'Text (Required)',
+    'phone': 'Number (10 digits)',
+    'dob_bs': 'B.S. Date (YYYY-MM-DD)',
+    'citizenship_no': 'Text/Number',
+    'ward_no': 'Number (1-32)'
+}
+REQUIRED_COLUMNS = ("member_number", "member_name")
+PHONE_PATTERN = r"\d{10}"
+WARD_RANGE = (1, 32)
+BS_DATE_PATTERN = r"(\d{4})-(\d{1,2})-(\d{1,2})"
+AMOUNT_PATTERN = r"\d+(?:\.\d+)?"
+DUPLICATE_IN_FILE = "Duplicate member number in file"
+
+
+@functools.lru_cache(maxsize=None)
+def bs_month_lengths():
+    """{year * 100 + month: days} for every B.S. month nepali_datetime knows."""
+    lengths = {}
+    for year in range(MINYEAR, MAXYEAR + 1):
+        for month in range(1, 13):
+            for days in (32, 31, 30, 29):
+                try:
+                    nepali_date(year, month, days)
+                except ValueError:
+                    continue
+                lengths[year * 100 + month] = days
+                break
+    return lengths
+
+
+def _digits(column):
+    """Text with Nepali digits folded to ASCII (NaN stays NaN)."""
+    return column.str.translate(DEVANAGARI_DIGITS).str.strip()
+
+
+def _phone_errors(column):
+    digits = _digits(column).str.replace(r"[\s-]", "", regex=True)
+    return column.notna() & ~digits.str.fullmatch(PHONE_PATTERN, na=False)
+
+
+def _ward_errors(column):
+    ward = pd.to_numeric(_digits(column), errors="coerce")
+    valid = ward.between(*WARD_RANGE) & (ward == ward.round())
+    return column.notna() & ~valid
+
+
+def _bs_date_errors(column):
+    fields = _digits(column).str.replace("/", "-").str.extract(f"^{BS_DATE_PATTERN}$").astype(float)
+    days_in_month = (fields[0] * 100 + fields[1]).map(bs_month_lengths())
+    # Unparsed dates are NaN here, and NaN compares False
+    valid = (fields[2] >= 1) & (fields[2] <= days_in_month)
+    return column.notna() & ~valid
+
+
+def _amount_errors(column):
+    amount = _digits(column).str.replace(",", "")
+    return column.notna() & ~amount.str.fullmatch(AMOUNT_PATTERN, na=False)
+
+
+# rule name -> (check, message); a check maps a column to a boolean "bad" mask
+RULES = {
+    "phone": (_phone_errors, "Phone must be 10 digits"),
+    "ward": (_ward_errors, f"Ward must be a whole number from {WARD_RANGE[0]} to {WARD_RANGE[1]}"),
+    "bs_date": (_bs_date_errors, "Not a valid B.S. date (YYYY-MM-DD)"),
+    "amount": (_amount_errors, "Amount must be a number"),
+}
+# How templates describe a column checked by each rule
+RULE_TYPES = {
+    "phone": "Number (10 digits)",
+    "ward": f"Number ({WARD_RANGE[0]}-{WARD_RANGE[1]})",
+    "bs_date": "B.S. Date (YYYY-MM-DD)",
+    "amount": "Number",
+}
+# member_info column -> rule
+MEMBER_CHECKS = {"phone": "phone", "ward_no": "ward", "dob_bs": "bs_date"}
+
+
+def validate_frame(frame, required=(), checks=None):
+    """Return the error matrix for `frame` ("" for every clean cell).
+
+    required columns must be filled; checks maps columns to RULES names.
+    Columns the frame doesn't have are not checked.
+    """
+    errors = pd.DataFrame("", index=frame.index, columns=frame.columns)
+    for column in required:
+        if column in frame:
+            flag_cells(errors, column, frame[column].isna(), "Required")
+    for column, rule in (checks or {}).items():
+        if column in frame:
+            check, message = RULES[rule]
+            flag_cells(errors, column, check(frame[column]), message)
+    return errors
+
+
+def flag_cells(errors, column, bad, message):
+    """Set message on the `bad` cells of an error-matrix column; a cell keeps its first problem."""
+    errors[column] = errors[column].mask(bad & (errors[column] == ""), message)
+
+
+def validate_members(frame, seen=frozenset()):
+    """Return the error matrix for member rows.
+
+    Checks required fields, MEMBER_CHECKS, and member numbers repeated
+    within the frame or already in `seen` (numbers from earlier chunks of
+    the same file); the first occurrence of a number is kept.
+    """
+    errors = validate_frame(frame, REQUIRED_COLUMNS, MEMBER_CHECKS)
+    if "member_number" in frame:
+        numbers = frame["member_number"]
+        repeated = numbers.notna() & (numbers.duplicated() | numbers.isin(seen))
+        flag_cells(errors, "member_number", repeated, DUPLICATE_IN_FILE)
+    return errors
+
+
+def error_rows(errors):
+    """Boolean mask of the rows with at least one error."""
+    return errors.ne("").any(axis=1)
+
+
+def describe_errors(row):
+    """One message for an error-matrix row: "column: problem; ..."."""
+    return "; ".join(f"{column}: {message}" for column, message in row.items() if message)
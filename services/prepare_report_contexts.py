@@ -1,20 +1,7 @@
 from nepali_datetime import date as nepali_date
 from utils.converter import convert_to_nepali_digits
 from utils.age_utils import calculate_nepali_age
-from services.report_fetchers import (
-    fetch_member_info,
-    fetch_loan_info,
-    fetch_collateral_basic,
-    fetch_collateral_affiliations,
-    fetch_collateral_properties,
-    fetch_collateral_family_details,
-    fetch_income_expense,
-    fetch_project_detail,
-    fetch_approval_info,
-    fetch_witness_detail,
-    fetch_guarantor_details
-)
-from models.database import get_connection
+from services.report_fetchers import fetch_report_sections
 import logging
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -67,17 +54,19 @@ def extract_bs_date_parts(bs_date_str):
 
 def prepare_report_context(member_number, entered_by_name="", entered_by_post="", approved_by_name="", approved_by_post=""):
     try:
-        member_info = fetch_member_info(member_number) or {}
-        loan_info = fetch_loan_info(member_number) or {}
-        collateral_basic = fetch_collateral_basic(member_number) or {}
-        affiliations = fetch_collateral_affiliations(member_number) or []
-        properties = fetch_collateral_properties(member_number) or []
-        family = fetch_collateral_family_details(member_number) or []
-        income_expense = fetch_income_expense(member_number) or []
-        project_details = fetch_project_detail(member_number) or []
-        approval_data = fetch_approval_info(member_number) or {}
-        witnesses = fetch_witness_detail(member_number) or []
-        guarantors = fetch_guarantor_details(member_number) or []
+        # All sections are read in one transaction on one connection
+        sections = fetch_report_sections(member_number)
+        member_info = sections["member_info"]
+        loan_info = sections["loan_info"]
+        collateral_basic = sections["collateral_basic"]
+        affiliations = sections["affiliations"]
+        properties = sections["properties"]
+        family = sections["family"]
+        income_expense = sections["income_expense"]
+        project_details = sections["project_details"]
+        approval_data = sections["approval_info"]
+        witnesses = sections["witnesses"]
+        guarantors = sections["guarantors"]
 
         logging.debug(f"✅ Member Info: {member_info}")
         logging.debug(f"✅ Loan Info: {loan_info}")
@@ -133,19 +122,9 @@ def prepare_report_context(member_number, entered_by_name="", entered_by_post=""
                 g['guarantor_phone'] = convert_to_nepali_digits(str(g['guarantor_phone']))
             if "guarantor_citizenship" in g and g["guarantor_citizenship"] is not None:
                 g['guarantor_citizenship'] = convert_to_nepali_digits(str(g['guarantor_citizenship']))
-        # Fetch manjurinama_details from db to use in template
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM manjurinama_details
-            WHERE member_number = ?
-        """, (member_number,))
-        manjurinama_data = cursor.fetchone()
-        conn.close()
-
-        manjurinama_details = {}
-        if manjurinama_data:
-            manjurinama_details = dict(zip([desc[0] for desc in cursor.description], manjurinama_data))
+        # manjurinama_details to use in template
+        manjurinama_details = sections["manjurinama_details"]
+        if manjurinama_details:
             if "age" in manjurinama_details and manjurinama_details["age"] is not None:
                 manjurinama_details["manjuri_age"] = convert_to_nepali_digits(str(manjurinama_details["age"]))
                 del manjurinama_details["age"]  # Avoid overriding m_age_np
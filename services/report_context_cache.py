@@ -0,0 +1,108 @@
+# services/report_context_cache.py
+"""Per-member cache for prepare_report_context().
+
+Generating a packet renders up to six documents from the same context, so
+the context is built once and reused until something for that member is
+saved. The module has no Qt dependency; the UI wires invalidation to
+signal_bus with connect_invalidation().
+"""
+import copy
+import threading
+from collections import OrderedDict
+
+from nepali_datetime import date as nepali_date
+from services.prepare_report_contexts import prepare_report_context
+
+
+class ReportContextCache:
+    """LRU cache of report contexts keyed by member and approver fields."""
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @staticmethod
+    def _key(member_number, entered_by_name, entered_by_post, approved_by_name, approved_by_post):
+        # The context contains today's BS date and the member's age, so an
+        # entry must not outlive the day it was built on
+        today = nepali_date.today().strftime("%Y-%m-%d")
+        return (str(member_number), entered_by_name, entered_by_post, approved_by_name, approved_by_post, today)
+
+    def get(self, member_number, entered_by_name="", entered_by_post="", approved_by_name="", approved_by_post=""):
+        """Return the report context for a member, building it on a miss.
+
+        Callers get their own copy, so rendering can't leak changes into
+        the cached entry. Empty contexts (member missing, fetch error) are
+        not cached.
+        """
+        key = self._key(member_number, entered_by_name, entered_by_post, approved_by_name, approved_by_post)
+        with self._lock:
+            context = self._entries.get(key)
+            if context is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return copy.deepcopy(context)
+            self._stats["misses"] += 1
+
+        context = prepare_report_context(
+            member_number, entered_by_name, entered_by_post, approved_by_name, approved_by_post
+        )
+        if not context:
+            return context
+
+        with self._lock:
+            self._entries[key] = context
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return copy.deepcopy(context)
+
+    def invalidate(self, member_number=None):
+        """Drop cached contexts for one member, or everything when None/empty."""
+        with self._lock:
+            if not member_number:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                member_number = str(member_number)
+                stale = [key for key in self._entries if key[0] == member_number]
+                for key in stale:
+                    del self._entries[key]
+                removed = len(stale)
+            self._stats["invalidations"] += removed
+
+    def clear(self):
+        self.invalidate()
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current size."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            hit_rate = self._stats["hits"] / lookups if lookups else 0.0
+            return {**self._stats, "size": len(self._entries), "hit_rate": round(hit_rate, 3)}
+
+
+report_context_cache = ReportContextCache()
+
+_connected_buses = set()
+
+
+def get_report_context(member_number, entered_by_name="", entered_by_post="", approved_by_name="", approved_by_post=""):
+    """Cached drop-in for prepare_report_context()."""
+    return report_context_cache.get(
+        member_number, entered_by_name, entered_by_post, approved_by_name, approved_by_post
+    )
+
+
+def connect_invalidation(bus):
+    """Invalidate cached contexts whenever bus.member_data_changed fires.
+
+    Safe to call more than once (e.g. every time a ReportsTab is built).
+    """
+    if id(bus) in _connected_buses:
+        return
+    bus.member_data_changed.connect(report_context_cache.invalidate)
+    _connected_buses.add(id(bus))
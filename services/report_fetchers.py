@@ -1,4 +1,4 @@
-from models.database import get_connection
+from models.database import get_connection, transaction
 
 
 def fetch_member_info(member_number):
@@ -92,16 +92,15 @@ def fetch_income_expense(member_number):
 
 
 def fetch_project_detail(member_number):
-        conn = get_connection()
-        cursor = conn.cursor()
+    conn = get_connection()
+    cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM collateral_projects WHERE member_number = ?", (member_number,))
-        rows = cursor.fetchall()
+    cursor.execute("SELECT * FROM collateral_projects WHERE member_number = ?", (member_number,))
+    rows = cursor.fetchall()
+    columns = [desc[0] for desc in cursor.description]
+    conn.close()
 
-        if rows:
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
-        return []
+    return [dict(zip(columns, row)) for row in rows] if rows else []
 
 def fetch_approval_info(member_number):
     conn = get_connection()
@@ -143,3 +142,49 @@ def fetch_guarantor_details(member_number):
         columns = [desc[0] for desc in cursor.description]
         return [dict(zip(columns, row)) for row in rows]
     return []    
+
+
+# Sections loaded by fetch_report_sections(): name -> (table, many rows?)
+REPORT_SECTIONS = {
+    "member_info": ("member_info", False),
+    "loan_info": ("loan_info", False),
+    "collateral_basic": ("collateral_basic", False),
+    "affiliations": ("collateral_affiliations", True),
+    "properties": ("collateral_properties", True),
+    "family": ("collateral_family_details", True),
+    "income_expense": ("collateral_income_expense", True),
+    "project_details": ("collateral_projects", True),
+    "approval_info": ("approval_info", False),
+    "witnesses": ("loan_witness", True),
+    "guarantors": ("guranteer_details", True),
+    "manjurinama_details": ("manjurinama_details", False),
+}
+
+# Fixed statement text per section so sqlite3's statement cache reuses the
+# prepared statements across calls
+_SECTION_SQL = {
+    section: f"SELECT * FROM {table} WHERE member_number = ? ORDER BY id" + ("" if many else " LIMIT 1")
+    for section, (table, many) in REPORT_SECTIONS.items()
+}
+
+
+def fetch_report_sections(member_number):
+    """Fetch everything a report needs for a member in one read transaction.
+
+    All sections are read on the thread's pooled connection inside a single
+    transaction, so they come from one consistent snapshot. Returns a dict
+    keyed like REPORT_SECTIONS: single-row sections are dicts ({} when
+    missing) and multi-row sections are lists of dicts, matching what the
+    individual fetch_* functions above return.
+    """
+    sections = {}
+    with transaction() as conn:
+        for section, (_, many) in REPORT_SECTIONS.items():
+            cursor = conn.execute(_SECTION_SQL[section], (member_number,))
+            columns = [desc[0] for desc in cursor.description]
+            if many:
+                sections[section] = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            else:
+                row = cursor.fetchone()
+                sections[section] = dict(zip(columns, row)) if row else {}
+    return sections
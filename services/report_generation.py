@@ -0,0 +1,287 @@
+# services/report_generation.py
+"""Render a member's document packet and log each file to report_tracking.
+
+Plain Python with no Qt imports, so the same code runs on the GUI's worker
+thread and from scripts. The caller decides which documents to produce
+(plan_packet) and gets progress through callbacks. A packet can also be
+composed into one merged .docx for printing.
+"""
+import os
+import logging
+from io import BytesIO
+from os.path import abspath
+
+from docx import Document
+from docxcompose.composer import Composer
+
+from nepali_datetime import date as nepali_date, datetime as nepali_datetime
+from models.report_tracking_model import save_report_log
+from services.report_context_cache import get_report_context
+from services.template_cache import load_template
+
+OUTPUT_BASE_DIR = "generated reports"
+PRIMARY_REPORT_TYPE = "Loan Application"
+MERGED_REPORT_TYPE = "Loan Packet"
+
+
+def plan_packet(member_number, loan_type, primary_template, extra_docs, nepali_date_str=None,
+                base_dir=OUTPUT_BASE_DIR, merged=False):
+    """Return the documents to render, primary report first.
+
+    extra_docs is a list of (doc_name, template_path) pairs. Each entry of
+    the result is a dict with doc_name, report_type, template_path,
+    output_path and log_path (the path recorded in report_tracking; absolute
+    for the primary report, as the tab has always logged it).
+
+    With merged=True a last entry with "merged": True (and no template)
+    asks generate_packet() to also write every rendered document, in plan
+    order, into one file.
+    """
+    if nepali_date_str is None:
+        nepali_date_str = nepali_date.today().strftime('%Y%m%d')
+
+    primary_path = os.path.join(base_dir, loan_type, f"{loan_type}_{member_number}_{nepali_date_str}.docx")
+    documents = [{
+        "doc_name": PRIMARY_REPORT_TYPE,
+        "report_type": PRIMARY_REPORT_TYPE,
+        "template_path": primary_template,
+        "output_path": primary_path,
+        "log_path": abspath(primary_path),
+        "required": True,
+    }]
+    for doc_name, template_path in extra_docs:
+        output_path = os.path.join(base_dir, doc_name, f"{doc_name}_{member_number}_{nepali_date_str}.docx")
+        documents.append({
+            "doc_name": doc_name,
+            "report_type": doc_name,
+            "template_path": template_path,
+            "output_path": output_path,
+            "log_path": output_path,
+            "required": False,
+        })
+    if merged:
+        merged_path = os.path.join(base_dir, MERGED_REPORT_TYPE, f"{MERGED_REPORT_TYPE}_{member_number}_{nepali_date_str}.docx")
+        documents.append({
+            "doc_name": MERGED_REPORT_TYPE,
+            "report_type": MERGED_REPORT_TYPE,
+            "template_path": None,
+            "output_path": merged_path,
+            "log_path": merged_path,
+            "required": False,
+            "merged": True,
+        })
+    return documents
+
+
+def render_document(template_path, context, output_path, return_bytes=False):
+    """Render one template with context and write it to output_path.
+
+    Returns output_path, or the saved .docx bytes with return_bytes=True
+    (so a merged packet can be composed without reading the file back).
+    """
+    folder = os.path.dirname(output_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tpl = load_template(template_path)
+    tpl.render(context)
+    if not return_bytes:
+        tpl.save(output_path)
+        return output_path
+    buffer = BytesIO()
+    tpl.save(buffer)
+    content = buffer.getvalue()
+    with open(output_path, "wb") as fh:
+        fh.write(content)
+    return content
+
+
+def compose_documents(contents, output_path):
+    """Write the .docx files given as bytes into one document, a page break between each."""
+    folder = os.path.dirname(output_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    master = Document(BytesIO(contents[0]))
+    composer = Composer(master)
+    for content in contents[1:]:
+        master.add_page_break()
+        composer.append(Document(BytesIO(content)))
+    composer.save(output_path)
+    return output_path
+
+
+def _log_document(member_number, doc, generated_by, report_log=None):
+    entry = {
+        "member_number": member_number,
+        "report_type": doc["report_type"],
+        "generated_by": generated_by,
+        "file_path": doc["log_path"],
+        "date": nepali_date.today().strftime('%Y-%m-%d')
+    }
+    if report_log is None:
+        save_report_log(entry)
+    else:
+        entry["generated_date"] = nepali_datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        report_log.append(entry)
+
+
+def generate_packet(member_number, documents, generated_by, approver=None,
+                    on_progress=None, on_document=None, is_cancelled=None, parallel=None,
+                    context=None, report_log=None):
+    """Build the context once and render every planned document.
+
+    approver holds entered_by_name/entered_by_post/approved_by_name/
+    approved_by_post. Callbacks:
+      on_progress(index, total, doc_name)          before each document (in
+                                                   parallel: as each one finishes)
+      on_document(doc_name, output_path, error)    after each document
+      is_cancelled()                               checked between documents
+
+    With parallel=None the documents are rendered in the shared process
+    pool when there is more than one and the pool has more than one worker
+    (one per CPU unless set_render_workers() says otherwise: the Settings
+    tab, the CLI's --jobs), otherwise in-process. Sequentially, a failed required document skips the rest of
+    the packet; in parallel every document is attempted. Logging to
+    report_tracking always happens in the calling thread.
+
+    Pass context to skip the context cache (bulk runs), and a report_log
+    list to collect the report_tracking rows instead of writing each one;
+    the caller then saves them with save_report_logs().
+
+    A merged entry from plan_packet(merged=True) is written last from the
+    rendered documents' bytes kept in memory, and logged as its own
+    report_tracking row. It is skipped when the primary report failed or
+    the packet was cancelled.
+
+    Returns a dict with "context_found", "generated", "failed" and
+    "cancelled".
+    """
+    result = {"context_found": False, "generated": [], "failed": [], "cancelled": False}
+    approver = approver or {}
+    if context is None:
+        context = get_report_context(
+            member_number,
+            approver.get("entered_by_name", ""),
+            approver.get("entered_by_post", ""),
+            approver.get("approved_by_name", ""),
+            approver.get("approved_by_post", ""),
+        )
+    if not context:
+        return result
+    result["context_found"] = True
+
+    merged_doc = next((doc for doc in documents if doc.get("merged")), None)
+    documents = [doc for doc in documents if not doc.get("merged")]
+    keep = merged_doc is not None
+    contents = {}
+
+    if parallel is None:
+        from services.parallel_render import render_pool
+        parallel = len(documents) > 1 and render_pool.max_workers > 1
+    if parallel:
+        outcomes = _render_parallel(context, documents, on_progress, is_cancelled, result, keep)
+    else:
+        outcomes = _render_sequential(context, documents, on_progress, is_cancelled, result, keep)
+
+    for doc, error, content in outcomes:
+        if error is None:
+            try:
+                _log_document(member_number, doc, generated_by, report_log)
+            except Exception as e:
+                error = str(e)
+        if error is None:
+            if keep:
+                contents[doc["output_path"]] = content
+            _record_success(result, doc, on_document)
+        else:
+            _record_failure(result, doc, error, on_document)
+
+    if merged_doc is not None and contents and not result["cancelled"]:
+        _write_merged(member_number, merged_doc, documents, contents, generated_by, report_log, result, on_document)
+    return result
+
+
+def _record_success(result, doc, on_document):
+    result["generated"].append((doc["doc_name"], doc["output_path"]))
+    if on_document:
+        on_document(doc["doc_name"], doc["output_path"], None)
+
+
+def _record_failure(result, doc, error, on_document):
+    logging.error(f"Error generating {doc['doc_name']}: {error}")
+    result["failed"].append((doc["doc_name"], error))
+    if on_document:
+        on_document(doc["doc_name"], None, error)
+
+
+def _write_merged(member_number, merged_doc, documents, contents, generated_by, report_log, result, on_document):
+    """Compose the rendered documents, in plan order, into the merged packet file."""
+    if any(doc.get("required") and doc["output_path"] not in contents for doc in documents):
+        return  # no primary report, no packet
+    ordered = [contents[doc["output_path"]] for doc in documents if doc["output_path"] in contents]
+    try:
+        compose_documents(ordered, merged_doc["output_path"])
+        _log_document(member_number, merged_doc, generated_by, report_log)
+    except Exception as e:
+        _record_failure(result, merged_doc, str(e), on_document)
+    else:
+        _record_success(result, merged_doc, on_document)
+
+
+def _render_sequential(context, documents, on_progress, is_cancelled, result, keep=False):
+    """Yield (doc, error, content) as each document is rendered in this process.
+
+    content is the .docx bytes when keep is set, otherwise None.
+    """
+    total = len(documents)
+    for index, doc in enumerate(documents):
+        if is_cancelled and is_cancelled():
+            result["cancelled"] = True
+            return
+        if on_progress:
+            on_progress(index, total, doc["doc_name"])
+        try:
+            content = render_document(doc["template_path"], context, doc["output_path"], return_bytes=keep)
+        except Exception as e:
+            yield doc, str(e), None
+            if doc.get("required"):
+                return
+            continue
+        yield doc, None, content if keep else None
+
+
+def _render_parallel(context, documents, on_progress, is_cancelled, result, keep=False):
+    """Yield (doc, error, content) as worker processes finish each document."""
+    from concurrent.futures import FIRST_COMPLETED, wait
+    from services.parallel_render import render_pool
+
+    try:
+        submitted = render_pool.submit_packet(context, documents, return_bytes=keep)
+    except Exception as e:
+        logging.error(f"Render pool unavailable, rendering in-process: {e}")
+        yield from _render_sequential(context, documents, on_progress, is_cancelled, result, keep)
+        return
+    docs_by_future = {future: doc for doc, future in submitted}
+    total = len(submitted)
+
+    pending = set(docs_by_future)
+    done_count = 0
+    while pending:
+        if is_cancelled and is_cancelled():
+            result["cancelled"] = True
+            # Documents already running finish in the background but are not logged
+            for future in pending:
+                future.cancel()
+            return
+        done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+        for future in done:
+            doc = docs_by_future[future]
+            if on_progress:
+                on_progress(done_count, total, doc["doc_name"])
+            done_count += 1
+            try:
+                content = future.result()
+            except Exception as e:
+                render_pool.discard_if_broken(e)
+                yield doc, str(e), None
+            else:
+                yield doc, None, content if keep else None
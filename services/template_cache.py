@@ -0,0 +1,163 @@
+# services/template_cache.py
+"""Parsed .docx template cache for docxtpl.
+
+DocxTemplate(path) unzips and parses the whole .docx on every render, then
+cleans the XML with a long chain of regexes (patch_xml) and compiles it
+into a Jinja template. None of that depends on the context. The cache keeps
+one pristine parsed Document per template file, keyed by (path, mtime, size)
+so edits on disk are picked up, together with the patched XML and compiled
+Jinja templates, and hands out DocxTemplate objects backed by a deep copy of
+the Document. Only the context-dependent work is left per render.
+"""
+import copy
+import os
+import threading
+from collections import OrderedDict
+
+from docx import Document
+from docxtpl import DocxTemplate
+from jinja2 import Environment
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _MemoEnvironment(Environment):
+    """Jinja environment that compiles each template source only once."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compiled = {}
+
+    def from_string(self, source, globals=None, template_class=None):
+        if globals is not None or template_class is not None:
+            return super().from_string(source, globals, template_class)
+        template = self._compiled.get(source)
+        if template is None:
+            template = self._compiled[source] = super().from_string(source)
+        return template
+
+
+class _Entry:
+    __slots__ = ("signature", "document", "size", "placeholders", "patched", "jinja_env")
+
+    def __init__(self, signature, document, size):
+        self.signature = signature
+        self.document = document
+        self.size = size
+        self.placeholders = None
+        self.patched = {}  # raw part XML -> patch_xml() output
+        self.jinja_env = _MemoEnvironment()
+
+
+class _CachedDocxTemplate(DocxTemplate):
+    """DocxTemplate that reuses a cache entry's patched XML and compiled Jinja."""
+
+    def __init__(self, template_file, entry):
+        super().__init__(template_file)
+        self._entry = entry
+
+    def patch_xml(self, src_xml):
+        patched = self._entry.patched.get(src_xml)
+        if patched is None:
+            patched = self._entry.patched[src_xml] = super().patch_xml(src_xml)
+        return patched
+
+    def render(self, context, jinja_env=None, autoescape=False):
+        # A plain Environment() is what docxtpl uses when none is passed
+        if jinja_env is None and not autoescape:
+            jinja_env = self._entry.jinja_env
+        super().render(context, jinja_env, autoescape)
+
+
+class TemplateCache:
+    """LRU cache of parsed templates, bounded by an approximate memory budget.
+
+    Entry size is the serialized size of all package parts, doubled to
+    cover the patched XML and compiled templates kept alongside. That tracks
+    the in-memory footprint closely enough to budget with.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "reloads": 0, "evictions": 0}
+
+    @staticmethod
+    def _signature(path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _entry(self, path):
+        path = os.path.abspath(path)
+        signature = self._signature(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(path)
+                self._stats["hits"] += 1
+                return entry
+            self._stats["reloads" if entry is not None else "misses"] += 1
+
+        document = Document(path)
+        size = 2 * sum(len(part.blob) for part in document.part.package.iter_parts())
+        entry = _Entry(signature, document, size)
+
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._total_bytes -= old.size
+            self._entries[path] = entry
+            self._total_bytes += size
+            # Always keep the entry just loaded, even if it alone exceeds the budget
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted.size
+                self._stats["evictions"] += 1
+        return entry
+
+    def get(self, path):
+        """Return a DocxTemplate for path that is ready to render and save."""
+        entry = self._entry(path)
+        tpl = _CachedDocxTemplate(path, entry)
+        tpl.docx = copy.deepcopy(entry.document)
+        return tpl
+
+    def placeholders(self, path):
+        """Return the template's undeclared Jinja variables (cached per version)."""
+        entry = self._entry(path)
+        if entry.placeholders is None:
+            # Placeholder extraction only reads the XML, so the pristine copy is safe to use
+            tpl = _CachedDocxTemplate(path, entry)
+            tpl.docx = entry.document
+            entry.placeholders = tpl.get_undeclared_template_variables()
+        return set(entry.placeholders)
+
+    def invalidate(self, path=None):
+        """Forget one template, or all of them when path is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._total_bytes = 0
+                return
+            entry = self._entries.pop(os.path.abspath(path), None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+template_cache = TemplateCache()
+
+
+def load_template(path):
+    """Cached drop-in for DocxTemplate(path)."""
+    return template_cache.get(path)
@@ -4,5 +4,9 @@ from PyQt5.QtCore import QObject, pyqtSignal
 class SignalBus(QObject):
     session_updated = pyqtSignal()
     loan_added = pyqtSignal()
+    # Emitted after any save/delete touching a member's data (member, loan,
+    # collateral, project, approval, witness, guarantor, manjurinama).
+    # An empty string means "many members changed".
+    member_data_changed = pyqtSignal(str)
 
 signal_bus = SignalBus()
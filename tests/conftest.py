@@ -0,0 +1,40 @@
+# tests/conftest.py
+import openpyxl
+import pytest
+
+from models.database import connection_manager, initialize_db, set_database_path, transaction
+
+
+@pytest.fixture
+def database(tmp_path):
+    """A throwaway database built from the migrations; yields its path."""
+    path = tmp_path / "test.db"
+    set_database_path(path)
+    initialize_db()
+    yield path
+    connection_manager.close_all()
+
+
+@pytest.fixture
+def write_workbook(tmp_path):
+    """write_workbook(name, {sheet: rows}) -> path of a new .xlsx, sheets in order."""
+    def write(name, sheets):
+        workbook = openpyxl.Workbook()
+        workbook.remove(workbook.active)
+        for title, rows in sheets.items():
+            sheet = workbook.create_sheet(title)
+            for row in rows:
+                sheet.append(row)
+        path = tmp_path / name
+        workbook.save(path)
+        return path
+    return write
+
+
+@pytest.fixture
+def add_members(database):
+    """add_members((member_number, member_name), ...) straight into member_info."""
+    def add(*members):
+        with transaction() as conn:
+            conn.executemany("INSERT INTO member_info (member_number, member_name) VALUES (?, ?)", members)
+    return add
@@ -0,0 +1,82 @@
+# tests/test_approvals.py
+import pytest
+
+from models.approval_model import approve_loans
+from models.database import get_connection, transaction
+from utils.amount_to_words import convert_number_to_nepali_words
+
+APPROVAL = {
+    "approval_date": "2082-01-15", "entered_by": "Clerk", "entered_designation": "Assistant",
+    "approved_by": "Manager", "approved_designation": "Manager",
+}
+
+
+@pytest.fixture
+def loans(add_members):
+    """Ids of three loans: two pending, the third already approved."""
+    add_members(("000000001", "Ram"), ("000000002", "Sita"), ("000000003", "Hari"))
+    with transaction() as conn:
+        conn.executemany(
+            "INSERT INTO loan_info (member_number, loan_type, loan_amount, status) VALUES (?, 'x', '100', ?)",
+            [("000000001", "pending"), ("000000002", "pending"), ("000000003", "approved")],
+        )
+    return [row[0] for row in get_connection().execute("SELECT id FROM loan_info ORDER BY id")]
+
+
+def statuses():
+    return [row[0] for row in get_connection().execute("SELECT status FROM loan_info ORDER BY id")]
+
+
+def assert_nothing_written():
+    assert statuses() == ["pending", "pending", "approved"]
+    assert get_connection().execute("SELECT count(*) FROM approval_info").fetchone()[0] == 0
+
+
+def test_approves_every_loan(loans):
+    approved = approve_loans([(loans[0], "000000001", "1,500"), (loans[1], "000000002", "२००")], **APPROVAL)
+    assert [a["approved_loan_amount"] for a in approved] == ["१५००", "२००"]
+    assert statuses() == ["approved", "approved", "approved"]
+    rows = get_connection().execute(
+        "SELECT member_number, approved_loan_amount, approved_loan_amount_words FROM approval_info ORDER BY id"
+    ).fetchall()
+    assert rows == [
+        ("000000001", "१५००", convert_number_to_nepali_words(1500)),
+        ("000000002", "२००", convert_number_to_nepali_words(200)),
+    ]
+
+
+@pytest.mark.parametrize("typed, stored, rupees", [
+    ("1,00,000", "१०००००", 100000),
+    ("१,५००.५०", "१५००.५०", 1500),
+    ("2500.00", "२५००", 2500),
+])
+def test_amounts_like_the_approval_form(loans, typed, stored, rupees):
+    approved, = approve_loans([(loans[0], "000000001", typed)], **APPROVAL)
+    assert approved["approved_loan_amount"] == stored
+    assert approved["approved_loan_amount_words"] == convert_number_to_nepali_words(rupees)
+
+
+def test_a_loan_that_is_not_pending_fails_the_batch(loans):
+    with pytest.raises(ValueError, match="000000003"):
+        approve_loans([(loans[0], "000000001", "100"), (loans[2], "000000003", "100")], **APPROVAL)
+    assert_nothing_written()
+
+
+@pytest.mark.parametrize("amount", ["", "abc", "0", "-100", "1.2.3"])
+def test_a_bad_amount_fails_the_batch(loans, amount):
+    with pytest.raises(ValueError, match="000000002"):
+        approve_loans([(loans[0], "000000001", "100"), (loans[1], "000000002", amount)], **APPROVAL)
+    assert_nothing_written()
+
+
+def test_a_loan_approved_meanwhile_fails_the_batch(loans):
+    # Stand-in for another user approving the second loan between the
+    # pending check and the update: its UPDATE changes no row
+    with transaction() as conn:
+        conn.execute(f"""
+            CREATE TRIGGER skip_second_loan BEFORE UPDATE ON loan_info WHEN old.id = {loans[1]}
+            BEGIN SELECT RAISE(IGNORE); END
+        """)
+    with pytest.raises(ValueError, match="स्थिति बदलिएको"):
+        approve_loans([(loans[0], "000000001", "100"), (loans[1], "000000002", "100")], **APPROVAL)
+    assert_nothing_written()
@@ -0,0 +1,112 @@
+# tests/test_bulk_import.py
+import pytest
+
+from models.database import get_connection
+from services.bulk_import import DUPLICATE_ROW, IMPORT_ORDER, amount_in_words, import_table, import_tables
+from utils.excel_handler import ExcelHandler
+
+LOAN_HEADER = ["member_number", "loan_type", "loan_amount"]
+
+
+def rows(table, columns):
+    return get_connection().execute(f"SELECT {columns} FROM {table} ORDER BY id").fetchall()
+
+
+@pytest.fixture
+def members(add_members):
+    add_members(("000000001", "Ram"), ("000000002", "Sita"))
+
+
+def test_amount_in_words_reads_nepali_digits_and_commas():
+    assert amount_in_words("१,००,०००") == amount_in_words("100000")
+    assert amount_in_words("abc") is None
+
+
+def test_loans_resolve_members_and_fill_defaults(members, write_workbook):
+    path = write_workbook("bulk.xlsx", {"Loans": [
+        LOAN_HEADER, [1, "Business", "1,00,000"], [9, "Business", "500"],
+    ]})
+    stats = import_table(path, "loan_info")
+    assert (stats["inserted"], stats["unresolved"]) == (1, 1)
+    assert stats["errors"] == [(3, "Member 000000009 not found")]
+    assert rows("loan_info", "member_number, status, loan_amount_in_words") == [
+        ("000000001", "pending", amount_in_words("100000")),
+    ]
+
+
+def test_a_row_repeated_in_the_sheet_is_imported_once(members, write_workbook):
+    path = write_workbook("bulk.xlsx", {"Loans": [
+        LOAN_HEADER, [1, "x", "1,00,000"], [1, "x", "1,00,000"], [1, "y", "1,00,000"],
+    ]})
+    stats = import_table(path, "loan_info")
+    assert (stats["inserted"], stats["duplicates"]) == (2, 1)
+    assert stats["errors"] == [(3, DUPLICATE_ROW)]
+    assert len(rows("loan_info", "id")) == 2
+
+
+def test_importing_the_same_file_again_adds_nothing(members, write_workbook):
+    path = write_workbook("bulk.xlsx", {"Loans": [LOAN_HEADER, [1, "x", "100"], [2, "x", "200"]]})
+    import_table(path, "loan_info")
+    stats = import_table(path, "loan_info")
+    assert (stats["inserted"], stats["already_present"]) == (0, 2)
+    assert len(rows("loan_info", "id")) == 2
+
+
+def test_invalid_cells_skip_the_row(members, write_workbook):
+    path = write_workbook("bulk.xlsx", {"Loans": [LOAN_HEADER, [1, None, "100"], [2, "x", "lots"]]})
+    stats = import_table(path, "loan_info")
+    assert stats["inserted"] == 0
+    assert stats["errors"] == [(2, "loan_type: Required"), (3, "loan_amount: Amount must be a number")]
+
+
+def test_approvals_need_a_loan_imported_first(members, write_workbook):
+    path = write_workbook("bulk.xlsx", {
+        # Sheet order doesn't matter: tables load in IMPORT_ORDER
+        "Approvals": [
+            ["member_number", "approval_date", "approved_loan_amount"],
+            [1, "2081-02-32", "100"],
+            [2, "2081-02-32", "100"],
+        ],
+        "Loans": [LOAN_HEADER, [1, "x", "100"]],
+    })
+    results = import_tables(path)
+    assert list(results) == ["loan_info", "approval_info"]
+    approvals = results["approval_info"]
+    assert (approvals["inserted"], approvals["unresolved"]) == (1, 1)
+    assert approvals["errors"] == [(3, "Member 000000002 has no loan_info row")]
+
+
+def test_cancel_rolls_back_the_current_table_and_stops(members, write_workbook):
+    path = write_workbook("bulk.xlsx", {
+        "Loans": [LOAN_HEADER, [1, "x", "100"]],
+        "Family Details": [["member_number", "name", "relation"], [1, "Gita", "wife"], [2, "Hari", "son"]],
+        "Guarantors": [["member_number", "guarantor_name"], [1, "Shyam"]],
+    })
+    progressed = []
+    results = import_tables(
+        path, chunk_size=1, on_progress=lambda table, stats: progressed.append(table),
+        # Cancel once the family details sheet is part-way through
+        is_cancelled=lambda: "collateral_family_details" in progressed,
+    )
+    assert results["loan_info"]["inserted"] == 1
+    assert results["collateral_family_details"]["cancelled"]
+    assert "guranteer_details" not in results
+    assert rows("collateral_family_details", "id") == []
+
+
+def test_bulk_template_round_trip(members, tmp_path):
+    workbook = ExcelHandler.generate_bulk_template()
+    assert workbook.sheetnames[:-1] == [
+        "Loans", "Collateral Properties", "Family Details", "Guarantors", "Approvals",
+    ]
+    assert len(IMPORT_ORDER) == len(workbook.sheetnames) - 1
+    sheet = workbook["Loans"]
+    headers = [cell.value for cell in sheet[6]]
+    row = {"Member Number": "1", "Loan Type": "x", "Loan Amount": "100"}
+    sheet.append([row.get(header) for header in headers])
+    path = tmp_path / "template.xlsx"
+    workbook.save(path)
+
+    results = import_tables(path)
+    assert results["loan_info"]["inserted"] == 1
+    assert all(not stats["error_count"] for stats in results.values())
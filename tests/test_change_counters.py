@@ -0,0 +1,46 @@
+# tests/test_change_counters.py
+import pytest
+
+from models.change_counter_model import fetch_change_versions
+from models.database import transaction
+
+TABLES = ("loan_info", "approval_info", "member_info")
+
+
+def write(sql):
+    with transaction() as conn:
+        conn.execute(sql)
+
+
+def bumped(sql):
+    """Which of TABLES' counters moved when sql ran."""
+    before = fetch_change_versions(TABLES)
+    write(sql)
+    after = fetch_change_versions(TABLES)
+    return [table for table, old, new in zip(TABLES, before, after) if new != old]
+
+
+@pytest.fixture
+def loan_without_member(database):
+    write("INSERT INTO loan_info (member_number, loan_type, status) VALUES ('000000002', 'x', 'pending')")
+
+
+@pytest.mark.parametrize("sql, tables", [
+    ("INSERT INTO loan_info (member_number, status) VALUES ('000000001', 'pending')", ["loan_info"]),
+    ("UPDATE loan_info SET status = 'approved'", ["loan_info"]),
+    ("INSERT INTO approval_info (member_number) VALUES ('000000002')", ["approval_info"]),
+    # The loan's member appears: the views show its name now
+    ("INSERT INTO member_info (member_number, member_name) VALUES ('000000002', 'Sita')", ["member_info"]),
+    # A member without loans (a bulk member import) wakes nothing
+    ("INSERT INTO member_info (member_number, member_name) VALUES ('000000003', 'Hari')", []),
+])
+def test_writes_bump_their_table(loan_without_member, sql, tables):
+    assert bumped(sql) == tables
+
+
+def test_member_renames_renumbers_and_deletes(loan_without_member):
+    write("INSERT INTO member_info (member_number, member_name) VALUES ('000000003', 'Hari')")
+    assert bumped("UPDATE member_info SET member_name = 'Hari Prasad'") == ["member_info"]
+    assert bumped("UPDATE member_info SET member_number = '000000002'") == ["member_info"]
+    assert bumped("UPDATE member_info SET phone = '9841234567'") == []
+    assert bumped("DELETE FROM member_info") == ["member_info"]
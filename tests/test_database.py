@@ -0,0 +1,106 @@
+# tests/test_database.py
+import pytest
+
+from models.database import connection_manager, get_connection, transaction
+
+
+@pytest.fixture
+def conn(database):
+    conn = connection_manager.connection()
+    conn.execute("CREATE TABLE t (v TEXT)")
+    conn.commit()
+    return conn
+
+
+def values():
+    return [row[0] for row in connection_manager.connection().execute("SELECT v FROM t ORDER BY rowid")]
+
+
+def insert(conn, value):
+    conn.execute("INSERT INTO t (v) VALUES (?)", (value,))
+
+
+def test_nested_blocks_commit_with_the_outermost(conn):
+    with transaction():
+        insert(conn, "outer")
+        with transaction():
+            insert(conn, "inner")
+        assert conn.in_transaction
+    assert not conn.in_transaction
+    assert values() == ["outer", "inner"]
+
+
+def test_a_failing_inner_block_rolls_back_only_itself(conn):
+    with transaction():
+        insert(conn, "outer")
+        with pytest.raises(ValueError):
+            with transaction():
+                insert(conn, "inner")
+                raise ValueError
+        insert(conn, "after")
+    assert values() == ["outer", "after"]
+
+
+def test_a_failing_outer_block_rolls_back_everything(conn):
+    with pytest.raises(ValueError):
+        with transaction():
+            with transaction():
+                insert(conn, "inner")
+            raise ValueError
+    assert values() == []
+    assert not connection_manager.in_transaction_block()
+
+
+def test_commit_and_close_wait_for_the_block(conn):
+    with pytest.raises(ValueError):
+        with transaction():
+            helper = get_connection()
+            insert(helper, "helper")
+            helper.commit()
+            helper.close()
+            raise ValueError
+    assert values() == []
+
+
+def test_rollback_inside_a_block_undoes_that_block_only(conn):
+    with transaction():
+        insert(conn, "outer")
+        with transaction():
+            helper = get_connection()
+            insert(helper, "discarded")
+            helper.rollback()
+            insert(helper, "kept")
+        assert conn.in_transaction
+    assert values() == ["outer", "kept"]
+
+
+def test_rollback_in_the_outermost_block_keeps_the_block_open(conn):
+    with transaction():
+        insert(conn, "discarded")
+        get_connection().rollback()
+        insert(conn, "kept")
+    assert values() == ["kept"]
+
+
+def test_transaction_discards_leftover_writes(conn, caplog):
+    insert(get_connection(), "leftover")
+    with transaction():
+        insert(conn, "mine")
+    assert values() == ["mine"]
+    assert "Rolling back uncommitted writes" in caplog.text
+
+
+def test_get_connection_discards_leftover_writes(conn):
+    insert(get_connection(), "leftover")
+    mine = get_connection()
+    insert(mine, "mine")
+    mine.commit()
+    assert values() == ["mine"]
+
+
+def test_get_connection_keeps_a_live_callers_writes(conn):
+    caller = get_connection()
+    insert(caller, "caller")
+    get_connection().execute("SELECT 1")
+    caller.commit()
+    assert values() == ["caller"]
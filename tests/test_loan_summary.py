@@ -0,0 +1,75 @@
+# tests/test_loan_summary.py
+"""loan_summary, kept by triggers, must match the joins it replaces."""
+import pytest
+
+from models.database import transaction
+
+# Recomputed from scratch: the member's latest approval, none on a pending loan
+RECOMPUTED = """
+    WITH latest AS (
+        SELECT member_number, approved_loan_amount, REPLACE(approval_date, '/', '-') AS approval_date,
+               ROW_NUMBER() OVER (PARTITION BY member_number ORDER BY id DESC) AS n
+        FROM approval_info
+    )
+    SELECT l.id, l.member_number, m.id, m.member_name, l.loan_type, l.loan_amount, l.status,
+           CASE WHEN l.status = 'pending' THEN NULL ELSE a.approved_loan_amount END,
+           CASE WHEN l.status = 'pending' THEN NULL ELSE a.approval_date END
+    FROM loan_info l
+    LEFT JOIN member_info m ON m.member_number = l.member_number
+    LEFT JOIN latest a ON a.member_number = l.member_number AND a.n = 1
+    ORDER BY l.id
+"""
+
+SUMMARY = """
+    SELECT loan_id, member_number, member_id, member_name, loan_type, loan_amount, status,
+           approved_loan_amount, approval_date
+    FROM loan_summary ORDER BY loan_id
+"""
+
+STEPS = [
+    ("loan inserts", [
+        "INSERT INTO loan_info (member_number, loan_type, loan_amount, status) VALUES ('000000001', 'x', '100', 'approved')",
+        "INSERT INTO loan_info (member_number, loan_type, loan_amount, status) VALUES ('000000001', 'y', '200', 'pending')",
+        "INSERT INTO loan_info (member_number, loan_type, loan_amount, status) VALUES ('000000002', 'x', '300', 'approved')",
+        "INSERT INTO loan_info (member_number, loan_type, loan_amount, status) VALUES ('000000009', 'x', '400', 'approved')",
+    ]),
+    ("approval inserts", [
+        "INSERT INTO approval_info (member_number, approval_date, approved_loan_amount) VALUES ('000000001', '2081/01/05', '100')",
+        "INSERT INTO approval_info (member_number, approval_date, approved_loan_amount) VALUES ('000000001', '2081/02/05', '90')",
+        "INSERT INTO approval_info (member_number, approval_date, approved_loan_amount) VALUES ('000000002', '2081-03-05', '300')",
+    ]),
+    ("pending loan approved", ["UPDATE loan_info SET status = 'approved' WHERE loan_type = 'y'"]),
+    ("approved loan back to pending", ["UPDATE loan_info SET status = 'pending' WHERE loan_amount = '100'"]),
+    ("loan moved to another member", ["UPDATE loan_info SET member_number = '000000002' WHERE loan_type = 'y'"]),
+    ("approval edited", ["UPDATE approval_info SET approved_loan_amount = '95', approval_date = '2081/02/06' WHERE approved_loan_amount = '90'"]),
+    ("approval moved to another member", ["UPDATE approval_info SET member_number = '000000002' WHERE approved_loan_amount = '95'"]),
+    ("latest approval deleted", ["DELETE FROM approval_info WHERE approved_loan_amount = '95'"]),
+    ("loan deleted", ["DELETE FROM loan_info WHERE loan_amount = '300'"]),
+    ("member renamed", ["UPDATE member_info SET member_name = 'Sita Sharma' WHERE member_number = '000000002'"]),
+    ("missing member added", ["INSERT INTO member_info (member_number, member_name) VALUES ('000000009', 'Hari')"]),
+    ("every approval deleted", ["DELETE FROM approval_info"]),
+]
+
+
+@pytest.fixture
+def members(add_members):
+    add_members(("000000001", "Ram"), ("000000002", "Sita"))
+
+
+def test_summary_matches_the_recomputed_select_after_every_change(members):
+    for label, statements in STEPS:
+        with transaction() as conn:
+            for sql in statements:
+                conn.execute(sql)
+        assert conn.execute(SUMMARY).fetchall() == conn.execute(RECOMPUTED).fetchall(), label
+
+
+def test_a_pending_loan_shows_no_approval(members):
+    with transaction() as conn:
+        for sql in STEPS[0][1] + STEPS[1][1]:
+            conn.execute(sql)
+    rows = conn.execute(
+        "SELECT status, approved_loan_amount, approval_date FROM loan_summary WHERE member_number = '000000001' ORDER BY loan_id"
+    ).fetchall()
+    # The member's latest approval goes on the approved loan, not the pending one
+    assert rows == [("approved", "90", "2081-02-05"), ("pending", None, None)]
@@ -0,0 +1,135 @@
+# tests/test_member_import.py
+import sqlite3
+
+import pytest
+
+from models.database import get_connection
+from services.member_import import (
+    _existing_numbers, file_key, import_members, load_checkpoint, normalize_member_number, normalize_value,
+    upsert_members,
+)
+from services.member_lookup import search_member_numbers
+from services.member_validation import DUPLICATE_IN_FILE
+
+HEADER = ["member_number", "member_name", "phone", "ward_no"]
+
+
+def stored_members():
+    return dict(get_connection().execute("SELECT member_number, member_name FROM member_info").fetchall())
+
+
+@pytest.mark.parametrize("value, expected", [
+    (5.0, "000000005"), ("42", "000000042"), (" 000000007 ", "000000007"), ("A-12", "A-12"), (None, None),
+])
+def test_normalize_member_number(value, expected):
+    assert normalize_member_number(value) == expected
+
+
+def test_normalize_value():
+    assert normalize_value(9841234567.0) == "9841234567"
+    assert normalize_value("  ") is None
+    assert normalize_value(2.5) == "2.5"
+
+
+def test_import_reads_the_template_layout(database, write_workbook):
+    rows = [["MEMBER IMPORT TEMPLATE"], [], [], [], [],
+            ["Member Number", "Member Name", "Phone"],
+            ["Type: Text (Unique, Required)", "Type: Text (Required)", "Type: Number (10 digits)"],
+            [1, "Ram Thapa", 9841234567.0],
+            [],
+            ["000000002", "राम थापा", "९८४१२३४५६७"]]
+    stats = import_members(write_workbook("template.xlsx", {"Member Import": rows}))
+    assert (stats["inserted"], stats["skipped"], stats["rows_read"]) == (2, 0, 2)
+    assert stored_members() == {"000000001": "Ram Thapa", "000000002": "राम थापा"}
+
+
+def test_bad_rows_are_skipped_with_the_cells_named(database, write_workbook):
+    path = write_workbook("members.xlsx", {"Members": [
+        HEADER,
+        [1, "Ram", "98412", "3"],
+        [2, None, None, "40"],
+        [3, "Sita", None, "32.0"],
+    ]})
+    stats = import_members(path)
+    assert stats["inserted"] == 1
+    assert stats["errors"] == [
+        (2, "phone: Phone must be 10 digits"),
+        (3, "member_name: Required; ward_no: Ward must be a whole number from 1 to 32"),
+    ]
+    assert stats["column_errors"] == {"phone": 1, "member_name": 1, "ward_no": 1}
+
+
+def test_duplicate_split_across_chunks(database, write_workbook):
+    path = write_workbook("members.xlsx", {"Members": [
+        HEADER, [1, "Ram"], [2, "Sita"], [3, "Hari"], [1, "Ram again"],
+    ]})
+    stats = import_members(path, chunk_size=2)
+    assert (stats["inserted"], stats["duplicates"]) == (3, 1)
+    assert stats["errors"] == [(5, f"member_number: {DUPLICATE_IN_FILE}")]
+    assert stored_members()["000000001"] == "Ram"
+
+
+def test_existing_members_are_left_alone(add_members, write_workbook):
+    add_members(("000000001", "Stored"))
+    stats = import_members(write_workbook("members.xlsx", {"Members": [HEADER, [1, "Ram"], [2, "Sita"]]}))
+    assert (stats["inserted"], stats["duplicates"]) == (1, 1)
+    assert stats["errors"] == [(2, "Duplicate member number")]
+    assert stored_members()["000000001"] == "Stored"
+
+
+def test_existing_numbers_stays_under_old_sqlite_parameter_limit(add_members):
+    add_members(*[(f"{i:09d}", "x") for i in range(0, 3000, 3)])
+    conn = sqlite3.connect(get_connection().execute("PRAGMA database_list").fetchone()[2])
+    conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    try:
+        existing = _existing_numbers(conn, [f"{i:09d}" for i in range(3000)])
+    finally:
+        conn.close()
+    assert len(existing) == 1000
+
+
+def test_cancelled_import_rolls_back(database, write_workbook):
+    path = write_workbook("members.xlsx", {"Members": [HEADER] + [[i, f"M{i}"] for i in range(1, 7)]})
+    checks = iter([False, True])
+    stats = import_members(path, chunk_size=2, is_cancelled=lambda: next(checks, True))
+    assert stats["cancelled"]
+    assert stored_members() == {}
+
+
+def test_imported_members_are_searchable(database, write_workbook):
+    import_members(write_workbook("members.xlsx", {"Members": [HEADER, [7, "राम थापा"]]}))
+    assert search_member_numbers("ram thapa") == ["000000007"]
+
+
+def test_resumable_import_carries_on_after_cancel(database, write_workbook):
+    path = write_workbook("members.xlsx", {"Members": [HEADER] + [[i, f"M{i}"] for i in range(1, 7)]})
+    checks = iter([False, True])
+    stats = import_members(path, chunk_size=2, resumable=True, is_cancelled=lambda: next(checks, True))
+    assert stats["cancelled"] and stats["inserted"] == 2
+    assert load_checkpoint(file_key(path))["last_row"] == 3
+
+    stats = import_members(path, chunk_size=2, resumable=True)
+    assert not stats["cancelled"]
+    assert (stats["resumed_from"], stats["inserted"], stats["duplicates"]) == (3, 6, 0)
+    assert len(stored_members()) == 6
+    assert load_checkpoint(file_key(path)) is None
+
+
+def test_upsert_updates_changed_fields_only(add_members, write_workbook):
+    add_members(("000000001", "Ram"), ("000000002", "Sita"))
+    with get_connection() as conn:
+        conn.execute("UPDATE member_info SET phone = '9841234567' WHERE member_number = '000000002'")
+    path = write_workbook("roster.xlsx", {"Members": [
+        HEADER,
+        [1, "Ram Thapa", None],   # renamed
+        [2, "Sita", None],        # blank phone keeps the stored one
+        [3, "Hari", None],        # new
+    ]})
+    stats = upsert_members(path)
+    assert (stats["inserted"], stats["changed"], stats["unchanged"]) == (1, 1, 1)
+    assert stats["changes"] == [("000000001", "member_name", "Ram", "Ram Thapa")]
+    phone = get_connection().execute("SELECT phone FROM member_info WHERE member_number = '000000002'").fetchone()[0]
+    assert phone == "9841234567"
+
+    stats = upsert_members(path)
+    assert (stats["inserted"], stats["changed"], stats["unchanged"]) == (0, 0, 3)
@@ -0,0 +1,104 @@
+# tests/test_member_index.py
+import pytest
+
+from services.member_index import MemberIndex, member_index
+from services.member_import import upsert_members
+
+MEMBERS = [
+    ("000000001", "राम थापा"),
+    ("000000002", "Sita Sharma"),
+    ("000000012", "Ramesh Karki"),
+    ("000000120", "Hari Ram"),
+]
+
+
+@pytest.fixture
+def index():
+    index = MemberIndex()
+    index.load(MEMBERS)
+    return index
+
+
+def numbers(results):
+    return [member_number for member_number, _ in results]
+
+
+@pytest.mark.parametrize("typed, expected", [
+    # Names whose first word matches come first, each group by name
+    ("ra", ["000000012", "000000001", "000000120"]),
+    ("राम", ["000000012", "000000001", "000000120"]),
+    ("rame", ["000000012"]),
+    ("ram th", ["000000001"]),
+    ("shar", ["000000002"]),
+    ("xyz", []),
+    ("", []),
+])
+def test_name_prefixes(index, typed, expected):
+    assert numbers(index.search(typed)) == expected
+
+
+@pytest.mark.parametrize("typed, expected", [
+    # The exact number first, then prefixes of the number without its zeros
+    ("12", ["000000012", "000000120"]),
+    ("१२", ["000000012", "000000120"]),
+    ("000000001", ["000000001", "000000120", "000000012"]),
+    ("0000001", ["000000001", "000000120", "000000012"]),
+])
+def test_number_prefixes(index, typed, expected):
+    assert numbers(index.search(typed)) == expected
+
+
+def test_limit(index):
+    assert len(index.search("ra", limit=2)) == 2
+
+
+def test_upsert_adds_and_renames(index):
+    index.upsert("000000003", "Gita Ram")
+    index.upsert("000000002", "Sita Poudel")
+    assert numbers(index.search("gita")) == ["000000003"]
+    assert numbers(index.search("3")) == ["000000003"]
+    assert numbers(index.search("sharma")) == []
+    assert numbers(index.search("poudel")) == ["000000002"]
+    assert index.stats()["members"] == 5
+
+
+def test_remove(index):
+    index.remove("000000012")
+    assert numbers(index.search("ramesh")) == []
+    assert numbers(index.search("12")) == ["000000120"]
+    index.remove("000000999")  # unknown: ignored
+    assert index.stats()["members"] == 3
+
+
+def test_edits_wait_for_the_index_to_load():
+    index = MemberIndex()
+    index.upsert("000000001", "Ram")
+    assert not index.loaded
+    assert index.stats()["members"] == 0
+
+
+def test_edits_made_while_loading_are_kept():
+    index = MemberIndex()
+
+    def rows():
+        yield MEMBERS[0]
+        # Saved on another thread while the index is being rebuilt
+        index.upsert("000000005", "Gita")
+        index.remove("000000002")
+        yield MEMBERS[1]
+
+    assert index.load(rows()) == 2
+    assert numbers(index.search("gita")) == ["000000005"]
+    assert numbers(index.search("sita")) == []
+
+
+def test_an_import_refreshes_the_loaded_index(add_members, write_workbook):
+    add_members(("000000001", "Ram"))
+    member_index.load()
+    try:
+        path = write_workbook("members.xlsx", {"Members": [["member_number", "member_name"], [1, "Ram"], [7, "Gita"]]})
+        upsert_members(path)
+        assert member_index.loaded
+        assert numbers(member_index.search("gita")) == ["000000007"]
+    finally:
+        member_index.invalidate()
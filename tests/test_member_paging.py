@@ -0,0 +1,107 @@
+# tests/test_member_paging.py
+import pytest
+
+from models.database import transaction
+from models.member_model import count_members, fetch_member_page
+
+
+def all_pages(limit=2, **kwargs):
+    """Every page of fetch_member_page, following the keyset from page to page."""
+    pages, after = [], None
+    while True:
+        page = [member["member_number"] for member in fetch_member_page(after=after, limit=limit, **kwargs)]
+        if not page:
+            return pages
+        pages.append(page)
+        after = page[-1]
+
+
+@pytest.fixture
+def members(database):
+    with transaction() as conn:
+        conn.executemany("INSERT INTO member_info (member_number, member_name, phone) VALUES (?, ?, ?)", [
+            ("000000001", "Sita", "9841000003"),
+            ("000000002", "Ram", None),
+            ("000000003", "Hari", "9841000001"),
+            ("000000004", "Ram", "9841000002"),
+            ("000000005", "Gita", None),
+        ])
+
+
+def test_pages_by_member_number(members):
+    assert all_pages() == [["000000001", "000000002"], ["000000003", "000000004"], ["000000005"]]
+    assert all_pages(descending=True) == [["000000005", "000000004"], ["000000003", "000000002"], ["000000001"]]
+
+
+def test_pages_by_another_column_break_ties_on_member_number(members):
+    # Two Rams: the page boundary falls between them
+    assert all_pages(limit=3, order_by="member_name") == [["000000005", "000000003", "000000002"], ["000000004", "000000001"]]
+    assert all_pages(limit=3, order_by="member_name", descending=True) == [
+        ["000000001", "000000004", "000000002"], ["000000003", "000000005"],
+    ]
+
+
+def test_empty_values_sort_first(members):
+    assert sum(all_pages(order_by="phone"), []) == ["000000002", "000000005", "000000003", "000000004", "000000001"]
+
+
+def test_unknown_sort_column(members):
+    with pytest.raises(ValueError):
+        fetch_member_page(order_by="member_name; DROP TABLE member_info")
+
+
+@pytest.fixture(params=["fts", "like"])
+def roster(request, database):
+    """25 members, searched through the FTS index or (without one) with LIKE."""
+    with transaction() as conn:
+        conn.executemany("INSERT INTO member_info (member_number, member_name, address) VALUES (?, ?, ?)", [
+            (f"{i:09d}", ("राम " if i % 2 else "Sita ") + str(i), "Kathmandu" if i % 5 else "Pokhara")
+            for i in range(1, 26)
+        ])
+        if request.param == "like":
+            conn.execute("DROP TABLE IF EXISTS member_search")
+
+
+def numbers(*members):
+    return [f"{i:09d}" for i in members]
+
+
+@pytest.mark.parametrize("limit, sizes", [(5, [5] * 5), (10, [10, 10, 5]), (25, [25]), (30, [25])])
+def test_page_boundaries(roster, limit, sizes):
+    pages = all_pages(limit=limit)
+    assert [len(page) for page in pages] == sizes
+    assert sum(pages, []) == numbers(*range(1, 26))
+
+
+def test_after_the_last_member_is_empty(roster):
+    assert fetch_member_page(after="000000025") == []
+    assert fetch_member_page(after="999999999") == []
+    # A member_number that isn't stored still pages from where it would be
+    assert [m["member_number"] for m in fetch_member_page(after="000000020x")] == numbers(21, 22, 23, 24, 25)
+
+
+@pytest.mark.parametrize("keyword, expected", [
+    (None, list(range(1, 26))),
+    ("", list(range(1, 26))),
+    ("ram", list(range(1, 26, 2))),
+    ("Ram", list(range(1, 26, 2))),
+    ("राम", list(range(1, 26, 2))),
+    ("sita pokhara", [10, 20]),
+    ("ram pokhara", [5, 15, 25]),
+    ("ram 1", [1, 11, 13, 15, 17, 19]),
+    ("pokhara", [5, 10, 15, 20, 25]),
+    # The member number, with or without its zeros, or in Nepali digits
+    ("7", [7]),
+    ("०००००००७", [7]),
+    ("nobody", []),
+])
+def test_keyword_filters(roster, keyword, expected):
+    assert count_members(keyword) == len(expected)
+    assert sum(all_pages(limit=4, keyword=keyword), []) == numbers(*expected)
+
+
+def test_filters_combine_with_the_sort_order(roster):
+    pages = all_pages(limit=2, keyword="pokhara", order_by="member_name", descending=True)
+    names = sorted(["राम 5", "Sita 10", "राम 15", "Sita 20", "राम 25"], reverse=True)
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert sum(pages, []) == [f"{int(name.split()[1]):09d}" for name in names]
@@ -0,0 +1,110 @@
+# tests/test_member_validation.py
+import pandas as pd
+import pytest
+
+from services.member_validation import (
+    DUPLICATE_IN_FILE, bs_month_lengths, describe_errors, error_rows, validate_frame, validate_members,
+)
+
+
+def member_frame(**columns):
+    """One-column-per-field frame of member rows; member_number/name default to valid values."""
+    rows = len(next(iter(columns.values())))
+    columns.setdefault("member_number", [f"{i + 1:09d}" for i in range(rows)])
+    columns.setdefault("member_name", ["Ram"] * rows)
+    return pd.DataFrame(columns)
+
+
+@pytest.mark.parametrize("ward, valid", [
+    ("1", True), ("32", True), ("32.0", True), ("३२", True), (" 7 ", True),
+    ("33", False), ("0", False), ("3.5", False), ("ward 3", False),
+])
+def test_ward(ward, valid):
+    errors = validate_members(member_frame(ward_no=[ward]))
+    assert (errors.at[0, "ward_no"] == "") is valid
+
+
+@pytest.mark.parametrize("phone, valid", [
+    ("9841234567", True), ("९८४१२३४५६७", True), ("98-4123 4567", True),
+    ("984123456", False), ("98412345678", False), ("98412x4567", False),
+])
+def test_phone(phone, valid):
+    errors = validate_members(member_frame(phone=[phone]))
+    assert (errors.at[0, "phone"] == "") is valid
+
+
+def test_bs_month_lengths_come_from_the_calendar():
+    lengths = bs_month_lengths()
+    assert lengths[208101] == 31
+    assert lengths[208102] == 32
+    assert all(29 <= days <= 32 for days in lengths.values())
+
+
+@pytest.mark.parametrize("dob, valid", [
+    ("2081-02-32", True),   # Jestha 2081 has 32 days
+    ("2081-01-32", False),  # Baisakh 2081 has 31
+    ("2081-02-33", False),
+    ("2081-02-00", False),
+    ("2081/2/5", True),
+    ("२०८१-०२-३२", True),
+    ("2081-13-01", False),
+    ("1800-01-01", False),  # outside the calendar nepali_datetime knows
+    ("05-02-2081", False),
+])
+def test_bs_date(dob, valid):
+    errors = validate_members(member_frame(dob_bs=[dob]))
+    assert (errors.at[0, "dob_bs"] == "") is valid
+
+
+def test_blank_optional_cells_are_not_checked():
+    errors = validate_members(member_frame(phone=[None], ward_no=[None], dob_bs=[None]))
+    assert not error_rows(errors).any()
+
+
+def test_required_fields():
+    frame = member_frame(member_number=[None, "000000002"], member_name=["Ram", None])
+    errors = validate_members(frame)
+    assert errors.at[0, "member_number"] == "Required"
+    assert errors.at[1, "member_name"] == "Required"
+
+
+def test_duplicate_within_frame_keeps_first():
+    errors = validate_members(member_frame(member_number=["000000001", "000000002", "000000001"]))
+    assert list(errors["member_number"]) == ["", "", DUPLICATE_IN_FILE]
+
+
+def test_duplicate_of_an_earlier_chunk():
+    first_chunk = member_frame(member_number=["000000001", "000000002"])
+    seen = set(first_chunk["member_number"])
+    errors = validate_members(member_frame(member_number=["000000003", "000000002"]), seen)
+    assert list(errors["member_number"]) == ["", DUPLICATE_IN_FILE]
+
+
+def test_a_cell_keeps_its_first_problem():
+    errors = validate_members(member_frame(member_number=[None, None]))
+    # A missing number is "Required", not also a duplicate of the other blank
+    assert list(errors["member_number"]) == ["Required", "Required"]
+
+
+def test_describe_errors_names_each_bad_cell():
+    errors = validate_members(member_frame(phone=["123"], ward_no=["40"]))
+    message = describe_errors(errors.iloc[0])
+    assert "phone: Phone must be 10 digits" in message
+    assert "ward_no: Ward must be a whole number from 1 to 32" in message
+
+
+@pytest.mark.parametrize("amount, valid", [
+    ("100000", True), ("1,00,000", True), ("१,००,०००", True), ("2500.50", True),
+    ("-5", False), ("1e5", False), ("ten", False),
+])
+def test_amount_rule(amount, valid):
+    frame = pd.DataFrame({"loan_amount": [amount]})
+    errors = validate_frame(frame, checks={"loan_amount": "amount"})
+    assert (errors.at[0, "loan_amount"] == "") is valid
+
+
+def test_validate_frame_skips_columns_the_frame_lacks():
+    frame = pd.DataFrame({"member_number": ["000000001"]})
+    errors = validate_frame(frame, required=("member_number", "loan_type"), checks={"phone": "phone"})
+    assert list(errors.columns) == ["member_number"]
+    assert not error_rows(errors).any()
@@ -0,0 +1,104 @@
+# tests/test_query_plans.py
+"""Every hot per-member query must use an index, not a full table SCAN.
+
+Builds a throwaway database from the migrations, calls the real
+fetch/check functions with SQLite statement tracing switched on, and runs
+EXPLAIN QUERY PLAN on every SELECT they issue.
+"""
+import re
+
+import pytest
+
+from models.database import connection_manager, initialize_db, set_database_path
+
+SAMPLE_MEMBER = "000000001"
+
+# FTS5 tables report "SCAN <alias> VIRTUAL TABLE INDEX ..." for index lookups;
+# the schema table (probed for optional tables) is a few dozen rows
+FULL_SCAN = re.compile(r"^SCAN (TABLE )?(?!sqlite_master\b)(?P<table>\w+)\b(?! USING (COVERING )?INDEX| VIRTUAL TABLE)")
+
+
+def hot_calls():
+    """(label, callable) pairs for the per-member code paths we care about."""
+    from services import report_fetchers as rf
+    from models import loan_model
+    from models.report_tracking_model import fetch_all_report_logs
+    from models.witness_model import fetch_witnesses
+    from models.project_model import fetch_projects_by_member
+    from services.member_lookup import fetch_member_data, fetch_members_matching
+    from models.member_model import count_members, fetch_member_page
+    from models.change_counter_model import fetch_change_versions
+
+    m = SAMPLE_MEMBER
+    return [
+        ("fetch_member_info", lambda: rf.fetch_member_info(m)),
+        ("fetch_loan_info", lambda: rf.fetch_loan_info(m)),
+        ("fetch_collateral_basic", lambda: rf.fetch_collateral_basic(m)),
+        ("fetch_collateral_properties", lambda: rf.fetch_collateral_properties(m)),
+        ("fetch_collateral_affiliations", lambda: rf.fetch_collateral_affiliations(m)),
+        ("fetch_collateral_family_details", lambda: rf.fetch_collateral_family_details(m)),
+        ("fetch_income_expense", lambda: rf.fetch_income_expense(m)),
+        ("fetch_project_detail", lambda: rf.fetch_project_detail(m)),
+        ("fetch_approval_info", lambda: rf.fetch_approval_info(m)),
+        ("fetch_witness_detail", lambda: rf.fetch_witness_detail(m)),
+        ("fetch_guarantor_details", lambda: rf.fetch_guarantor_details(m)),
+        ("check_collateral_basic", lambda: loan_model.check_collateral_basic(m)),
+        ("check_collateral_properties", lambda: loan_model.check_collateral_properties(m)),
+        ("check_collateral_projects", lambda: loan_model.check_collateral_projects(m)),
+        ("check_collateral_affiliations", lambda: loan_model.check_collateral_affiliations(m)),
+        ("check_collateral_income_expense", lambda: loan_model.check_collateral_income_expense(m)),
+        ("check_collateral_family_details", lambda: loan_model.check_collateral_family_details(m)),
+        ("fetch_loan_info_members", loan_model.fetch_loan_info_members),
+        ("fetch_loan_info_members(filtered)", lambda: loan_model.fetch_loan_info_members(
+            status="approved", loan_type="x", approval_date_from="2082-01-01", approval_date_to="2082-12-30")),
+        ("fetch_all_report_logs(date)", lambda: fetch_all_report_logs(date_filter="2082-01-01")),
+        ("fetch_witnesses", lambda: fetch_witnesses(m)),
+        ("fetch_projects_by_member", lambda: fetch_projects_by_member(m)),
+        ("fetch_members_matching", lambda: fetch_members_matching("राम")),
+        ("fetch_members_matching(number)", lambda: fetch_members_matching("1")),
+        ("fetch_member_data", lambda: fetch_member_data("राम")),
+        ("fetch_member_page", lambda: fetch_member_page(after=m)),
+        ("fetch_member_page(keyword)", lambda: fetch_member_page(keyword="राम")),
+        ("fetch_member_page(descending)", lambda: fetch_member_page(after=m, descending=True)),
+        ("count_members(keyword)", lambda: count_members("राम")),
+        ("fetch_pending_loans", loan_model.fetch_pending_loans),
+        ("fetch_all_loans", loan_model.fetch_all_loans),
+        ("fetch_change_versions", lambda: fetch_change_versions(("loan_info", "approval_info"))),
+    ]
+
+
+HOT_CALLS = dict(hot_calls())
+
+
+def traced_selects(conn, call):
+    """Run call once and return the SELECTs it executed."""
+    traced = []
+    conn.set_trace_callback(traced.append)
+    try:
+        call()
+    finally:
+        conn.set_trace_callback(None)
+    return [sql for sql in traced if sql.lstrip().upper().startswith("SELECT")]
+
+
+def full_scans(conn, sql):
+    """(plan details, the details that are full table scans) for one statement."""
+    details = [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+    return details, [d for d in details if FULL_SCAN.match(d)]
+
+
+@pytest.fixture(scope="module")
+def conn(tmp_path_factory):
+    set_database_path(tmp_path_factory.mktemp("query_plans") / "query_plan_check.db")
+    initialize_db()
+    yield connection_manager.connection()
+    connection_manager.close_all()
+
+
+@pytest.mark.parametrize("label", list(HOT_CALLS))
+def test_hot_query_uses_index(conn, label):
+    statements = traced_selects(conn, HOT_CALLS[label])
+    assert statements, f"{label}: no SELECT captured"
+    for sql in statements:
+        details, scans = full_scans(conn, sql)
+        assert not scans, f"{label} does a full table scan: {' | '.join(details)}"
@@ -0,0 +1,59 @@
+# tests/test_row_table_model.py
+import pytest
+from PyQt5.QtCore import QCoreApplication, QPersistentModelIndex, Qt
+
+from ui.widgets.row_table_model import RowTableModel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def model(app):
+    model = RowTableModel(["id", "name", "amount"])
+    model.apply_rows([(1, "Ram", "100"), (2, "Sita", "200"), (3, "Hari", "300")])
+    return model
+
+
+def shown(model):
+    return [model.row(row) for row in range(model.rowCount())]
+
+
+def record(model):
+    """Collect the model's row signals as (signal, first row, last row)."""
+    signals = []
+    model.rowsRemoved.connect(lambda parent, first, last: signals.append(("removed", first, last)))
+    model.rowsInserted.connect(lambda parent, first, last: signals.append(("inserted", first, last)))
+    model.dataChanged.connect(lambda top, bottom: signals.append(("changed", top.row(), bottom.row())))
+    return signals
+
+
+def test_unchanged_rows_emit_nothing(model):
+    signals = record(model)
+    assert model.apply_rows([(3, "Hari", "300"), (1, "Ram", "100"), (2, "Sita", "200")]) == (0, 0, 0)
+    assert signals == []
+    assert [row[0] for row in shown(model)] == [1, 2, 3]
+
+
+def test_only_differing_rows_are_touched(model):
+    signals = record(model)
+    counts = model.apply_rows([(1, "Ram", "100"), (3, "Hari", "350"), (4, "Gita", "400")])
+    assert counts == (1, 1, 1)
+    assert signals == [("removed", 1, 1), ("changed", 1, 1), ("inserted", 2, 2)]
+    assert shown(model) == [(1, "Ram", "100"), (3, "Hari", "350"), (4, "Gita", "400")]
+
+
+def test_new_rows_keep_the_sort(model):
+    model.sort(1, Qt.DescendingOrder)
+    model.apply_rows([(1, "Ram", "100"), (2, "Sita", "200"), (3, "Hari", "300"), (4, "Bina", None)])
+    assert [row[1] for row in shown(model)] == ["Sita", "Ram", "Hari", "Bina"]
+
+
+def test_persistent_indexes_follow_their_row(model):
+    selected = QPersistentModelIndex(model.index(2, 1))  # Hari
+    model.sort(1)
+    assert model.data(selected) == "Hari"
+    model.apply_rows([(2, "Sita", "200"), (3, "Hari", "300")])
+    assert model.data(selected) == "Hari"
@@ -0,0 +1,60 @@
+# tests/test_search_keys.py
+import pytest
+
+from services.member_lookup import build_match_query, search_member_numbers
+from utils.search_keys import member_keys, member_number_key, number_key, search_key, transliterate
+
+
+@pytest.mark.parametrize("devanagari, latin", [
+    ("राम थापा", "Ram Thapa"),
+    ("राम थापा", "raam thaapaa"),
+    ("कृष्ण", "Krishna"),
+    ("श्याम", "Shyam"),
+    ("ज्ञान", "Gyan"),
+])
+def test_scripts_and_spellings_fold_to_one_key(devanagari, latin):
+    assert search_key(devanagari) == search_key(latin)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("राम", "raam"),      # inherent vowel dropped at the end of a word
+    ("कृष्ण", "krishna"),  # ...but kept after a conjunct
+    ("कमल", "kamal"),
+])
+def test_transliterate(text, expected):
+    assert transliterate(text) == expected
+
+
+def test_digits_and_accents():
+    assert search_key("९८४१") == "9841"
+    assert search_key("José") == "jose"
+    assert search_key(None) == ""
+
+
+def test_a_typed_prefix_keys_to_a_prefix():
+    assert search_key("Krishna Bahadur").startswith(search_key("Krish"))
+
+
+def test_number_keys():
+    assert number_key("98-41234567") == "98 41234567 9841234567"
+    assert member_number_key("000000042") == "000000042 42"
+
+
+def test_member_keys_columns():
+    name, number, family, contact, address = member_keys(
+        "000000001", "राम थापा", "कृष्ण", None, "९८४१२३४५६७", None, "Kathmandu",
+    )
+    assert (name, number, family, contact) == ("ram thapa", "000000001 1", "krisna", "9841234567")
+    assert address == search_key("Kathmandu")
+
+
+def test_match_query_quotes_every_word_as_a_prefix():
+    assert build_match_query("ram and") == '"ram"* "and"*'
+
+
+def test_search_finds_members_in_either_script(add_members):
+    add_members(("000000001", "राम थापा"), ("000000002", "Sita Sharma"), ("000000042", "Hari"))
+    assert search_member_numbers("Ram Thapa") == ["000000001"]
+    assert search_member_numbers("सीता") == ["000000002"]
+    assert search_member_numbers("42") == ["000000042"]
+    assert search_member_numbers("४२") == ["000000042"]
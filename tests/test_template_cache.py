@@ -0,0 +1,95 @@
+# tests/test_template_cache.py
+import os
+
+import pytest
+from docx import Document
+
+from services.template_cache import TemplateCache
+
+
+def write_template(path, *paragraphs):
+    document = Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    document.save(path)
+    return path
+
+
+def text_of(path):
+    return [paragraph.text for paragraph in Document(path).paragraphs]
+
+
+@pytest.fixture
+def cache():
+    return TemplateCache()
+
+
+@pytest.fixture
+def template(tmp_path):
+    return write_template(tmp_path / "letter.docx", "Dear {{ name }},")
+
+
+def test_a_second_get_is_a_hit(cache, template):
+    cache.get(template)
+    cache.get(template)
+    assert (cache.stats()["misses"], cache.stats()["hits"]) == (1, 1)
+
+
+def test_an_edited_template_is_parsed_again(cache, template):
+    assert cache.placeholders(template) == {"name"}
+    write_template(template, "Dear {{ name }} of {{ address }},")
+    assert cache.placeholders(template) == {"name", "address"}
+    assert cache.stats()["reloads"] == 1
+
+
+def test_a_new_mtime_alone_reloads(cache, template):
+    cache.get(template)
+    st = os.stat(template)
+    os.utime(template, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    cache.get(template)
+    assert cache.stats()["reloads"] == 1
+
+
+def test_a_new_size_alone_reloads(cache, template):
+    assert cache.placeholders(template) == {"name"}
+    st = os.stat(template)
+    write_template(template, "Dear {{ name }} of {{ address }},")
+    # Same mtime as the cached version (a coarse clock, or a copy keeping it)
+    os.utime(template, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert os.stat(template).st_size != st.st_size
+    assert cache.placeholders(template) == {"name", "address"}
+
+
+def test_copies_do_not_share_state(cache, template, tmp_path):
+    first, second = cache.get(template), cache.get(template)
+    assert first.docx is not second.docx
+    first.render({"name": "Ram"})
+    second.render({"name": "Sita"})
+    first.save(tmp_path / "first.docx")
+    second.save(tmp_path / "second.docx")
+    assert text_of(tmp_path / "first.docx") == ["Dear Ram,"]
+    assert text_of(tmp_path / "second.docx") == ["Dear Sita,"]
+
+    # Rendering changed the copies only: a later get still has the placeholder
+    third = cache.get(template)
+    third.render({"name": "Hari"})
+    third.save(tmp_path / "third.docx")
+    assert text_of(tmp_path / "third.docx") == ["Dear Hari,"]
+    assert cache.placeholders(template) == {"name"}
+
+
+def test_placeholders_are_a_copy(cache, template):
+    cache.placeholders(template).add("changed")
+    assert cache.placeholders(template) == {"name"}
+
+
+def test_the_budget_evicts_the_least_recently_used(tmp_path):
+    paths = [write_template(tmp_path / f"t{i}.docx", f"{{{{ field{i} }}}}") for i in range(3)]
+    cache = TemplateCache(max_bytes=1)
+    for path in paths:
+        cache.get(path)
+    # The entry just loaded is always kept
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["evictions"] == 2
+    cache.get(paths[-1])
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,95 @@
+#tools/benchmark_bulk_import.py
+"""Time services.bulk_import on a generated branch migration.
+
+Creates N members in a throwaway database, fills the bulk template
+(ExcelHandler.generate_bulk_template) with one loan, two family members,
+one guarantor and one approval per member (plus a few rows for unknown
+members), imports it with import_tables, and reports rows/sec per table.
+A second import of the same file should insert nothing.
+
+Usage: python tools/benchmark_bulk_import.py [members]
+"""
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmark_member_search import FIRST, LAST, PLACES
+from models.database import connection_manager, get_connection, initialize_db, set_database_path, transaction
+from services.bulk_import import import_tables
+from utils.excel_handler import ExcelHandler
+
+
+def seed_members(members):
+    with transaction() as conn:
+        conn.executemany(
+            "INSERT INTO member_info (member_number, member_name) VALUES (?, ?)",
+            [(f"{i:09d}", f"Member {i}") for i in range(1, members + 1)],
+        )
+
+
+def sheet_rows(sheet, members, rng):
+    # The last 10 member numbers don't exist
+    for number in range(1, members + 11):
+        if sheet == "Loans":
+            yield {"member_number": number, "loan_type": "कृषि", "loan_amount": str(rng.randrange(10, 500) * 1000)}
+        elif sheet == "Family Details":
+            for relation in ("wife", "son"):
+                yield {"member_number": number, "name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+                       "relation": relation, "monthly_income": str(rng.randrange(0, 50) * 1000)}
+        elif sheet == "Guarantors":
+            yield {"member_number": number, "guarantor_member_number": rng.randrange(1, members + 1),
+                   "guarantor_name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+                   "guarantor_address": rng.choice(PLACES), "guarantor_ward": str(rng.randrange(1, 33)),
+                   "guarantor_phone": f"98{rng.randrange(10**8):08d}"}
+        elif sheet == "Approvals":
+            yield {"member_number": number, "approval_date": f"2081-0{rng.randrange(1, 10)}-1{rng.randrange(10)}",
+                   "approved_loan_amount": str(rng.randrange(10, 500) * 1000), "approved_by": "Manager"}
+
+
+def write_migration(path, members):
+    rng = random.Random(11)
+    workbook = ExcelHandler.generate_bulk_template()
+    for sheet in ("Loans", "Family Details", "Guarantors", "Approvals"):
+        ws = workbook[sheet]
+        headers = [cell.value.lower().replace(" ", "_") for cell in ws[6]]
+        for row in sheet_rows(sheet, members, rng):
+            ws.append([row.get(h) for h in headers])
+    workbook.save(path)
+
+
+def run(path):
+    start = time.perf_counter()
+    results = import_tables(path)
+    for table, stats in results.items():
+        print(f"  {table:26} {stats['inserted']:7} inserted, {stats['unresolved']:3} unresolved, "
+              f"{stats['already_present']:7} already present in {stats['elapsed']:5.1f}s "
+              f"({stats['rows_per_sec']:.0f} rows/sec)")
+    print(f"  total {time.perf_counter() - start:.1f}s")
+
+
+def main():
+    members = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        set_database_path(db_path)
+        initialize_db()
+        seed_members(members)
+        path = Path(tmp) / "migration.xlsx"
+        start = time.perf_counter()
+        write_migration(path, members)
+        print(f"Wrote migration for {members} members in {time.perf_counter() - start:.1f}s")
+        print("First import:")
+        run(path)
+        print("Same file again:")
+        run(path)
+        counts = {t: get_connection().execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                  for t in ("loan_info", "collateral_family_details", "guranteer_details", "approval_info")}
+        print(f"Row counts: {counts}")
+        connection_manager.close_all()
+
+
+if __name__ == "__main__":
+    main()
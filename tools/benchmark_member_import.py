@@ -0,0 +1,114 @@
+#tools/benchmark_member_import.py
+"""Time the streaming member import on a generated roster.
+
+Writes an .xlsx with N members (default 60k; a few duplicate and
+incomplete rows mixed in) in the layout of ExcelHandler.generate_template,
+imports it into a throwaway database with services.member_import, and
+reports rows/sec and the process's peak memory growth during the
+import (measured in a fresh process), which should stay flat as N grows.
+It then upserts the same file again, which should find every member
+unchanged, and times member_validation on the roster as one DataFrame.
+
+Usage: python tools/benchmark_member_import.py [members]
+"""
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import openpyxl
+import pandas as pd
+
+from benchmark_member_search import FIRST, LAST, PLACES
+from models.database import connection_manager, get_connection, initialize_db, set_database_path
+from services.member_import import (
+    import_members, member_columns, normalize_member_number, normalize_value, upsert_members,
+)
+from services.member_validation import bs_month_lengths, error_rows, validate_members
+
+TEMPLATE_HEADER_ROW = 6
+
+
+def roster_rows(members, columns):
+    rng = random.Random(7)
+    for i in range(members):
+        row = {
+            "member_number": i + 1 if i % 1000 else 1,  # every 1000th repeats member 1
+            "member_name": f"{rng.choice(FIRST)} {rng.choice(LAST)}" if i % 997 else None,
+            "address": rng.choice(PLACES),
+            "ward_no": rng.randrange(1, 33),
+            "phone": float(f"98{rng.randrange(10**8):08d}"),
+            "dob_bs": f"20{rng.randrange(20, 60)}-0{rng.randrange(1, 10)}-1{rng.randrange(10)}",
+            "father_name": f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+        }
+        yield [row.get(c) for c in columns]
+
+
+def write_roster(path, members, columns):
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Member Import")
+    for _ in range(TEMPLATE_HEADER_ROW - 1):
+        sheet.append(["MEMBER IMPORT TEMPLATE"])
+    sheet.append([c.replace("_", " ").title() for c in columns])
+    sheet.append([f"Type: {c}" for c in columns])
+    for row in roster_rows(members, columns):
+        sheet.append(row)
+    workbook.save(path)
+
+
+def time_validation(members, columns):
+    """Validate the whole roster as one DataFrame, without reading a file."""
+    records = [
+        {c: normalize_member_number(v) if c == "member_number" else normalize_value(v) for c, v in zip(columns, row)}
+        for row in roster_rows(members, columns)
+    ]
+    frame = pd.DataFrame(records, columns=columns)
+    bs_month_lengths()
+    start = time.perf_counter()
+    errors = validate_members(frame)
+    elapsed = time.perf_counter() - start
+    print(f"Validated {members} rows in {elapsed:.2f}s: {error_rows(errors).sum()} rows with errors")
+
+
+def run_import(db_path, roster):
+    """Import in this (fresh) process and print the stats."""
+    set_database_path(db_path)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    stats = import_members(roster)
+    growth = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) / 1024
+    print(f"Imported {stats['inserted']}, skipped {stats['skipped']} ({stats['duplicates']} duplicates) "
+          f"of {stats['rows_read']} rows in {stats['elapsed']:.1f}s: {stats['rows_per_sec']:.0f} rows/sec")
+    print(f"Peak memory growth during import: {growth:.1f} MiB")
+    assert get_connection().execute("SELECT COUNT(*) FROM member_info").fetchone()[0] == stats["inserted"]
+
+    stats = upsert_members(roster)
+    print(f"Upsert again: {stats['inserted']} new, {stats['changed']} changed, {stats['unchanged']} unchanged "
+          f"in {stats['elapsed']:.1f}s: {stats['rows_per_sec']:.0f} rows/sec")
+    connection_manager.close_all()
+
+
+def main():
+    if sys.argv[1:2] == ["--import"]:
+        run_import(Path(sys.argv[2]), Path(sys.argv[3]))
+        return
+    members = int(sys.argv[1]) if len(sys.argv) > 1 else 60_000
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        set_database_path(db_path)
+        initialize_db()
+        roster = Path(tmp) / "roster.xlsx"
+        start = time.perf_counter()
+        columns = member_columns(get_connection())
+        write_roster(roster, members, columns)
+        connection_manager.close_all()
+        print(f"Wrote {members} rows in {time.perf_counter() - start:.1f}s ({roster.stat().st_size / 2**20:.1f} MiB)")
+        subprocess.run([sys.executable, __file__, "--import", str(db_path), str(roster)], check=True)
+        time_validation(members, columns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#tools/benchmark_member_index.py
+"""Memory footprint and speed of the in-memory member index.
+
+Builds services.member_index.MemberIndex from N synthetic members (default
+100k, the same names as benchmark_member_search), measures the memory it
+holds with tracemalloc, replays the keystrokes of typical searches (one
+search per character typed, as the completer did before debouncing) and
+times incremental upsert/remove.
+
+Usage: python tools/benchmark_member_index.py [members]
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmark_member_search import FIRST, LAST, SEARCHES
+from services.member_index import MemberIndex
+
+
+def synthetic_rows(members):
+    rng = random.Random(7)
+    return [(f"{i:09d}", f"{rng.choice(FIRST)} {rng.choice(LAST)}") for i in range(members)]
+
+
+def main():
+    members = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = synthetic_rows(members)
+    index = MemberIndex()
+
+    start = time.perf_counter()
+    index.load(rows)
+    print(f"Loaded {members} members in {time.perf_counter() - start:.2f}s")
+
+    index.invalidate()
+    gc.collect()
+    tracemalloc.start()
+    index.load(rows)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Index memory: {current / 2**20:.1f} MiB ({current / members:.0f} bytes/member), "
+          f"peak while loading {peak / 2**20:.1f} MiB")
+    print(f"Stats: {index.stats()}")
+
+    times = []
+    for text in SEARCHES:
+        for end in range(1, len(text) + 1):
+            start = time.perf_counter()
+            index.search(text[:end])
+            times.append(time.perf_counter() - start)
+    print(f"Search: mean {sum(times) / len(times) * 1000:.2f} ms/keystroke, worst {max(times) * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    for i in range(1000):
+        index.upsert(f"{i:09d}", f"Renamed Member{i}")
+    index.remove("000000001")
+    print(f"1000 upserts + 1 remove: {(time.perf_counter() - start) * 1000:.0f} ms")
+    assert index.search("renamed member5")[0][0] == "000000005"
+    assert all(number != "000000001" for number, _ in index.search("1"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#tools/benchmark_member_search.py
+"""Time member search: the old LIKE '%kw%' query against the FTS5 index.
+
+Seeds a throwaway database with N members (default 100k), computes their
+normalized search keys, replays the keystrokes of a few typical searches
+the way LoanInfoTab.update_completer does (one query per character typed),
+and reports the mean and worst time per keystroke for each. Devanagari,
+romanized and Nepali-digit searches are included; the LIKE query simply
+misses those. Also edits and deletes members and runs FTS5's
+integrity-check to confirm the triggers keep the index in step.
+
+Usage: python tools/benchmark_member_search.py [members] [rounds]
+"""
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from models.database import connection_manager, get_connection, initialize_db, set_database_path, transaction
+from models.member_model import refresh_search_keys
+from services import member_lookup
+
+FIRST = ["राम", "सीता", "हरि", "गीता", "कृष्ण", "सरिता", "बिष्णु", "कमला", "Ram", "Sita", "Hari", "Krishna"]
+LAST = ["थापा", "श्रेष्ठ", "अधिकारी", "पौडेल", "गुरुङ", "तामाङ", "Thapa", "Shrestha", "Adhikari", "Poudel"]
+NEPALI_DIGITS = str.maketrans("0123456789", "०१२३४५६७८९")
+PLACES = ["काठमाडौं", "ललितपुर", "भक्तपुर", "पोखरा", "Kathmandu", "Lalitpur", "Pokhara"]
+
+SEARCHES = ["श्रेष्ठ", "Krishna Poudel", "000012345", "12345", "98412", "कमला थापा", "Pokhara",
+            "shrestha", "kamala thapa", "९८४१२", "पोखरा"]
+
+
+def seed(members):
+    rng = random.Random(7)
+    rows = []
+    for i in range(members):
+        rows.append((
+            f"{i:09d}",
+            f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+            f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+            f"{rng.choice(FIRST)} {rng.choice(LAST)}",
+            f"९८{rng.randrange(10**8):08d}".translate(NEPALI_DIGITS) if i % 2 else f"98{rng.randrange(10**8):08d}",
+            f"{rng.randrange(1, 78)}-{rng.randrange(10**5)}",
+            rng.choice(PLACES),
+        ))
+    with transaction() as conn:
+        conn.executemany("""
+            INSERT INTO member_info (member_number, member_name, father_name, grandfather_name, phone, citizenship_no, address)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        start = time.perf_counter()
+        keyed = refresh_search_keys(conn)
+    print(f"Computed search keys for {keyed} members in {time.perf_counter() - start:.1f}s")
+
+
+def like_search(keyword):
+    """fetch_members_matching before the FTS index."""
+    cur = get_connection().cursor()
+    cur.execute("""
+        SELECT member_number, member_name
+        FROM member_info
+        WHERE member_name LIKE ? OR member_number LIKE ?
+        ORDER BY member_name ASC
+        LIMIT 20
+    """, (f"%{keyword}%", f"%{keyword}%"))
+    return cur.fetchall()
+
+
+def replay(search, rounds):
+    """Mean and worst seconds per keystroke over every prefix of every search."""
+    times = []
+    for _ in range(rounds):
+        for text in SEARCHES:
+            for end in range(1, len(text) + 1):
+                start = time.perf_counter()
+                search(text[:end])
+                times.append(time.perf_counter() - start)
+    return sum(times) / len(times), max(times)
+
+
+def check_triggers():
+    with transaction() as conn:
+        conn.execute("UPDATE member_info SET member_name = 'Zyxwv Testname' WHERE member_number = '000000010'")
+        conn.execute("DELETE FROM member_info WHERE member_number = '000000011'")
+        conn.execute("INSERT INTO member_info (member_number, member_name) VALUES ('999999999', 'Qwerty Newmember')")
+    assert [r["member_number"] for r in member_lookup.fetch_members_matching("zyxw")] == ["000000010"]
+    assert member_lookup.fetch_members_matching("000000011") == []
+    assert member_lookup.fetch_members_matching("qwert")[0]["member_number"] == "999999999"
+    get_connection().execute("INSERT INTO member_search(member_search) VALUES ('integrity-check')")
+
+
+def main():
+    members = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        set_database_path(Path(tmp) / "bench.db")
+        initialize_db()
+        start = time.perf_counter()
+        seed(members)
+        print(f"Seeded {members} members (with FTS triggers) in {time.perf_counter() - start:.1f}s")
+        check_triggers()
+        print("Triggers keep member_search in step: ok")
+
+        for label, search in [("LIKE '%kw%'", like_search), ("FTS5 prefix", member_lookup.fetch_members_matching)]:
+            mean, worst = replay(search, rounds)
+            print(f"{label:<12} mean {mean * 1000:7.2f} ms/keystroke   worst {worst * 1000:7.2f} ms")
+        connection_manager.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#tools/benchmark_parallel_render.py
+"""Time a six-document packet rendered in-process vs. in the process pool.
+
+Builds a real report context from a throwaway database, then renders the
+packet sequentially (warm template cache) and through RenderPool with 2..N
+workers (after a warm-up packet, as in a running app). Pool start-up is
+reported separately.
+
+Usage: python tools/benchmark_parallel_render.py [rounds] [max_workers]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import logging
+logging.disable(logging.CRITICAL)
+
+from models.database import connection_manager, initialize_db, set_database_path
+from services.parallel_render import RenderPool
+from services.prepare_report_contexts import prepare_report_context
+from services.report_generation import render_document
+from benchmark_report_context import seed
+
+TEMPLATES = Path(__file__).resolve().parents[1] / "templates"
+PACKET = [
+    "loan_template.docx",
+    "template_kharkhacho_loan.docx",
+    "template_तमसुक.docx",
+    "ऋण स्वीकृत_template.docx",
+    "खाता अख्तियारी.docx",
+    "loan_template.docx",
+]
+
+
+def packet_documents(out_dir, round_no):
+    return [
+        {"doc_name": name, "template_path": str(TEMPLATES / name),
+         "output_path": os.path.join(out_dir, f"{round_no}_{i}_{name}")}
+        for i, name in enumerate(PACKET)
+    ]
+
+
+def run_sequential(context, out_dir, rounds):
+    start = time.perf_counter()
+    for r in range(rounds):
+        for doc in packet_documents(out_dir, r):
+            render_document(doc["template_path"], context, doc["output_path"])
+    return (time.perf_counter() - start) / rounds
+
+
+def run_parallel(pool, context, out_dir, rounds):
+    start = time.perf_counter()
+    for r in range(rounds):
+        for _, future in pool.submit_packet(context, packet_documents(out_dir, r)):
+            future.result()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else min(os.cpu_count() or 1, 8)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        set_database_path(Path(tmp) / "bench.db")
+        initialize_db()
+        seed(1, 10)
+        context = prepare_report_context("000000000")
+        connection_manager.close_all()
+        out_dir = os.path.join(tmp, "out")
+        os.makedirs(out_dir)
+
+        run_sequential(context, out_dir, 1)  # warm the template cache
+        sequential = run_sequential(context, out_dir, rounds)
+        print(f"CPUs: {os.cpu_count()}, documents per packet: {len(PACKET)}")
+        print(f"in-process      : {sequential * 1000:8.1f} ms/packet")
+
+        for workers in range(2, max(max_workers, 2) + 1):
+            pool = RenderPool(max_workers=workers)
+            start = time.perf_counter()
+            run_parallel(pool, context, out_dir, 1)  # start workers, warm their caches
+            cold = time.perf_counter() - start
+            warm = run_parallel(pool, context, out_dir, rounds)
+            pool.shutdown()
+            print(f"{workers} workers       : {warm * 1000:8.1f} ms/packet  "
+                  f"(speedup {sequential / warm:4.2f}x, first packet incl. start-up {cold * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
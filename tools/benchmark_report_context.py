@@ -0,0 +1,127 @@
+#tools/benchmark_report_context.py
+"""Compare the per-section report fetchers with fetch_report_sections().
+
+Seeds a throwaway database with members that have many family/property
+rows, checks both paths return the same data, then times three variants:
+the old fetch_* calls with a fresh connection each (how they used to run),
+the same calls on the pooled connection, and fetch_report_sections().
+
+Usage: python tools/benchmark_report_context.py [members] [rows_per_section] [rounds]
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from models.database import connection_manager, get_database_path, initialize_db, set_database_path, transaction
+from services import report_fetchers as rf
+
+
+def seed(members, rows_per_section):
+    with transaction() as conn:
+        for i in range(members):
+            m = f"{i:09d}"
+            conn.execute(
+                "INSERT INTO member_info (member_number, member_name, address, dob_bs) VALUES (?, ?, ?, ?)",
+                (m, f"सदस्य {i}", "काठमाडौं", "2050-01-15"),
+            )
+            conn.execute(
+                "INSERT INTO loan_info (member_number, loan_type, loan_amount, status) VALUES (?, ?, ?, 'approved')",
+                (m, "व्यापार", "१००००००"),
+            )
+            conn.execute(
+                "INSERT INTO approval_info (member_number, approval_date, approved_loan_amount) VALUES (?, ?, ?)",
+                (m, "2082-01-01", "१००००००"),
+            )
+            conn.execute("INSERT INTO collateral_basic (member_number, monthly_saving) VALUES (?, '500')", (m,))
+            conn.execute("INSERT INTO manjurinama_details (member_number, person_name) VALUES (?, 'मञ्जुर')", (m,))
+            for r in range(rows_per_section):
+                conn.execute(
+                    "INSERT INTO collateral_family_details (member_number, name, age, relation) VALUES (?, ?, ?, ?)",
+                    (m, f"परिवार {r}", str(20 + r), "छोरा"),
+                )
+                conn.execute(
+                    "INSERT INTO collateral_properties (member_number, owner_name, district, plot_no, area) VALUES (?, ?, ?, ?, ?)",
+                    (m, f"धनी {r}", "ललितपुर", str(r), "0-4-0-0"),
+                )
+                conn.execute(
+                    "INSERT INTO collateral_income_expense (member_number, field, amount, type) VALUES (?, ?, ?, ?)",
+                    (m, f"field {r}", str(r * 100), "income" if r % 2 else "expense"),
+                )
+                conn.execute("INSERT INTO loan_witness (member_number, name, age) VALUES (?, ?, '40')", (m, f"साक्षी {r}"))
+                conn.execute(
+                    "INSERT INTO guranteer_details (member_number, guarantor_name) VALUES (?, ?)", (m, f"जमानी {r}")
+                )
+
+
+def fetch_separately(member_number, connect=connection_manager.connection):
+    """What prepare_report_context did before: one call per section."""
+    conn = connect()
+    cursor = conn.execute("SELECT * FROM manjurinama_details WHERE member_number = ?", (member_number,))
+    row = cursor.fetchone()
+    manjurinama = dict(zip([d[0] for d in cursor.description], row)) if row else {}
+    return {
+        "member_info": rf.fetch_member_info(member_number),
+        "loan_info": rf.fetch_loan_info(member_number),
+        "collateral_basic": rf.fetch_collateral_basic(member_number),
+        "affiliations": rf.fetch_collateral_affiliations(member_number),
+        "properties": rf.fetch_collateral_properties(member_number),
+        "family": rf.fetch_collateral_family_details(member_number),
+        "income_expense": rf.fetch_income_expense(member_number),
+        "project_details": rf.fetch_project_detail(member_number),
+        "approval_info": rf.fetch_approval_info(member_number),
+        "witnesses": rf.fetch_witness_detail(member_number),
+        "guarantors": rf.fetch_guarantor_details(member_number),
+        "manjurinama_details": manjurinama,
+    }
+
+
+def fetch_separately_unpooled(member_number):
+    """fetch_separately() with a new connection per call, as before pooling."""
+    connect = lambda: sqlite3.connect(get_database_path())
+    pooled, rf.get_connection = rf.get_connection, connect
+    try:
+        return fetch_separately(member_number, connect)
+    finally:
+        rf.get_connection = pooled
+
+
+def time_it(func, member_numbers, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for m in member_numbers:
+            func(m)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(member_numbers)) * 1000
+
+
+def main():
+    members = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        set_database_path(Path(tmp) / "bench.db")
+        initialize_db()
+        seed(members, rows)
+        member_numbers = [f"{i:09d}" for i in range(members)]
+
+        for m in member_numbers[:10]:
+            assert fetch_separately(m) == rf.fetch_report_sections(m), f"Mismatch for member {m}"
+
+        unpooled_ms = time_it(fetch_separately_unpooled, member_numbers, rounds)
+        pooled_ms = time_it(fetch_separately, member_numbers, rounds)
+        new_ms = time_it(rf.fetch_report_sections, member_numbers, rounds)
+        connection_manager.close_all()
+
+    print(f"Members: {members}, rows per multi-row section: {rows}")
+    print(f"fetch_* calls, connection per call : {unpooled_ms:.3f} ms/member")
+    print(f"fetch_* calls, pooled connection   : {pooled_ms:.3f} ms/member")
+    print(f"fetch_report_sections              : {new_ms:.3f} ms/member")
+    print(f"Speedup vs. connection per call    : {unpooled_ms / new_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import re
-from docxtpl import DocxTemplate
 
 from services.prepare_report_contexts import prepare_report_context
+from services.template_cache import template_cache
 
 def extract_placeholders(template_path):
     """Extract all placeholders from a .docx template"""
-    doc = DocxTemplate(template_path)
-    return doc.get_undeclared_template_variables()
+    return template_cache.placeholders(template_path)
 
 
 
@@ -3,30 +3,37 @@ from PyQt5.QtWidgets import (
     QFormLayout, QLineEdit, QComboBox, QPushButton, QTableView,
     QMessageBox, QHBoxLayout, QApplication
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtSql import QSqlTableModel, QSqlDatabase, QSqlQuery
+from PyQt5.QtCore import QTimer
 from nepali_datetime import date as nepali_date
-from models.database import get_connection, get_database_path
+from models.change_counter_model import fetch_change_versions
+from models.loan_model import fetch_pending_loans
 from context import current_session
 from services.fetch_full_member_data import fetch_all_member_related_data
 from models.user_model import get_all_users, get_user_details
-from models.approval_model import save_approval_info
-from utils.converter import convert_to_nepali_digits
+from models.approval_model import approve_loans
+from utils.converter import convert_to_nepali_digits, parse_amount
 from utils.amount_to_words import convert_number_to_nepali_words
 from styles.app_styles import AppStyles
 from signal_bus import signal_bus
+from ui.batch_approval_dialog import BatchApprovalDialog
+from ui.widgets.row_table_model import RowTableModel
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+PENDING_LOAN_HEADERS = ["ID", "सदस्य नं", "सदस्यको नाम", "ऋणको प्रकार", "ऋण रकम", "ऋण रकम (शब्दमा)", "स्थिति"]
+# Tables whose change counters (migration 0005) the pending-loans list depends on
+WATCHED_TABLES = ("loan_info", "approval_info", "member_info")
+CHANGE_CHECK_INTERVAL_MS = 2000
+
 class ApprovalTab(QWidget):
     def __init__(self, username):
         super().__init__()
         self.username = username
         self.selected_member_number = None
         self.selected_loan_id = None
-        self.model = None
+        self.change_versions = None
         self.setup_ui()
         self.populate_users()
         self.load_pending_loans()
@@ -51,7 +58,7 @@ class ApprovalTab(QWidget):
 
         self.main_layout.addWidget(QLabel("📋 बाँकी ऋणहरू:"))
         self.loan_table = QTableView()
-        self.loan_table.setSelectionMode(QTableView.SingleSelection)
+        self.loan_table.setSelectionMode(QTableView.ExtendedSelection)
         self.loan_table.setSelectionBehavior(QTableView.SelectRows)
         self.loan_table.setStyleSheet(f"""
             QTableView {{
@@ -65,6 +72,10 @@ class ApprovalTab(QWidget):
                 color: white;
             }}
         """)
+        self.model = RowTableModel(PENDING_LOAN_HEADERS, parent=self)
+        self.loan_table.setModel(self.model)
+        self.loan_table.hideColumn(0)
+        self.loan_table.selectionModel().selectionChanged.connect(self.on_row_selected)
         self.loan_table.setSortingEnabled(True)
         self.main_layout.addWidget(self.loan_table)
     
@@ -176,6 +187,13 @@ class ApprovalTab(QWidget):
         """)
         self.save_button.clicked.connect(self.save_approval_info)
         button_layout.addWidget(self.save_button)
+
+        self.batch_button = QPushButton("छानिएका सबै ऋण स्वीकृत गर्नुहोस्")
+        self.batch_button.setMinimumHeight(AppStyles.BUTTON_HEIGHT)
+        self.batch_button.setToolTip("Ctrl/Shift थिचेर धेरै ऋण छान्नुहोस्")
+        self.batch_button.setStyleSheet(self.save_button.styleSheet())
+        self.batch_button.clicked.connect(self.open_batch_approval)
+        button_layout.addWidget(self.batch_button)
         button_layout.addStretch()
 
         self.main_layout.addLayout(button_layout)
@@ -184,56 +202,40 @@ class ApprovalTab(QWidget):
         outer_layout.addWidget(scroll)
 
     def setup_timer(self):
+        """Reload pending loans only when loan, approval or member data changed"""
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.load_pending_loans)
-        self.timer.start(5000)
+        self.timer.timeout.connect(self.check_for_changes)
+        self.timer.start(CHANGE_CHECK_INTERVAL_MS)
+
+    def check_for_changes(self):
+        try:
+            versions = fetch_change_versions(WATCHED_TABLES)
+        except Exception as e:
+            logging.error(f"Failed to read change counters: {e}")
+            return
+        if versions != self.change_versions:
+            self.load_pending_loans()
 
     def on_loan_added(self):
         logging.debug("Received loan_added signal")
-        self.load_pending_loans()
+        self.check_for_changes()
 
     def load_pending_loans(self):
-        for i in range(self.main_layout.count()):
-            widget = self.main_layout.itemAt(i).widget()
-            if isinstance(widget, QLabel) and widget.text().startswith("कुनै बाँकी ऋणहरू"):
-                self.main_layout.removeWidget(widget)
-                widget.deleteLater()
-
-        db = QSqlDatabase.addDatabase("QSQLITE", "approval_tab_conn")
-        db.setDatabaseName(get_database_path())
-        logging.debug(f"Database path: {get_database_path()}")
-        if not db.open():
-            QApplication.instance().activeWindow().statusBar().showMessage("त्रुटि: डाटाबेसमा जडान गर्न असफल", 3000)
-            logging.error("Failed to connect to database")
+        try:
+            # Read the counters first: a write landing mid-load is seen on the next check
+            self.change_versions = fetch_change_versions(WATCHED_TABLES)
+            rows = fetch_pending_loans()
+        except Exception as e:
+            window = QApplication.instance().activeWindow()
+            if window is not None and hasattr(window, "statusBar"):
+                window.statusBar().showMessage(f"त्रुटि: क्वेरी असफल: {e}", 3000)
+            logging.error(f"Failed to load pending loans: {e}")
             return
 
-        self.model = QSqlTableModel(self, db)
-        query = QSqlQuery(db)
-        query_str = """
-            SELECT l.id, l.member_number, m.member_name, l.loan_type, l.loan_amount, l.loan_amount_in_words, l.status
-            FROM loan_info l
-            LEFT JOIN member_info m ON l.member_number = m.member_number
-            WHERE l.status = 'pending'
-        """
-        logging.debug(f"Executing query: {query_str}")
-        if not query.exec_(query_str):
-            QApplication.instance().activeWindow().statusBar().showMessage(f"त्रुटि: क्वेरी असफल: {query.lastError().text()}", 3000)
-            logging.error(f"Query failed: {query.lastError().text()}")
-            db.close()
-            return
-
-        self.model.setQuery(query)
-        headers = ["ID", "सदस्य नं", "सदस्यको नाम", "ऋणको प्रकार", "ऋण रकम", "ऋण रकम (शब्दमा)", "स्थिति"]
-        for col, header in enumerate(headers):
-            self.model.setHeaderData(col, Qt.Horizontal, header)
-        
-        self.loan_table.setModel(self.model)
-        self.loan_table.hideColumn(0)
-        self.loan_table.resizeColumnsToContents()
-        self.loan_table.selectionModel().selectionChanged.connect(self.on_row_selected)
-
-        logging.debug(f"Rows fetched: {self.model.rowCount()}")
-        db.close()
+        removed, changed, inserted = self.model.apply_rows(rows)
+        if removed or changed or inserted:
+            self.loan_table.resizeColumnsToContents()
+        logging.debug(f"Pending loans: {len(rows)} ({inserted} new, {changed} changed, {removed} removed)")
 
     def on_row_selected(self):
         selected = self.loan_table.selectionModel().selectedRows()
@@ -241,10 +243,10 @@ class ApprovalTab(QWidget):
             self.clear_form()
             return
         
-        row = selected[0].row()
-        self.selected_loan_id = self.model.data(self.model.index(row, 0))
-        self.selected_member_number = self.model.data(self.model.index(row, 1))
-        loan_amount = self.model.data(self.model.index(row, 4))
+        loan = self.model.row(selected[0].row())
+        self.selected_loan_id = loan[0]
+        self.selected_member_number = loan[1]
+        loan_amount = self.model.data(self.model.index(selected[0].row(), 4))
         self.approved_loan_amount.setText(loan_amount)
         current_bs_date = nepali_date.today().strftime("%Y-%m-%d")
         self.approval_date.setText(current_bs_date)
@@ -263,9 +265,12 @@ class ApprovalTab(QWidget):
             if not amount:
                 self.approved_loan_amount_words.setText("")
                 return
-            amount_int = int(amount.replace(",", ""))
-            nepali_digits = convert_to_nepali_digits(amount_int)
-            nepali_words = convert_number_to_nepali_words(amount_int)
+            parsed = parse_amount(amount)
+            if parsed is None:
+                raise ValueError(amount)
+            # As typed (so '1500.0' can go on to '1500.05'); approve_loans tidies it
+            nepali_digits = convert_to_nepali_digits(parsed)
+            nepali_words = convert_number_to_nepali_words(int(parsed))
             self.approved_loan_amount.setText(nepali_digits)
             self.approved_loan_amount_words.setText(nepali_words)
         except ValueError:
@@ -293,6 +298,26 @@ class ApprovalTab(QWidget):
         current_session["approved_by"] = self.approved_by.currentText()
         current_session["approved_by_post"] = post
 
+    def approval_fields(self):
+        return {
+            "approval_date": self.approval_date.text().strip(),
+            "entered_by": self.entered_by.currentText(),
+            "entered_designation": self.entered_designation.text(),
+            "approved_by": self.approved_by.currentText(),
+            "approved_designation": self.designation.text(),
+        }
+
+    def after_approval(self, approved):
+        """Refresh once for the whole batch: one signal, one reload"""
+        member_numbers = {str(a["member_number"]) for a in approved}
+        # An empty string tells listeners many members changed (caches drop everything once)
+        signal_bus.member_data_changed.emit(member_numbers.pop() if len(member_numbers) == 1 else "")
+        if len(approved) == 1:
+            current_session["approved_loan_amount"] = approved[0]["approved_loan_amount"]
+            current_session["approved_loan_amount_words"] = approved[0]["approved_loan_amount_words"]
+        self.load_pending_loans()
+        self.clear_form()
+
     def save_approval_info(self):
         if not self.selected_member_number or not self.selected_loan_id:
             msg = QMessageBox()
@@ -300,71 +325,38 @@ class ApprovalTab(QWidget):
             msg.warning(self, "डाटा हराइरहेको", "कृपया तालिकाबाट ऋण छान्नुहोस्।")
             return
         try:
-            # Validate amount
             amount_raw = self.approved_loan_amount.text().strip()
-            if not amount_raw or not amount_raw.replace(",", "").isdigit():
-                msg = QMessageBox()
-                msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
-                msg.warning(self, "अमान्य रकम", "कृपया मान्य संख्यात्मक रकम प्रविष्ट गर्नुहोस्।")
-                return
-
-            # Get loan_type for the selected loan
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT loan_type FROM loan_info
-                WHERE id = ? AND member_number = ? AND status = 'pending'
-            """, (self.selected_loan_id, self.selected_member_number))
-            result = cursor.fetchone()
-            if not result:
-                conn.close()
-                raise ValueError("चयन गरिएको ऋण फेला परेन वा पहिले नै स्वीकृत/रद्द गरिएको छ।")
-            loan_type = result[0].strip()
-            logging.debug(f"Saving approval for loan_id {self.selected_loan_id}, member_number {self.selected_member_number}, type: '{loan_type}'")
-
-            # Proceed with approval (validation removed)
-            approved_nep = convert_to_nepali_digits(amount_raw)
-            approved_words = convert_number_to_nepali_words(int(amount_raw.replace(",", "")))
-
-            data = {
-                "member_number": self.selected_member_number,
-                "approval_date": self.approval_date.text().strip(),
-                "entered_by": self.entered_by.currentText(),
-                "entered_designation": self.entered_designation.text(),
-                "approved_by": self.approved_by.currentText(),
-                "approved_designation": self.designation.text(),
-                "approved_loan_amount": approved_nep,
-                "approved_loan_amount_words": approved_words
-            }
-
-            logging.debug(f"Saving approval data: {data}")
-            save_approval_info(data)
-            cursor.execute("""
-                UPDATE loan_info
-                SET status = 'approved'
-                WHERE id = ? AND member_number = ? AND status = 'pending'
-            """, (self.selected_loan_id, self.selected_member_number))
-            conn.commit()
-            conn.close()
-
-            current_session["approved_loan_amount"] = approved_nep
-            current_session["approved_loan_amount_words"] = approved_words
-
-            self.load_pending_loans()
-            self.clear_form()
+            logging.debug(f"Saving approval for loan_id {self.selected_loan_id}, member_number {self.selected_member_number}")
+            approved = approve_loans(
+                [(self.selected_loan_id, self.selected_member_number, amount_raw)], **self.approval_fields()
+            )
+            self.after_approval(approved)
 
             msg = QMessageBox()
             msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
             msg.information(self, "✅ सुरक्षित", "स्वीकृति जानकारी सुरक्षित भयो र ऋण स्थिति अद्यावधिक गरियो।")
         except ValueError as e:
-            conn.close()
             msg = QMessageBox()
             msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
             msg.warning(self, "प्रतिबन्धित", str(e))
             logging.warning(f"Approval failed: {e}")
         except Exception as e:
-            conn.close()
             msg = QMessageBox()
             msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
             msg.critical(self, "ERROR", f"स्वीकृति सुरक्षित गर्न असफल: {str(e)}")
             logging.error(f"Unexpected error during approval: {e}")
+
+    def open_batch_approval(self):
+        rows = sorted(index.row() for index in self.loan_table.selectionModel().selectedRows())
+        if not rows:
+            msg = QMessageBox()
+            msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
+            msg.warning(self, "डाटा हराइरहेको", "कृपया तालिकाबाट ऋणहरू छान्नुहोस्।")
+            return
+        loans = [self.model.row(row)[:5] for row in rows]
+        dialog = BatchApprovalDialog(loans, **self.approval_fields(), parent=self)
+        if dialog.exec_() == BatchApprovalDialog.Accepted:
+            self.after_approval(dialog.approved)
+            msg = QMessageBox()
+            msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
+            msg.information(self, "✅ सुरक्षित", f"{len(dialog.approved)} ऋण स्वीकृत भए।")
@@ -0,0 +1,85 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+    QTableWidgetItem, QHeaderView, QMessageBox
+)
+from PyQt5.QtCore import Qt
+from models.approval_model import approve_loans
+from styles.app_styles import AppStyles
+
+AMOUNT_COLUMN = 4
+
+
+class BatchApprovalDialog(QDialog):
+    """Review the approved amount of each selected pending loan and approve them together."""
+
+    def __init__(self, loans, approval_date, entered_by, entered_designation, approved_by,
+                 approved_designation, parent=None):
+        super().__init__(parent)
+        # loans: (id, member_number, member_name, loan_type, loan_amount) per selected row
+        self.loans = loans
+        self.approval_date = approval_date
+        self.entered_by = entered_by
+        self.entered_designation = entered_designation
+        self.approved_by = approved_by
+        self.approved_designation = approved_designation
+        self.approved = []
+        self.setWindowTitle("✅ सामूहिक स्वीकृति")
+        self.resize(800, 500)
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.setStyleSheet(AppStyles.get_main_stylesheet())
+        layout = QVBoxLayout(self)
+        layout.setSpacing(AppStyles.SPACING_MEDIUM)
+
+        layout.addWidget(QLabel(
+            f"{len(self.loans)} ऋण | स्वीकृत मिति: {self.approval_date} | स्वीकृत गर्ने: {self.approved_by}"
+        ))
+
+        self.table = QTableWidget(len(self.loans), 5)
+        self.table.setHorizontalHeaderLabels(["सदस्य नं", "सदस्यको नाम", "ऋणको प्रकार", "ऋण रकम", "स्वीकृत रकम"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        for row, (_, member_number, member_name, loan_type, loan_amount) in enumerate(self.loans):
+            for col, value in enumerate([member_number, member_name, loan_type, loan_amount]):
+                item = QTableWidgetItem("" if value is None else str(value))
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                self.table.setItem(row, col, item)
+            # Approved amount defaults to the requested amount; staff edit it in place
+            self.table.setItem(row, AMOUNT_COLUMN, QTableWidgetItem("" if loan_amount is None else str(loan_amount)))
+        layout.addWidget(self.table, 1)
+
+        buttons = QHBoxLayout()
+        self.btn_approve = QPushButton(f"सबै {len(self.loans)} स्वीकृत गर्नुहोस्")
+        self.btn_approve.setMinimumHeight(AppStyles.BUTTON_HEIGHT)
+        self.btn_approve.clicked.connect(self.approve)
+        btn_cancel = QPushButton("रद्द गर्नुहोस्")
+        btn_cancel.setMinimumHeight(AppStyles.BUTTON_HEIGHT)
+        btn_cancel.clicked.connect(self.reject)
+        buttons.addStretch()
+        buttons.addWidget(self.btn_approve)
+        buttons.addWidget(btn_cancel)
+        layout.addLayout(buttons)
+
+    def approve(self):
+        approvals = [
+            (loan[0], loan[1], self.table.item(row, AMOUNT_COLUMN).text())
+            for row, loan in enumerate(self.loans)
+        ]
+        try:
+            self.approved = approve_loans(
+                approvals, self.approval_date, self.entered_by, self.entered_designation,
+                self.approved_by, self.approved_designation
+            )
+        except ValueError as e:
+            msg = QMessageBox()
+            msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
+            msg.warning(self, "प्रतिबन्धित", f"कुनै पनि ऋण स्वीकृत भएन:\n{e}")
+            return
+        except Exception as e:
+            msg = QMessageBox()
+            msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
+            msg.critical(self, "ERROR", f"स्वीकृति सुरक्षित गर्न असफल: {str(e)}")
+            return
+        self.accept()
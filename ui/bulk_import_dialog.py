@@ -0,0 +1,150 @@
+from datetime import datetime
+from pathlib import Path
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QProgressBar, QPlainTextEdit
+)
+from services.bulk_import import TABLE_SPECS
+from signal_bus import signal_bus
+from styles.app_styles import AppStyles
+from ui.import_worker import BulkTableImportWorker
+
+# Row errors shown in the dialog per table; all of them go to the log file
+SHOWN_ERRORS = 20
+ERROR_LOG_PATH = Path("logs/import_errors.log")
+
+
+class BulkImportDialog(QDialog):
+    """Import the sheets of a bulk template (loans, collateral, guarantors, approvals) in the background."""
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.worker = None
+        self.results = None
+        self.setWindowTitle("Bulk Import")
+        self.resize(650, 480)
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.setStyleSheet(AppStyles.get_main_stylesheet())
+        layout = QVBoxLayout(self)
+        layout.setSpacing(AppStyles.SPACING_MEDIUM)
+
+        file_label = QLabel(f"File: {Path(self.path).name}")
+        file_label.setWordWrap(True)
+        layout.addWidget(file_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        self.status_label = QLabel("")
+        self.log_output = QPlainTextEdit()
+        self.log_output.setReadOnly(True)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.log_output, 1)
+
+        buttons = QHBoxLayout()
+        self.btn_start = QPushButton("Start")
+        self.btn_start.clicked.connect(self.start)
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel)
+        self.btn_close = QPushButton("Close")
+        self.btn_close.clicked.connect(self.close)
+        buttons.addStretch()
+        buttons.addWidget(self.btn_start)
+        buttons.addWidget(self.btn_cancel)
+        buttons.addWidget(self.btn_close)
+        layout.addLayout(buttons)
+
+    def start(self):
+        self.log_output.clear()
+        self.progress_bar.setRange(0, 0)
+        self.status_label.setText("Reading file...")
+
+        self.worker = BulkTableImportWorker(self.path, parent=self)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.import_finished.connect(self.on_finished)
+        self.worker.error.connect(self.on_error)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.btn_start.setEnabled(False)
+        self.btn_cancel.setEnabled(True)
+        self.btn_close.setEnabled(False)
+        self.worker.start()
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.btn_cancel.setEnabled(False)
+            self.status_label.setText("Cancelling; the current sheet will be rolled back...")
+
+    def on_progress(self, table, stats):
+        if stats["total_rows"]:
+            self.progress_bar.setRange(0, stats["total_rows"])
+            self.progress_bar.setValue(min(stats["last_row"], stats["total_rows"]))
+        self.status_label.setText(
+            f"{TABLE_SPECS[table]['sheet']}: {stats['rows_read']} rows read · "
+            f"{stats['rows_per_sec']:.0f} rows/s"
+        )
+
+    def on_finished(self, results):
+        self.results = results
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(1)
+        if not results:
+            self.status_label.setText("No importable sheets found")
+            self.log_output.appendPlainText(
+                "Sheets must be named: " + ", ".join(spec["sheet"] for spec in TABLE_SPECS.values())
+            )
+            return
+
+        cancelled = any(stats["cancelled"] for stats in results.values())
+        self.status_label.setText("Import cancelled" if cancelled else "Import completed")
+        log_lines = []
+        for table, stats in results.items():
+            sheet = TABLE_SPECS[table]["sheet"]
+            if stats["cancelled"]:
+                self.log_output.appendPlainText(f"{sheet}: cancelled, nothing imported")
+                continue
+            self.log_output.appendPlainText(
+                f"{sheet}: {stats['inserted']} imported, {stats['unresolved']} unknown member, "
+                f"{stats['already_present']} already present, {stats['duplicates']} repeated in sheet, "
+                f"{stats['skipped']} skipped "
+                f"of {stats['rows_read']} rows ({stats['rows_per_sec']:.0f} rows/s)"
+            )
+            for row_number, error in stats["errors"][:SHOWN_ERRORS]:
+                self.log_output.appendPlainText(f"    Row {row_number}: {error}")
+            if stats["error_count"] > SHOWN_ERRORS:
+                self.log_output.appendPlainText(f"    ... {stats['error_count'] - SHOWN_ERRORS} more")
+            log_lines += [f"{sheet} row {row_number}: {error}" for row_number, error in stats["errors"]]
+
+        if log_lines:
+            ERROR_LOG_PATH.parent.mkdir(exist_ok=True)
+            with open(ERROR_LOG_PATH, "a") as f:
+                f.write(f"\n\nBulk import of {self.path} on {datetime.now()}\n")
+                f.write("\n".join(log_lines))
+            self.log_output.appendPlainText(f"\nErrors logged to: {ERROR_LOG_PATH}")
+
+        if any(stats["inserted"] for stats in results.values()):
+            signal_bus.member_data_changed.emit("")
+        if results.get("loan_info", {}).get("inserted"):
+            signal_bus.loan_added.emit()
+
+    def on_error(self, message):
+        self.progress_bar.setRange(0, 1)
+        self.status_label.setText("Import failed")
+        self.log_output.appendPlainText(f"❌ {message}")
+
+    def on_worker_finished(self):
+        self.worker.deleteLater()
+        self.worker = None
+        self.btn_cancel.setEnabled(False)
+        self.btn_close.setEnabled(True)
+        # A sheet that was cancelled or failed can be imported again; finished rows are skipped
+        self.btn_start.setEnabled(True)
+
+    def closeEvent(self, event):
+        if self.worker is not None and self.worker.isRunning():
+            event.ignore()
+            return
+        super().closeEvent(event)
@@ -0,0 +1,171 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QFormLayout, QHBoxLayout, QLineEdit, QComboBox,
+    QCheckBox, QSpinBox, QPushButton, QLabel, QProgressBar, QPlainTextEdit, QMessageBox
+)
+from models.loan_scheme_model import fetch_all_loan_schemes
+from services.bulk_report_generation import select_bulk_members, DEFAULT_BATCH_SIZE
+from styles.app_styles import AppStyles
+from ui.report_worker import BulkReportWorker
+import re
+
+
+class BulkReportDialog(QDialog):
+    """Generate the selected document packet for every matching approved member."""
+
+    def __init__(self, primary_template, extra_docs, generated_by, approver, merged=False, parent=None):
+        super().__init__(parent)
+        self.primary_template = primary_template
+        self.extra_docs = extra_docs
+        self.generated_by = generated_by
+        self.approver = approver
+        self.merged = merged
+        self.members = []
+        self.worker = None
+        self.setWindowTitle("Bulk Report Generation")
+        self.resize(600, 500)
+        self.setup_ui()
+        self.refresh_member_count()
+
+    def setup_ui(self):
+        self.setStyleSheet(AppStyles.get_main_stylesheet())
+        layout = QVBoxLayout(self)
+        layout.setSpacing(AppStyles.SPACING_MEDIUM)
+
+        form = QFormLayout()
+        self.loan_type_input = QComboBox()
+        self.loan_type_input.addItem("All Loan Types", "")
+        for loan_type, _ in fetch_all_loan_schemes():
+            self.loan_type_input.addItem(loan_type, loan_type)
+        self.date_from_input = QLineEdit()
+        self.date_from_input.setPlaceholderText("YYYY-MM-DD (optional)")
+        self.date_to_input = QLineEdit()
+        self.date_to_input.setPlaceholderText("YYYY-MM-DD (optional)")
+        self.batch_size_input = QSpinBox()
+        self.batch_size_input.setRange(1, 500)
+        self.batch_size_input.setValue(DEFAULT_BATCH_SIZE)
+        self.batch_size_input.setToolTip("Members per report_tracking transaction")
+
+        form.addRow("Loan Type:", self.loan_type_input)
+        form.addRow("Approved From (BS):", self.date_from_input)
+        form.addRow("Approved To (BS):", self.date_to_input)
+        self.merged_input = QCheckBox("Also create one merged packet per member")
+        self.merged_input.setChecked(self.merged)
+        form.addRow("Batch Size:", self.batch_size_input)
+        form.addRow("", self.merged_input)
+        layout.addLayout(form)
+
+        self.loan_type_input.currentIndexChanged.connect(self.refresh_member_count)
+        self.date_from_input.editingFinished.connect(self.refresh_member_count)
+        self.date_to_input.editingFinished.connect(self.refresh_member_count)
+
+        docs = ", ".join(["Loan Application"] + [name for name, _ in self.extra_docs])
+        self.docs_label = QLabel(f"Documents per member: {docs}")
+        self.docs_label.setWordWrap(True)
+        self.count_label = QLabel()
+        layout.addWidget(self.docs_label)
+        layout.addWidget(self.count_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        self.status_label = QLabel("")
+        self.log_output = QPlainTextEdit()
+        self.log_output.setReadOnly(True)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.log_output, 1)
+
+        buttons = QHBoxLayout()
+        self.btn_start = QPushButton("Start")
+        self.btn_start.clicked.connect(self.start)
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel)
+        self.btn_close = QPushButton("Close")
+        self.btn_close.clicked.connect(self.close)
+        buttons.addStretch()
+        buttons.addWidget(self.btn_start)
+        buttons.addWidget(self.btn_cancel)
+        buttons.addWidget(self.btn_close)
+        layout.addLayout(buttons)
+
+    def _date_filter(self, line_edit):
+        text = line_edit.text().strip().replace("/", "-")
+        if text and not re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
+            raise ValueError(f"Invalid date '{text}', use YYYY-MM-DD")
+        return text or None
+
+    def refresh_member_count(self):
+        try:
+            self.members = select_bulk_members(
+                loan_type=self.loan_type_input.currentData(),
+                approval_date_from=self._date_filter(self.date_from_input),
+                approval_date_to=self._date_filter(self.date_to_input),
+            )
+            self.count_label.setText(f"Approved members matching: {len(self.members)}")
+        except ValueError as e:
+            self.members = []
+            self.count_label.setText(str(e))
+        if self.worker is None:
+            self.btn_start.setEnabled(bool(self.members))
+
+    def start(self):
+        self.refresh_member_count()
+        if not self.members:
+            QMessageBox.information(self, "Bulk Report Generation", "No approved members match the filters.")
+            return
+        self.log_output.clear()
+        self.progress_bar.setRange(0, len(self.members))
+        self.progress_bar.setValue(0)
+
+        self.worker = BulkReportWorker(
+            self.members, self.primary_template, self.extra_docs, self.generated_by,
+            self.approver, self.batch_size_input.value(), merged=self.merged_input.isChecked(), parent=self
+        )
+        self.worker.progress.connect(self.on_progress)
+        self.worker.bulk_finished.connect(self.on_finished)
+        self.worker.error.connect(lambda message: self.log_output.appendPlainText(f"❌ {message}"))
+        self.worker.finished.connect(self.on_worker_finished)
+        self.btn_start.setEnabled(False)
+        self.btn_cancel.setEnabled(True)
+        self.btn_close.setEnabled(False)
+        self.worker.start()
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.btn_cancel.setEnabled(False)
+            self.status_label.setText("Cancelling after the current member...")
+
+    def on_progress(self, done, total, member_number, stats):
+        self.progress_bar.setValue(done)
+        self.status_label.setText(
+            f"{done}/{total} members · {stats['documents']} documents · "
+            f"{stats['documents_per_sec']:.1f} docs/s · {stats['members_failed']} with failures"
+        )
+
+    def on_finished(self, stats):
+        summary = (
+            f"{'Cancelled' if stats['cancelled'] else 'Finished'}: "
+            f"{stats['members_done']}/{stats['members']} members, {stats['documents']} documents in "
+            f"{stats['elapsed']:.1f}s ({stats['documents_per_sec']:.1f} docs/s, "
+            f"{stats['members_per_sec']:.2f} members/s)"
+        )
+        self.status_label.setText(summary)
+        self.log_output.appendPlainText(summary)
+        if stats["failures"]:
+            self.log_output.appendPlainText(f"\n{len(stats['failures'])} failure(s):")
+            for member_number, doc_name, error in stats["failures"]:
+                self.log_output.appendPlainText(f"  {member_number} · {doc_name}: {error}")
+
+    def on_worker_finished(self):
+        self.worker.deleteLater()
+        self.worker = None
+        self.btn_cancel.setEnabled(False)
+        self.btn_close.setEnabled(True)
+        self.btn_start.setEnabled(bool(self.members))
+
+    def closeEvent(self, event):
+        if self.worker is not None and self.worker.isRunning():
+            event.ignore()
+            return
+        super().closeEvent(event)
@@ -647,6 +647,7 @@ class CollateralTab(QWidget):
                 'total_saving': convert_to_nepali_digits(total)
             }
             save_collateral_info(data, member_number)
+            signal_bus.member_data_changed.emit(member_number)
             QMessageBox.information(self, "Success",
                                     "Basic Collateral info saved successfully.")
             self.clear_basic_form()
@@ -670,6 +671,7 @@ class CollateralTab(QWidget):
             
             # Save all sections
             self.save_section_data(member_number)
+            signal_bus.member_data_changed.emit(member_number)
 
             QMessageBox.information(self, "Success", 
                                     "All Collateral information saved successfully.")
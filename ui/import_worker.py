@@ -0,0 +1,72 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from models.database import connection_manager
+from services.bulk_import import import_tables
+from services.member_import import import_members, upsert_members
+import logging
+
+
+class MemberImportWorker(QThread):
+    """Runs a resumable import_members(), or upsert_members(), off the GUI thread.
+
+    An import commits each chunk with its checkpoint, so cancelling
+    (requestInterruption()) or closing the app mid-import keeps the
+    committed members, and importing the same file again resumes after
+    them. An upsert is one transaction; cancelling rolls it back.
+    """
+    progress = pyqtSignal(dict)         # stats after each chunk
+    import_finished = pyqtSignal(dict)  # final stats
+    error = pyqtSignal(str)
+
+    def __init__(self, path, upsert=False, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.upsert = upsert
+
+    def run(self):
+        try:
+            on_progress = lambda stats: self.progress.emit(dict(stats))
+            if self.upsert:
+                stats = upsert_members(self.path, on_progress=on_progress, is_cancelled=self.isInterruptionRequested)
+            else:
+                stats = import_members(
+                    self.path,
+                    on_progress=on_progress,
+                    is_cancelled=self.isInterruptionRequested,
+                    resumable=True,
+                )
+            self.import_finished.emit(stats)
+        except Exception as e:
+            logging.error(f"Member import from {self.path} failed: {e}")
+            self.error.emit(str(e))
+        finally:
+            # This thread's pooled SQLite connection dies with it
+            connection_manager.close_thread_connection()
+
+
+class BulkTableImportWorker(QThread):
+    """Runs import_tables() off the GUI thread; cancel with requestInterruption().
+
+    Each table is one transaction: cancelling rolls back the table being
+    imported and keeps the ones before it.
+    """
+    progress = pyqtSignal(str, dict)    # table, stats after each chunk
+    import_finished = pyqtSignal(dict)  # {table: final stats}
+    error = pyqtSignal(str)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+
+    def run(self):
+        try:
+            results = import_tables(
+                self.path,
+                on_progress=lambda table, stats: self.progress.emit(table, dict(stats)),
+                is_cancelled=self.isInterruptionRequested,
+            )
+            self.import_finished.emit(results)
+        except Exception as e:
+            logging.error(f"Bulk import from {self.path} failed: {e}")
+            self.error.emit(str(e))
+        finally:
+            connection_manager.close_thread_connection()
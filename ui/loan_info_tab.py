@@ -2,9 +2,9 @@ from PyQt5.QtWidgets import (
     QWidget, QApplication, QLabel, QVBoxLayout, QGroupBox, QScrollArea, 
     QFormLayout, QComboBox, QLineEdit, QPushButton, QMessageBox, QCompleter, QHBoxLayout
 )
-from PyQt5.QtCore import Qt, QStringListModel
+from PyQt5.QtCore import Qt, QStringListModel, QTimer
 from models.loan_model import save_loan_info
-from services.member_lookup import fetch_members_matching
+from services.member_index import member_index
 from utils.converter import convert_to_nepali_digits
 from utils.amount_to_words import convert_number_to_nepali_words
 from models.loan_scheme_model import fetch_all_loan_schemes
@@ -88,7 +88,12 @@ class LoanInfoTab(QWidget):
         self.search_box.setPlaceholderText("🔍 Search Member (name or number)")
         self.search_box.setMinimumHeight(AppStyles.INPUT_HEIGHT)
         self.search_box.setEnabled(False)
-        self.search_box.textChanged.connect(self.update_completer)
+        # Search once typing pauses rather than on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.update_completer)
+        self.search_box.textChanged.connect(self.search_timer.start)
         self.search_box.returnPressed.connect(self.select_member)
         main_layout.addWidget(self.search_box)
 
@@ -96,8 +101,8 @@ class LoanInfoTab(QWidget):
         self.completer_model = QStringListModel()
         self.completer = QCompleter(self.completer_model)
         self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.completer.setFilterMode(Qt.MatchContains)
-        self.completer.setCompletionMode(QCompleter.PopupCompletion)
+        # The index already matched romanized/Nepali-digit input; don't filter again
+        self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
         self.search_box.setCompleter(self.completer)
 
         # Scroll area
@@ -216,14 +221,12 @@ class LoanInfoTab(QWidget):
         self.manjurinama_btn.setEnabled(enabled)
         self.guarantor_btn.setEnabled(enabled)
 
-    def update_completer(self, text):
-        """Update member search suggestions"""
-        results = fetch_members_matching(text)
-        names = [
-            f"{row['member_name']} ({row['member_number']})" if isinstance(row, dict)
-            else f"{row[1]} ({row[0]})"
-            for row in results    
-        ]
+    def update_completer(self):
+        """Update member search suggestions from the in-memory member index"""
+        text = self.search_box.text()
+        if text in self.completer_model.stringList():
+            return  # a suggestion was just picked
+        names = [f"{member_name} ({member_number})" for member_number, member_name in member_index.search(text)]
         self.completer_model.setStringList(names)
         if names:
             self.completer.complete()
@@ -283,6 +286,7 @@ class LoanInfoTab(QWidget):
                 raise ValueError("ऋण समापन मिति (वर्ष, महिना, दिन) खाली छ।")
 
             save_loan_info(data)
+            signal_bus.member_data_changed.emit(str(member_number))
             msg = QMessageBox()
             msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
             msg.information(self, "ऋण सुरक्षित", "✅ ऋण विवरण सफलतापूर्वक सुरक्षित भयो।")
@@ -1,12 +1,15 @@
 # ui/loan_list_tab.py
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QLineEdit, QLabel, QHeaderView
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QTimer
 from models.loan_model import fetch_all_loans
 from styles.app_styles import AppStyles
+from ui.widgets.loan_table import LoanFilterProxyModel, LoanTableModel
+
+FILTER_DELAY_MS = 200
 
 class LoanListTab(QWidget):
     def __init__(self):
@@ -22,22 +25,26 @@ class LoanListTab(QWidget):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search Member No, Name, Loan Type, Status...")
-        self.search_input.textChanged.connect(self.filter_table)
+        # Filter once typing pauses, not on every keystroke
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.filter_table)
+        self.search_input.textChanged.connect(self.filter_timer.start)
         search_layout.addWidget(QLabel("Filter:"))
         search_layout.addWidget(self.search_input)
 
         layout.addLayout(search_layout)
 
-        # Loan Table(
-        self.loan_table = QTableWidget()
-        self.loan_table.setColumnCount(7)
-        self.loan_table.setHorizontalHeaderLabels([
-            "Member No.", "Name", "Loan_type", "Applied Amount", 
-            "Approved Amount", "Status", "Approved Date"
-        ])
+        # Loan Table
+        self.model = LoanTableModel(self)
+        self.proxy = LoanFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.loan_table = QTableView()
+        self.loan_table.setModel(self.proxy)
         self.loan_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.loan_table.setSelectionBehavior(self.loan_table.SelectRows)
-        self.loan_table.setEditTriggers(self.loan_table.NoEditTriggers)
+        self.loan_table.setSelectionBehavior(QTableView.SelectRows)
+        self.loan_table.setEditTriggers(QTableView.NoEditTriggers)
 
         layout.addWidget(self.loan_table)
         self.setLayout(layout)
@@ -45,33 +52,9 @@ class LoanListTab(QWidget):
     
     def load_data(self):
         """ Load loan data from DB"""
-        self.all_loans = fetch_all_loans()
-        self.populate_table(self.all_loans)
-    
-    def populate_table(self, loans):
-        self.loan_table.setRowCount(len(loans))
+        self.model.set_rows(fetch_all_loans())
+        self.filter_table()
 
-        for row_idx, loan in enumerate(loans):
-            for col_idx, value in enumerate(loan):
-                item = QTableWidgetItem(str(value))
-
-                # apply color  for status column
-                if col_idx == 5: # Status Column
-                    if value == "Approved":
-                        item.setForeground(Qt.green)
-                    elif value == "Pending":
-                        item.setForeground(Qt.darkYellow)
-                    elif value == "Cleared":
-                        item.setForeground(Qt.darkCyan)
-                    else:
-                        item.setForeground(Qt.red)
-                self.loan_table.setItem(row_idx, col_idx, item)
-    
     def filter_table(self):
-        """ Filter  table rows based on search input"""
-        keyword = self.search_input.text().lower()
-        filtered_loans = [
-            loan for loan in self.all_loans
-            if any(keyword in str(field).lower() for field in loan)
-        ]
-        self.populate_table(filtered_loans)
+        """ Filter table rows based on search input"""
+        self.proxy.set_keyword(self.search_input.text())
@@ -14,6 +14,7 @@ from models.organization_model import get_organization_profile
 from utils.excel_handler import ExcelHandler
 from styles.app_styles import AppStyles
 from ui.message_boxes import StandardMessageBox
+from signal_bus import signal_bus
 from ui.personal_info_tab import PersonalInfoTab
 from ui.loan_info_tab import LoanInfoTab
 from ui.collateral_tab import CollateralTab
@@ -26,6 +27,8 @@ from ui.project_tab import ProjectTab
 from ui.loan_list_tab import LoanListTab
 from ui.organization_profile_tab import OrganizationProfileTab
 from ui.member_manager_dialog import MemberManagerDialog
+from ui.member_import_dialog import MemberImportDialog
+from ui.bulk_import_dialog import BulkImportDialog
 from ui.user_management_dialog import UserManagementDialog
 from models.collateral_model import (
     get_collateral_basic, get_collateral_properties, get_collateral_family_details,
@@ -178,6 +181,17 @@ class MainWindow(QMainWindow):
         import_action.triggered.connect(self.import_members)
         excel_menu.addAction(import_action)
 
+        excel_menu.addSeparator()
+
+        # Loans, collateral, guarantors and approvals
+        bulk_template_action = QAction("Download Loan && Collateral Template", self)
+        bulk_template_action.triggered.connect(self.download_bulk_template)
+        excel_menu.addAction(bulk_template_action)
+
+        bulk_import_action = QAction("Import Loans && Collateral", self)
+        bulk_import_action.triggered.connect(self.import_bulk_data)
+        excel_menu.addAction(bulk_import_action)
+
     def setup_status_bar(self):
         """Setup status bar with uniform styling and consistent information"""
         status_bar = QStatusBar()
@@ -397,7 +411,7 @@ class MainWindow(QMainWindow):
     def download_template(self):
         """Generate and save Excel template"""
         try:
-            wb = ExcelHandler.generate_template(get_database_path())
+            wb = ExcelHandler.generate_template()
             filepath, _ = QFileDialog.getSaveFileName(
                 self,
                 "Save Template As",
@@ -420,12 +434,41 @@ class MainWindow(QMainWindow):
             "Excel Files (*.xlsx)"
         )
         if filepath:
-            success, message = ExcelHandler.import_data(get_database_path(), filepath)
-            if success:
-                QMessageBox.information(self, "Success", message)
+            dialog = MemberImportDialog(filepath, self)
+            dialog.exec_()
+            if dialog.stats and (dialog.stats["inserted"] or dialog.stats.get("changed")):
+                self.refresh_member_data()
+
+    def download_bulk_template(self):
+        """Generate and save the loan/collateral/guarantor/approval template"""
+        try:
+            wb = ExcelHandler.generate_bulk_template()
+            filepath, _ = QFileDialog.getSaveFileName(
+                self,
+                "Save Template As",
+                "loan_collateral_import_template.xlsx",
+                "Excel Files (*.xlsx)"
+            )
+            if filepath:
+                wb.save(filepath)
+                self.statusBar().showMessage(f"Template saved to {filepath}", 5000)
+                QMessageBox.information(self, "Success", "Template generated successfully!")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to generate template:\n{str(e)}")
+
+    def import_bulk_data(self):
+        """Import loans, collateral, guarantors and approvals from a filled-in bulk template"""
+        filepath, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Excel File to Import",
+            "",
+            "Excel Files (*.xlsx *.xls)"
+        )
+        if filepath:
+            dialog = BulkImportDialog(filepath, self)
+            dialog.exec_()
+            if dialog.results and any(stats["inserted"] for stats in dialog.results.values()):
                 self.refresh_member_data()
-            else:
-                QMessageBox.critical(self, "Import Failed", message)
 
     def refresh_member_data(self):
         """Refresh member data in all tabs"""
@@ -633,8 +676,23 @@ class CollateralViewDialog(QDialog):
                                              QMessageBox.Ok)
                         return
 
+        # Members whose rows were edited; submitAll() clears the dirty flags.
+        # The filtered query has no id column, so find member_number by name
+        dirty_rows = [
+            row for row in range(self.model.rowCount())
+            if any(self.model.isDirty(self.model.index(row, col)) for col in range(self.model.columnCount()))
+        ]
+        member_column = self.model.record().indexOf("member_number")
+        member_numbers = set()
+        if member_column >= 0:
+            member_numbers = {str(self.model.data(self.model.index(row, member_column))) for row in dirty_rows}
+
         # Save changes
         if self.model.submitAll():
+            # These edits bypass the models layer, so tell the caches ourselves;
+            # without a member_number column, every member may have changed
+            if dirty_rows:
+                signal_bus.member_data_changed.emit(member_numbers.pop() if len(member_numbers) == 1 else "")
             QMessageBox.information(self, "Success", "Changes saved successfully!",
                                     QMessageBox.Ok)
         else:
@@ -0,0 +1,175 @@
+from pathlib import Path
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QProgressBar, QPlainTextEdit, QCheckBox
+)
+from services.member_import import clear_checkpoint, file_key, load_checkpoint
+from signal_bus import signal_bus
+from styles.app_styles import AppStyles
+from ui.import_worker import MemberImportWorker
+from utils.excel_handler import ExcelHandler
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return "—"
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+class MemberImportDialog(QDialog):
+    """Import a member Excel file in the background, with progress, ETA and cancel.
+
+    A file whose earlier import was cancelled or interrupted resumes after
+    its last committed chunk unless "Start Over" is chosen. "Update
+    existing members" upserts instead and writes a change report.
+    """
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.worker = None
+        self.stats = None
+        self.setWindowTitle("Import Members")
+        self.resize(600, 420)
+        self.setup_ui()
+        self.show_checkpoint()
+
+    def setup_ui(self):
+        self.setStyleSheet(AppStyles.get_main_stylesheet())
+        layout = QVBoxLayout(self)
+        layout.setSpacing(AppStyles.SPACING_MEDIUM)
+
+        file_label = QLabel(f"File: {Path(self.path).name}")
+        file_label.setWordWrap(True)
+        self.checkpoint_label = QLabel("")
+        self.checkpoint_label.setWordWrap(True)
+        self.upsert_input = QCheckBox("Update existing members (re-import an updated roster)")
+        self.upsert_input.setToolTip(
+            "Add new members and update changed fields of existing ones; blank cells keep the stored value"
+        )
+        self.upsert_input.toggled.connect(self.on_mode_changed)
+        layout.addWidget(file_label)
+        layout.addWidget(self.upsert_input)
+        layout.addWidget(self.checkpoint_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        self.counts_label = QLabel("Rows read: 0 · Inserted: 0 · Skipped: 0")
+        self.status_label = QLabel("")
+        self.log_output = QPlainTextEdit()
+        self.log_output.setReadOnly(True)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.counts_label)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.log_output, 1)
+
+        buttons = QHBoxLayout()
+        self.btn_start = QPushButton("Start")
+        self.btn_start.clicked.connect(self.start)
+        self.btn_restart = QPushButton("Start Over")
+        self.btn_restart.setToolTip("Forget the earlier progress and import this file from the top")
+        self.btn_restart.clicked.connect(self.start_over)
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel)
+        self.btn_close = QPushButton("Close")
+        self.btn_close.clicked.connect(self.close)
+        buttons.addStretch()
+        buttons.addWidget(self.btn_start)
+        buttons.addWidget(self.btn_restart)
+        buttons.addWidget(self.btn_cancel)
+        buttons.addWidget(self.btn_close)
+        layout.addLayout(buttons)
+
+    def show_checkpoint(self):
+        """Describe any unfinished earlier import of this file; returns its checkpoint."""
+        checkpoint = None if self.upsert_input.isChecked() else load_checkpoint(file_key(self.path))
+        self.btn_restart.setVisible(checkpoint is not None)
+        if checkpoint is None:
+            self.checkpoint_label.setText("")
+            self.btn_start.setText("Start")
+            return None
+        self.checkpoint_label.setText(
+            f"An earlier import of this file stopped after row {checkpoint['last_row']} "
+            f"({checkpoint['inserted']} members imported). It will resume from there."
+        )
+        self.btn_start.setText("Resume")
+        return checkpoint
+
+    def on_mode_changed(self):
+        self.show_checkpoint()
+        self.btn_start.setEnabled(True)
+
+    def start_over(self):
+        clear_checkpoint(file_key(self.path))
+        self.show_checkpoint()
+
+    def start(self):
+        self.log_output.clear()
+        self.progress_bar.setRange(0, 0)  # busy until the sheet size is known
+        self.status_label.setText("Reading file...")
+
+        self.worker = MemberImportWorker(self.path, upsert=self.upsert_input.isChecked(), parent=self)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.import_finished.connect(self.on_finished)
+        self.worker.error.connect(self.on_error)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.btn_start.setEnabled(False)
+        self.btn_restart.setEnabled(False)
+        self.upsert_input.setEnabled(False)
+        self.btn_cancel.setEnabled(True)
+        self.btn_close.setEnabled(False)
+        self.worker.start()
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.requestInterruption()
+            self.btn_cancel.setEnabled(False)
+            self.status_label.setText("Cancelling after the current chunk...")
+
+    def on_progress(self, stats):
+        if stats["total_rows"]:
+            self.progress_bar.setRange(0, stats["total_rows"])
+            self.progress_bar.setValue(min(stats["last_row"], stats["total_rows"]))
+        counts = f"Rows read: {stats['rows_read']} · Inserted: {stats['inserted']} · Skipped: {stats['skipped']}"
+        if "changed" in stats:
+            counts += f" · Updated: {stats['changed']} · Unchanged: {stats['unchanged']}"
+        self.counts_label.setText(counts)
+        self.status_label.setText(
+            f"{stats['rows_per_sec']:.0f} rows/s · ETA {format_eta(stats['eta'])}"
+        )
+
+    def on_finished(self, stats):
+        self.stats = stats
+        self.on_progress(stats)
+        if not stats["cancelled"]:
+            self.progress_bar.setRange(0, 1)
+            self.progress_bar.setValue(1)
+        summary = ExcelHandler.import_summary(stats)
+        self.status_label.setText(summary.splitlines()[0])
+        self.log_output.appendPlainText(summary)
+        if stats["cancelled"] and "changed" not in stats:
+            self.log_output.appendPlainText("\nImport this file again to resume after the last committed row.")
+        if stats["inserted"] or stats.get("changed"):
+            signal_bus.member_data_changed.emit("")
+
+    def on_error(self, message):
+        self.progress_bar.setRange(0, 1)
+        self.status_label.setText("Import failed")
+        self.log_output.appendPlainText(f"❌ {message}")
+
+    def on_worker_finished(self):
+        self.worker.deleteLater()
+        self.worker = None
+        self.btn_cancel.setEnabled(False)
+        self.btn_close.setEnabled(True)
+        self.btn_restart.setEnabled(True)
+        self.upsert_input.setEnabled(True)
+        # A finished import starts nothing new; a cancelled or failed one can resume
+        self.btn_start.setEnabled(self.show_checkpoint() is not None)
+
+    def closeEvent(self, event):
+        if self.worker is not None and self.worker.isRunning():
+            event.ignore()
+            return
+        super().closeEvent(event)
@@ -1,17 +1,17 @@
 # ui/member_manager_dialog.py
 
-import os
-
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QMessageBox, QHeaderView, QWidget,
-    QAbstractScrollArea, QFrame, QSpacerItem, QSizePolicy, QDialogButtonBox
+    QTableView, QMessageBox, QHeaderView, QAbstractScrollArea, QFrame,
+    QDialogButtonBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtGui import QFont, QIcon
-from models.member_model import fetch_all_members, delete_member
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+from models.member_model import count_members, delete_member, fetch_member_page
 from ui.personal_info_tab import PersonalInfoTab
+from ui.widgets.member_table import ACTIONS_COLUMN, MEMBER_COLUMNS, MemberActionDelegate, MemberTableModel
 from styles.app_styles import AppStyles
+from signal_bus import signal_bus
 
 
 PAGE_SIZE = 50
@@ -30,8 +30,13 @@ class MemberManagerDialog(QDialog):
         # Data management
         self.current_page = 1
         self.total_pages = 1
-        self.filtered_members = []
-        self.all_members = []
+        self.keyword = None
+        self.order_by = "member_number"
+        self.descending = False
+        self.page_after = [None]  # page_after[n]: last member_number before page n + 1
+        self.last_member_number = None
+        self.total_count = 0
+        self.filtered_count = 0
         
         # Apply global stylesheet
         self.setStyleSheet(self._get_dialog_stylesheet())
@@ -116,7 +121,7 @@ class MemberManagerDialog(QDialog):
         }}
         
         /* Table Styling */
-        QTableWidget {{
+        QTableView {{
             background-color: white;
             border: 1px solid {AppStyles.BORDER_COLOR};
             border-radius: 8px;
@@ -126,17 +131,17 @@ class MemberManagerDialog(QDialog):
             alternate-background-color: #f8f9fc;
         }}
         
-        QTableWidget::item {{
+        QTableView::item {{
             padding: 12px 8px;
             border-bottom: 1px solid {AppStyles.BORDER_COLOR};
         }}
         
-        QTableWidget::item:selected {{
+        QTableView::item:selected {{
             background-color: {AppStyles.PRIMARY_COLOR};
             color: white;
         }}
         
-        QTableWidget::item:hover {{
+        QTableView::item:hover {{
             background-color: #f1f3f4;
         }}
         
@@ -187,52 +192,6 @@ class MemberManagerDialog(QDialog):
             padding: 0 20px;
         }}
 
-         /* Action Container Widget */
-        QWidget[widgetRole="actionContainer"] {{
-            background-color: transparent;
-            border: none;
-        }}
-        
-        /* Action Buttons in Table */
-        QPushButton[actionRole="edit"] {{
-            background-color: {AppStyles.SUCCESS_COLOR};
-            color: white;
-            border: none;
-            border-radius: 6px;
-            font-weight: bold;
-            font-size: 14px;
-            padding: 0px;
-            min-width: 36px;
-            max-width: 36px;
-            min-height: 30px;
-            max-height: 30px;
-
-        }}
-        
-        QPushButton[actionRole="edit"]:hover {{
-            background-color: #17a673;
-            transform: scale(1.05);
-        }}
-        
-        QPushButton[actionRole="delete"] {{
-            background-color: {AppStyles.DANGER_COLOR};
-            color: white;
-            border: none;
-            border-radius: 6px;
-            font-weight: bold;
-            font-size: 14px;
-            padding: 0px;
-            min-width: 30px;
-            max-width: 30px;
-            min-height: 30px;
-            max-height: 30px;
-        }}
-        
-        QPushButton[actionRole="delete"]:hover {{
-            background-color: #c0392b;
-            transform: scale(1.05);
-        }}
-        
         /* Statistics Labels */
         QLabel[labelRole="stats"] {{
             background-color: {AppStyles.INFO_COLOR};
@@ -336,30 +295,30 @@ class MemberManagerDialog(QDialog):
 
     def _create_table_section(self):
         """Create and configure the member table"""
-        self.table = QTableWidget()
-        self.table.setColumnCount(19)
-        
-        headers = [
-            "सदस्य नं", "सदस्यको नाम", "फोन", "जन्ममिति (वि.सं.)", "ना.प्र. नं.",
-            "ठेगाना", "वार्ड नं", "बाबुको नाम", "बाजेको नाम",
-            "पति/पत्नीको नाम", "ईमेल", "पेशा", "फेसबुक", "Whatsapp/Viber", 
-            "व्यवसाय", "व्यवसाय ठेगाना", "रोजगारदाता", "ठेगाना (रोजगारदाता)", "Actions"
-        ]
-        
-        self.table.setHorizontalHeaderLabels(headers)
+        self.table_model = MemberTableModel(self)
+        self.action_delegate = MemberActionDelegate(self)
+        self.action_delegate.edit_clicked.connect(self.edit_member_dialog)
+        self.action_delegate.delete_clicked.connect(self.delete_member)
+
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setItemDelegateForColumn(ACTIONS_COLUMN, self.action_delegate)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(18, QHeaderView.Fixed)
-        self.table.setColumnWidth(18, 120)
+        self.table.horizontalHeader().setSectionResizeMode(ACTIONS_COLUMN, QHeaderView.Fixed)
+        self.table.setColumnWidth(ACTIONS_COLUMN, 120)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.verticalHeader().setDefaultSectionSize(44)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.setAlternatingRowColors(True)
-        self.table.setSortingEnabled(True)
-
-        for row in range(self.table.rowCount()):
-            self.table.setRowHeight(row, 44)
+        # A header click sorts every member in the database, not just this page
+        header = self.table.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(0, Qt.AscendingOrder)
+        header.sortIndicatorChanged.connect(self.sort_members)
 
     def _create_pagination_section(self):
         """Create pagination controls"""
@@ -408,71 +367,82 @@ class MemberManagerDialog(QDialog):
         self.load_members()
 
     def search_member(self):
-        """Search/filter members based on text input"""
-        keyword = self.search_input.text().strip().lower()
+        """Search/filter members through the normalized search keys, in the database"""
+        keyword = self.search_input.text().strip()
         if not keyword:
             self.load_members()
             return
-            
-        def safe_search(value, keyword):
-            """Safely search in a value that might be None"""
-            if value is None:
-                return False
-            return keyword in str(value).lower()
-            
-        self.filtered_members = [
-            m for m in self.all_members
-            if (safe_search(m.get('member_name'), keyword) or 
-                safe_search(m.get('member_number'), keyword) or
-                safe_search(m.get('phone'), keyword) or
-                safe_search(m.get('citizenship_no'), keyword) or
-                safe_search(m.get('address'), keyword) or
-                safe_search(m.get('father_name'), keyword) or
-                safe_search(m.get('grandfather_name'), keyword))
-        ]
 
-        self.current_page = 1
-        self.update_pagination()
+        try:
+            self.keyword = keyword
+            self.filtered_count = count_members(keyword)
+            self._first_page()
+        except Exception as e:
+            QMessageBox.critical(self, "त्रुटि", f"सदस्य खोज्न सकिएन: {str(e)}")
 
     def load_members(self):
-        """Load all members into memory and setup pagination"""
+        """Count all members and show the first page"""
         try:
-            self.all_members = fetch_all_members()
-            self.filtered_members = self.all_members.copy()
-            self.current_page = 1
-            self.update_pagination()
-            self.update_statistics()
+            self.keyword = None
+            self.total_count = count_members()
+            self.filtered_count = self.total_count
+            self._first_page()
+        except Exception as e:
+            QMessageBox.critical(self, "त्रुटि", f"सदस्यहरू लोड गर्न सकिएन: {str(e)}")
+
+    def sort_members(self, column, order):
+        """Order the pages by the clicked column and go back to the first page"""
+        if column >= ACTIONS_COLUMN:
+            # Nothing to sort by; put the indicator back on the current column
+            header = self.table.horizontalHeader()
+            header.blockSignals(True)
+            header.setSortIndicator(
+                [key for key, _ in MEMBER_COLUMNS].index(self.order_by),
+                Qt.DescendingOrder if self.descending else Qt.AscendingOrder,
+            )
+            header.blockSignals(False)
+            return
+        self.order_by = MEMBER_COLUMNS[column][0]
+        self.descending = order == Qt.DescendingOrder
+        try:
+            self._first_page()
         except Exception as e:
             QMessageBox.critical(self, "त्रुटि", f"सदस्यहरू लोड गर्न सकिएन: {str(e)}")
 
+    def _first_page(self):
+        self.current_page = 1
+        self.page_after = [None]
+        self.update_pagination()
+
     def update_statistics(self):
         """Update statistics label"""
-        total_count = len(self.all_members)
-        filtered_count = len(self.filtered_members)
-        
-        if total_count == filtered_count:
-            self.stats_label.setText(f"कुल सदस्यहरू: {total_count}")
+        if self.keyword is None:
+            self.stats_label.setText(f"कुल सदस्यहरू: {self.total_count}")
         else:
-            self.stats_label.setText(f"खोज परिणाम: {filtered_count} / {total_count}")
+            self.stats_label.setText(f"खोज परिणाम: {self.filtered_count} / {self.total_count}")
 
     def update_pagination(self):
-        """Update table data and pagination controls"""
-        total_records = len(self.filtered_members)
+        """Fetch the current page from the database and update pagination controls"""
+        total_records = self.filtered_count
         self.total_pages = max(1, (total_records + PAGE_SIZE - 1) // PAGE_SIZE)
-        
+
+        page_members = fetch_member_page(
+            after=self.page_after[self.current_page - 1], limit=PAGE_SIZE, keyword=self.keyword,
+            order_by=self.order_by, descending=self.descending,
+        )
+        self.last_member_number = page_members[-1]['member_number'] if page_members else None
         start_index = (self.current_page - 1) * PAGE_SIZE
-        end_index = min(start_index + PAGE_SIZE, total_records)
-        page_members = self.filtered_members[start_index:end_index]
-        
+        end_index = start_index + len(page_members)
+
         self.populate_table(page_members)
         
         # Update pagination info
         self.page_info.setText(f"पृष्ठ {self.current_page} of {self.total_pages}")
-        self.results_info.setText(f"देखाइएको: {start_index + 1}-{end_index} of {total_records}")
+        self.results_info.setText(f"देखाइएको: {min(start_index + 1, end_index)}-{end_index} of {total_records}")
         
         # Enable/disable pagination buttons
         self.prev_btn.setEnabled(self.current_page > 1)
-        self.next_btn.setEnabled(self.current_page < self.total_pages)
+        self.next_btn.setEnabled(self.current_page < self.total_pages and len(page_members) == PAGE_SIZE)
         
         # Update statistics
         self.update_statistics()
@@ -484,118 +454,16 @@ class MemberManagerDialog(QDialog):
             self.update_pagination()
 
     def next_page(self):
-        """Go to next page"""
-        if self.current_page < self.total_pages:
+        """Go to next page, starting after the last member shown"""
+        if self.current_page < self.total_pages and self.last_member_number is not None:
+            del self.page_after[self.current_page:]
+            self.page_after.append(self.last_member_number)
             self.current_page += 1
             self.update_pagination()
 
     def populate_table(self, members):
-        """Populate table with member data"""
-        self.table.setRowCount(0)
-        self.table.setSortingEnabled(False)  # Disable sorting during population
-        
-        for row_num, member in enumerate(members):
-            self.table.insertRow(row_num)
-            
-            # Member data columns
-            columns_data = [
-                member.get('member_number', ''),
-                member.get('member_name', ''),
-                member.get('phone', ''),
-                member.get('dob_bs', ''),
-                member.get('citizenship_no', ''),
-                member.get('address', ''),
-                member.get('ward_no', ''),
-                member.get('father_name', ''),
-                member.get('grandfather_name', ''),
-                member.get('spouse_name', ''),
-                member.get('email', ''),
-                member.get('profession', ''),
-                member.get('facebook_detail', ''),
-                member.get('whatsapp_detail', ''),
-                member.get('business_name', ''),
-                member.get('business_address', ''),
-                member.get('job_name', ''),
-                member.get('job_address', '')
-            ]
-            
-            # Populate data columns
-            for col, value in enumerate(columns_data):
-                item = QTableWidgetItem(str(value) if value else "—")
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row_num, col, item)
-            
-            # Create action buttons
-            action_widget = self._create_action_buttons(member)
-            self.table.setCellWidget(row_num, 18, action_widget)
-        
-        self.table.setSortingEnabled(True)  # Re-enable sorting
-
-    def _create_action_buttons(self, member):
-        """Create action buttons for each row with proper layout"""
-        # Create container widget
-        container = QWidget()
-        container.setProperty("widgetRole", "actionContainer")
-        container.setFixedHeight(36)
-
-        # Create horizontal layout
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0,0,0,0)
-        layout.setSpacing(2)
-        # layout.setAlignment(Qt.AlignCenter)
-        # Add stretch before buttons to push them to center
-        layout.addStretch()
-
-        # Get icon path with proper path handling
-        icon_path = os.path.join(os.path.dirname(__file__), "..", "icons")
-
-        # Create edit button
-        edit_btn = QPushButton()
-        edit_btn.setProperty("actionRole", "edit")
-        edit_btn.setToolTip("सम्पादन गर्नुहोस्")
-        edit_btn.setFixedSize(26, 26)
-        edit_btn.setCursor(Qt.PointingHandCursor)
-
-        # Try to load icon, fallback to test if not found
-        edit_icon_path = os.path.join(icon_path, "edit.png")
-        if os.path.exists(edit_icon_path):
-            edit_icon = QIcon(edit_icon_path)
-            edit_btn.setIcon(edit_icon)
-            edit_btn.setIconSize(QSize(16, 16))
-        else:
-            edit_btn.setText("✏️") # Fallback to emoji/text
-            edit_btn.setStyleSheet("font-size: 12px;")
-        
-        edit_btn.clicked.connect(lambda: self.edit_member_dialog(member))
-
-        # Create delete button
-        delete_btn = QPushButton()
-        delete_btn.setProperty("actionRole", "delete")
-        delete_btn.setToolTip("हटाउनुहोस")
-        delete_btn.setFixedSize(26, 26)
-        delete_btn.setCursor(Qt.PointingHandCursor)
-
-        # Try to load icon, fallback to text if not found
-        delete_icon_path = os.path.join(icon_path, "delete.png")
-        if os.path.exists(delete_icon_path):
-            delete_icon = QIcon(delete_icon_path)
-            delete_btn.setIcon(delete_icon)
-            delete_btn.setIconSize(QSize(16, 16))
-        else: 
-            delete_btn.setText("🗑️")
-            delete_btn.setStyleSheet("font_size: 12px;")
-        
-        delete_btn.clicked.connect(lambda: self.delete_member(member))
-
-        # Add buttons to layout
-        layout.addWidget(edit_btn)
-        layout.addWidget(delete_btn)
-
-        # Add stretch after buttons to center them perfectly
-        layout.addStretch()
-
-        return container
-
+        """Show members in the table; the view pulls rows from the model as it scrolls"""
+        self.table_model.set_members(members)
 
     def edit_member_dialog(self, member):
         """Open edit dialog for member"""
@@ -661,6 +529,7 @@ class MemberManagerDialog(QDialog):
         if msg_box.exec_() == QMessageBox.Yes:
             try:
                 delete_member(member.get('member_number'))
+                signal_bus.member_data_changed.emit(str(member.get('member_number')))
                 
                 # Success message
                 success_msg = QMessageBox(self)
@@ -205,6 +205,7 @@ class PersonalInfoTab(QWidget):
                 QMessageBox.information(self, "Updated", "✅ सदस्य विवरण सफलतापूर्वक अपडेट गरियो।")
             else:
                 save_member_info(data)
+            signal_bus.member_data_changed.emit(member_number)
             QMessageBox.information(self, "Saved", "✅ सदस्य विवरण सफलतापूर्वक सुरक्षित गरियो।")
             self.clear_form()
         except Exception as e:
@@ -278,6 +278,7 @@ class ProjectTab(QWidget):
 
         try:
             save_project(data)
+            signal_bus.member_data_changed.emit(str(member_number))
             msg = QMessageBox()
             msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
             msg.information(self, "Saved", "✅ परियोजनाको विवरण सुरक्षित भयो।")
@@ -0,0 +1,94 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from models.database import connection_manager
+from services.report_generation import generate_packet
+from services.bulk_report_generation import generate_bulk
+import logging
+
+
+class ReportGenerationWorker(QThread):
+    """Runs generate_packet() off the GUI thread.
+
+    All inputs are plain values captured on the GUI thread; results come
+    back through signals, which Qt delivers on the receiver's thread.
+    Cancel with requestInterruption(); the packet stops before the next
+    document.
+    """
+    progress = pyqtSignal(int, int, str)            # index, total, doc_name
+    document_saved = pyqtSignal(str, str)           # doc_name, output_path
+    document_failed = pyqtSignal(str, str)          # doc_name, error
+    no_data = pyqtSignal()
+    packet_finished = pyqtSignal(int, int, bool)    # generated, failed, cancelled
+    error = pyqtSignal(str)
+
+    def __init__(self, member_number, documents, generated_by, approver, parent=None):
+        super().__init__(parent)
+        self.member_number = member_number
+        self.documents = documents
+        self.generated_by = generated_by
+        self.approver = approver
+
+    def _on_document(self, doc_name, output_path, error):
+        if error is None:
+            self.document_saved.emit(doc_name, output_path)
+        else:
+            self.document_failed.emit(doc_name, error)
+
+    def run(self):
+        try:
+            result = generate_packet(
+                self.member_number,
+                self.documents,
+                self.generated_by,
+                self.approver,
+                on_progress=self.progress.emit,
+                on_document=self._on_document,
+                is_cancelled=self.isInterruptionRequested,
+            )
+            if not result["context_found"]:
+                self.no_data.emit()
+                return
+            self.packet_finished.emit(len(result["generated"]), len(result["failed"]), result["cancelled"])
+        except Exception as e:
+            logging.error(f"Report generation failed for {self.member_number}: {e}")
+            self.error.emit(str(e))
+        finally:
+            # This thread's pooled SQLite connection dies with it
+            connection_manager.close_thread_connection()
+
+
+class BulkReportWorker(QThread):
+    """Runs generate_bulk() off the GUI thread; cancel with requestInterruption()."""
+    progress = pyqtSignal(int, int, str, dict)      # done, total, member_number, stats
+    bulk_finished = pyqtSignal(dict)                # final stats
+    error = pyqtSignal(str)
+
+    def __init__(self, members, primary_template, extra_docs, generated_by, approver, batch_size,
+                 merged=False, parent=None):
+        super().__init__(parent)
+        self.members = members
+        self.primary_template = primary_template
+        self.extra_docs = extra_docs
+        self.generated_by = generated_by
+        self.approver = approver
+        self.batch_size = batch_size
+        self.merged = merged
+
+    def run(self):
+        try:
+            stats = generate_bulk(
+                self.members,
+                self.primary_template,
+                self.extra_docs,
+                self.generated_by,
+                self.approver,
+                batch_size=self.batch_size,
+                merged=self.merged,
+                on_progress=lambda done, total, member, stats: self.progress.emit(done, total, member, dict(stats)),
+                is_cancelled=self.isInterruptionRequested,
+            )
+            self.bulk_finished.emit(stats)
+        except Exception as e:
+            logging.error(f"Bulk report generation failed: {e}")
+            self.error.emit(str(e))
+        finally:
+            connection_manager.close_thread_connection()
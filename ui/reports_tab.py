@@ -6,14 +6,14 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QStringListModel
 from PyQt5.QtGui import QFont
 import os
-from docxtpl import DocxTemplate
-from nepali_datetime import date as nepali_date
-from os.path import abspath
 from models.loan_scheme_model import fetch_all_loan_schemes
-from models.report_tracking_model import save_report_log
 from models.loan_model import fetch_loan_info_members
 from context import current_session
-from services.prepare_report_contexts import prepare_report_context
+from services.report_context_cache import connect_invalidation
+from services.report_generation import plan_packet
+from ui.report_worker import ReportGenerationWorker
+from ui.bulk_report_dialog import BulkReportDialog
+from signal_bus import signal_bus
 from styles.app_styles import AppStyles
 import logging
 
@@ -30,6 +30,8 @@ class ReportsTab(QWidget):
         self.manjurinaama_template_path = None  # New for मञ्जुरीनामा
         self.guarantor_template_path = None     # New for व्यक्तिगत जमानी
         self.approved_members = []  # Store approved members for completer
+        self.report_worker = None
+        connect_invalidation(signal_bus)  # Drop cached report contexts on saves
         self.setup_ui()
 
     def setup_ui(self):
@@ -402,6 +404,11 @@ class ReportsTab(QWidget):
             button_row.addStretch()
             layout.addRow(checkbox, button_row)
 
+        self.checkbox_merged_packet = QCheckBox("Also create one merged packet for printing")
+        self.checkbox_merged_packet.setStyleSheet(f"font-size: {AppStyles.FONT_NORMAL};")
+        self.checkbox_merged_packet.setToolTip("Combine all generated documents into a single Word file")
+        layout.addRow(self.checkbox_merged_packet)
+
         group.setLayout(layout)
         return group
 
@@ -457,8 +464,46 @@ class ReportsTab(QWidget):
         clear_button.clicked.connect(self.clear_selection)
         clear_button.setToolTip("Clear all template and document selections")
 
+        self.btn_cancel_report = QPushButton("Cancel")
+        self.btn_cancel_report.setMinimumHeight(AppStyles.INPUT_HEIGHT + 10)
+        self.btn_cancel_report.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {AppStyles.WARNING_COLOR};
+                color: white;
+                font-size: {AppStyles.FONT_MEDIUM};
+                font-weight: bold;
+                border-radius: 6px;
+            }}
+            QPushButton:disabled {{
+                background-color: #cccccc;
+                color: #666666;
+            }}
+        """)
+        self.btn_cancel_report.clicked.connect(self.cancel_report_generation)
+        self.btn_cancel_report.setToolTip("Stop generating after the current document")
+        self.btn_cancel_report.setEnabled(False)
+
+        self.btn_bulk_generate = QPushButton("Bulk Generate")
+        self.btn_bulk_generate.setMinimumHeight(AppStyles.INPUT_HEIGHT + 10)
+        self.btn_bulk_generate.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {AppStyles.INFO_COLOR};
+                color: white;
+                font-size: {AppStyles.FONT_MEDIUM};
+                font-weight: bold;
+                border-radius: 6px;
+            }}
+            QPushButton:hover {{
+                background-color: #2c9faf;
+            }}
+        """)
+        self.btn_bulk_generate.clicked.connect(self.open_bulk_generation)
+        self.btn_bulk_generate.setToolTip("Generate the selected documents for all approved members")
+
         layout.addStretch()
         layout.addWidget(self.btn_generate_report)
+        layout.addWidget(self.btn_cancel_report)
+        layout.addWidget(self.btn_bulk_generate)
         layout.addWidget(clear_button)
         layout.addStretch()
         return frame
@@ -565,6 +610,7 @@ class ReportsTab(QWidget):
         self.checkbox_debit_authority.setChecked(False)
         self.checkbox_manjurinaama.setChecked(False)       # New
         self.checkbox_guarantor.setChecked(False)          # New
+        self.checkbox_merged_packet.setChecked(False)
         self.radio_select_all.setChecked(False)
         self.show_status_message("All selections cleared")
         self.update_session_label()
@@ -589,94 +635,102 @@ class ReportsTab(QWidget):
             logging.warning("btn_generate_report not initialized in validate_inputs")
 
     def generate_report(self):
+        if self.report_worker is not None and self.report_worker.isRunning():
+            self.show_status_message("Report generation is already in progress")
+            return
+
         logging.debug(f"Selected member_number: {current_session.get('member_number')}")
-        entered_by_name = current_session.get("entered_by", "")
-        entered_by_post = current_session.get("entered_by_post", "")
-        approved_by_name = current_session.get("approved_by", "")
-        approved_by_post = current_session.get("approved_by_post", "")
+        approver = self.current_approver()
         member_number = current_session.get("member_number")
         loan_type = self.loan_type_input.currentText().strip()
-        nepali_today = nepali_date.today()
-        nepali_date_str = nepali_today.strftime('%Y%m%d')
+        documents = plan_packet(member_number, loan_type, self.template_path, self.selected_extra_docs(),
+                                merged=self.checkbox_merged_packet.isChecked())
+
+        logging.debug(f"About to generate {len(documents)} document(s) for member_number: {member_number}")
+
+        # Context building, rendering and saving run on a worker thread
+        worker = ReportGenerationWorker(member_number, documents, self.username, approver, parent=self)
+        worker.progress.connect(self.on_report_progress)
+        worker.document_saved.connect(self.on_report_saved)
+        worker.document_failed.connect(self.on_report_failed)
+        worker.no_data.connect(lambda: self.show_status_message("No data found for the selected member"))
+        worker.error.connect(lambda message: self.show_status_message(f"Failed to generate reports: {message}"))
+        worker.packet_finished.connect(self.on_packet_finished)
+        worker.finished.connect(self.on_report_worker_finished)
+        self.report_worker = worker
 
-        logging.debug(f"About to call prepare_report_context with member_number: {member_number}")
+        self.btn_generate_report.setEnabled(False)
+        self.btn_cancel_report.setEnabled(True)
+        worker.start()
+
+    def current_approver(self):
+        return {
+            "entered_by_name": current_session.get("entered_by", ""),
+            "entered_by_post": current_session.get("entered_by_post", ""),
+            "approved_by_name": current_session.get("approved_by", ""),
+            "approved_by_post": current_session.get("approved_by_post", ""),
+        }
+
+    def selected_extra_docs(self):
+        """(doc_name, template_path) for every checked additional document."""
+        extra_docs = [
+            ("Tamasuk", self.checkbox_tamasuk, self.tamasuk_template_path),
+            ("Loan Approval", self.checkbox_loan_approval, self.loan_approval_template_path),
+            ("Debit Authority", self.checkbox_debit_authority, self.authority_template_path),
+            ("मञ्जुरीनामा", self.checkbox_manjurinaama, self.manjurinaama_template_path),
+            ("व्यक्तिगत जमानी", self.checkbox_guarantor, self.guarantor_template_path)
+        ]
+        return [
+            (doc_name, template_path)
+            for doc_name, checkbox, template_path in extra_docs
+            if checkbox.isChecked() and template_path
+        ]
 
-        # Prepare base context
-        data = prepare_report_context(
-            member_number, entered_by_name, entered_by_post, approved_by_name, approved_by_post
-        )
-        if not data:
-            self.show_status_message("No data found for the selected member")
+    def open_bulk_generation(self):
+        if not self.template_path:
+            self.show_status_message("Select a primary template before bulk generation")
             return
+        dialog = BulkReportDialog(
+            self.template_path, self.selected_extra_docs(), self.username, self.current_approver(),
+            merged=self.checkbox_merged_packet.isChecked(), parent=self
+        )
+        dialog.exec_()
 
-        # Generate Primary Report
-        try:
-            tpl = DocxTemplate(self.template_path)
-            tpl.render(data)
-            base_dir = 'generated reports'
-            loan_type_folder = os.path.join(base_dir, loan_type)
-            os.makedirs(loan_type_folder, exist_ok=True)
-            filename = f"{loan_type}_{member_number}_{nepali_date_str}.docx"
-            output_path = os.path.join(loan_type_folder, filename)
-            absolute_output_path = abspath(output_path)
-            tpl.save(absolute_output_path)
-            save_report_log({
-                "member_number": member_number,
-                "report_type": "Loan Application",
-                "generated_by": self.username,
-                "file_path": absolute_output_path,
-                "date": nepali_date.today().strftime('%Y-%m-%d')
-            })
-            self.show_status_message(f"Loan Application saved to: {output_path}")
-        except Exception as e:
-            self.show_status_message(f"Failed to generate Loan Application: {e}")
-            logging.error(f"Error generating Loan Application: {e}")
-            return
+    def cancel_report_generation(self):
+        if self.report_worker is not None and self.report_worker.isRunning():
+            self.report_worker.requestInterruption()
+            self.btn_cancel_report.setEnabled(False)
+            self.show_status_message("Cancelling after the current document...")
 
-        # Generate Additional Documents
-        extra_docs = [
-            ("Tamasuk", self.checkbox_tamasuk, self.tamasuk_template_path, prepare_report_context),
-            ("Loan Approval", self.checkbox_loan_approval, self.loan_approval_template_path, prepare_report_context),
-            ("Debit Authority", self.checkbox_debit_authority, self.authority_template_path, prepare_report_context),
-            ("मञ्जुरीनामा", self.checkbox_manjurinaama, self.manjurinaama_template_path, prepare_report_context),
-            ("व्यक्तिगत जमानी", self.checkbox_guarantor, self.guarantor_template_path, prepare_report_context)
-        ]
-        for doc_name, checkbox, template_path, context_func in extra_docs:
-            if checkbox.isChecked() and template_path:
-                try:
-                    data = context_func(member_number) if context_func != prepare_report_context else context_func(
-                        member_number, entered_by_name, entered_by_post, approved_by_name, approved_by_post
-                    )
-                    if not data:
-                        self.show_status_message(f"No data found for {doc_name}")
-                        continue
-                    tpl = DocxTemplate(template_path)
-                    tpl.render(data)
-                    folder_path = os.path.join("generated reports", doc_name)
-                    os.makedirs(folder_path, exist_ok=True)
-                    filename = f"{doc_name}_{member_number}_{nepali_date_str}.docx"
-                    output_path = os.path.join(folder_path, filename)
-                    tpl.save(output_path)
-                    save_report_log({
-                        "member_number": member_number,
-                        "report_type": doc_name,
-                        "generated_by": self.username,
-                        "file_path": output_path,
-                        "date": nepali_date.today().strftime('%Y-%m-%d')
-                    })
-                    self.show_status_message(f"{doc_name} saved to: {output_path}")
-                except Exception as e:
-                    self.show_status_message(f"Failed to generate {doc_name}: {e}")
-                    logging.error(f"Error generating {doc_name}: {e}")
-
-    def show_status_message(self, message):
+    def on_report_progress(self, index, total, doc_name):
+        self.show_status_message(f"Generating {doc_name} ({index + 1}/{total})...", fallback_dialog=False)
+
+    def on_report_saved(self, doc_name, output_path):
+        self.show_status_message(f"{doc_name} saved to: {output_path}")
+
+    def on_report_failed(self, doc_name, error):
+        self.show_status_message(f"Failed to generate {doc_name}: {error}")
+
+    def on_packet_finished(self, generated, failed, cancelled):
+        if cancelled:
+            self.show_status_message(f"Report generation cancelled ({generated} document(s) saved)")
+        elif failed:
+            self.show_status_message(f"{generated} document(s) saved, {failed} failed")
+
+    def on_report_worker_finished(self):
+        self.report_worker.deleteLater()
+        self.report_worker = None
+        self.btn_cancel_report.setEnabled(False)
+        self.validate_inputs()
+
+    def show_status_message(self, message, fallback_dialog=True):
         window = QApplication.instance().activeWindow()
         logging.debug(f"Active window: {window}")
         if window and hasattr(window, 'statusBar') and window.statusBar():
             status_bar = window.statusBar()
             status_bar.showMessage(message, 5000)
             logging.debug(f"Status bar message set: {message}")
-        else:
+        elif fallback_dialog:
             logging.warning(f"Status bar unavailable for window {window}, showing QMessageBox: {message}")
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle("Report Status")
@@ -1,8 +1,31 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QFileDialog, QMessageBox, QGridLayout, QLabel
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QPushButton, QFileDialog, QMessageBox, QGridLayout, QLabel, QInputDialog
+)
+from PyQt5.QtCore import Qt, QSettings
+from services.parallel_render import default_workers, set_render_workers
 from ui.add_user_dialog import AddUserDialog
 
-from services.import_service import import_members_from_excel
+from ui.member_import_dialog import MemberImportDialog
+
+# Report rendering processes, per machine (0 = one per CPU, 1 = in-process)
+RENDER_WORKERS_KEY = "reports/render_workers"
+RENDER_CHOICES = {
+    "Automatic (one per CPU)": 0,
+    "One at a time (in-process)": 1,
+    "2 processes": 2,
+    "4 processes": 4,
+    "8 processes": 8,
+}
+
+
+def render_workers_setting():
+    return QSettings().value(RENDER_WORKERS_KEY, 0, type=int)
+
+
+def apply_render_setting():
+    """Size the report render pool from the saved setting (call once at startup)."""
+    set_render_workers(render_workers_setting())
+
 
 class SettingsTab(QWidget):
     def __init__(self):
@@ -109,6 +132,18 @@ class SettingsTab(QWidget):
         )
         grid_layout.addWidget(add_user_card, 0, 1)
 
+        # Card 3: Report rendering
+        render_card = self.create_card(
+            icon = "🖨️",
+            title = "Report Rendering",
+            description = self.render_description(),
+            button_text = "Change",
+            callback = self.change_render_workers,
+            color = "#36b9cc"
+        )
+        self.render_desc_label = render_card.findChildren(QLabel)[-1]
+        grid_layout.addWidget(render_card, 0, 2)
+
         main_layout.addLayout(grid_layout)
         self.setLayout(main_layout)
 
@@ -180,15 +215,31 @@ class SettingsTab(QWidget):
         
         if path:
             print(f"📁 Importing members from: {path}")
-            try:
-                count = import_members_from_excel(path)
-                QMessageBox.information(self, "Import Complete", f"{count} सदस्यहरू सफलतापूर्वक इम्पोर्ट गरियो।")
-            except Exception as e:
-                QMessageBox.critical(self, "Import Error", f"⚠ त्रुटि भयो:\n{str(e)}")
+            dialog = MemberImportDialog(path, self)
+            dialog.exec_()
+            if dialog.stats and not dialog.stats["cancelled"]:
+                QMessageBox.information(self, "Import Complete", f"{dialog.stats['inserted']} सदस्यहरू सफलतापूर्वक इम्पोर्ट गरियो।")
 
 
             
 
+    def render_description(self):
+        workers = render_workers_setting()
+        mode = "Automatic" if workers == 0 else "Manual"
+        workers = workers or default_workers()
+        if workers == 1:
+            return f"{mode}: packet documents render one at a time"
+        return f"{mode}: packet documents render in parallel, {workers} processes"
+
+    def change_render_workers(self):
+        labels = list(RENDER_CHOICES)
+        current = next((i for i, v in enumerate(RENDER_CHOICES.values()) if v == render_workers_setting()), 0)
+        label, ok = QInputDialog.getItem(self, "Report Rendering", "Render packet documents:", labels, current, False)
+        if ok:
+            QSettings().setValue(RENDER_WORKERS_KEY, RENDER_CHOICES[label])
+            apply_render_setting()
+            self.render_desc_label.setText(self.render_description())
+
     def show_add_user_dialog(self):
         dialog = AddUserDialog()
         dialog.exec_()
@@ -6,6 +6,7 @@ from PyQt5.QtCore import Qt
 from models.database import get_connection
 from models.guarantor_model import save_guranteer_details  # Assuming this is the correct file
 from context import current_session
+from signal_bus import signal_bus
 from styles.app_styles import AppStyles
 from nepali_datetime import date as nepali_date
 from utils.converter import convert_to_nepali_digits
@@ -186,6 +187,7 @@ class GuranteerFormDialog(QDialog):
             print(f"Saving data: {data}")  # Debug output
             success = save_guranteer_details(data)
             if success:
+                signal_bus.member_data_changed.emit(str(member_number))
                 QMessageBox.information(self, "सफलता", "व्यक्तिगत जमानी विवरण सुरक्षित भयो।")
                 self.accept()
             else:
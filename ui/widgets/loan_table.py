@@ -0,0 +1,119 @@
+# ui/widgets/loan_table.py
+"""Model and filter proxy for the loan list.
+
+LoanTableModel keeps the loans as the row tuples fetch_all_loans() returns,
+colours the status column through the ForegroundRole, and hands rows to
+the view in batches (canFetchMore/fetchMore). Each row's fields are joined
+into one lowercase search string when the rows are loaded, so
+LoanFilterProxyModel tests a keystroke with one substring check per row
+instead of re-stringifying every field.
+"""
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt5.QtGui import QColor
+
+FETCH_BATCH = 200
+LOAN_HEADERS = ["Member No.", "Name", "Loan_type", "Applied Amount", "Approved Amount", "Status", "Approved Date"]
+STATUS_COLUMN = 5
+STATUS_COLORS = {
+    "Approved": QColor(Qt.green),
+    "Pending": QColor(Qt.darkYellow),
+    "Cleared": QColor(Qt.darkCyan),
+}
+OTHER_STATUS_COLOR = QColor(Qt.red)
+# Joins fields in the search string so a keyword can't match across two of them
+FIELD_SEPARATOR = "\x1f"
+
+
+class LoanTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._search = []
+        self._fetched = 0
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = [tuple("" if value is None else str(value) for value in row) for row in rows]
+        self._search = [FIELD_SEPARATOR.join(row).lower() for row in self._rows]
+        self._fetched = min(FETCH_BATCH, len(self._rows))
+        self.endResetModel()
+
+    def match_rows(self, keyword):
+        """Per row, whether any field contains the (lowercase) keyword."""
+        return [keyword in text for text in self._search]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(LOAN_HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex(), count=FETCH_BATCH):
+        if parent.isValid():
+            return
+        count = min(count, len(self._rows) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def fetch_all(self):
+        """Expose every row at once (a filter has to see all of them)."""
+        self.fetchMore(count=len(self._rows))
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ForegroundRole and index.column() == STATUS_COLUMN:
+            return STATUS_COLORS.get(self._rows[index.row()][STATUS_COLUMN], OTHER_STATUS_COLOR)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return LOAN_HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class LoanFilterProxyModel(QSortFilterProxyModel):
+    """Keeps the loans whose fields contain the keyword (case-insensitive)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keyword = ""
+        self._accepted = None
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self._forget_matches)
+
+    def _forget_matches(self):
+        self._accepted = None
+
+    def set_keyword(self, keyword):
+        keyword = keyword.lower()
+        if keyword:
+            self.sourceModel().fetch_all()
+        if keyword == self._keyword:
+            return
+        self._keyword = keyword
+        self._accepted = None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._keyword:
+            return True
+        if self._accepted is None:
+            # Match every row in one pass; the per-row calls then only index
+            self._accepted = self.sourceModel().match_rows(self._keyword)
+        return self._accepted[source_row]
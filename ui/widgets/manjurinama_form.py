@@ -2,6 +2,7 @@ from PyQt5.QtWidgets import QDialog, QFormLayout, QLineEdit, QPushButton, QMessa
 from PyQt5.QtCore import Qt
 from models.manjurinama_model import save_manjurinama_details
 from context import current_session
+from signal_bus import signal_bus
 from styles.app_styles import AppStyles
 from utils.converter import convert_to_nepali_digits
 
@@ -92,6 +93,7 @@ class ManjurinamaForm(QDialog):
 
         try:
             save_manjurinama_details(data)
+            signal_bus.member_data_changed.emit(str(member_number))
             QMessageBox.information(self, "Success", "Manjurinama Details have been saved successfully.")
             self.accept()
         except Exception as e:
@@ -0,0 +1,179 @@
+# ui/widgets/member_table.py
+"""Model and action delegate for the member manager table.
+
+MemberTableModel serves member dicts to a QTableView straight from the
+list it is given, formatting a cell only when the view asks for it, and
+hands rows to the view in batches (canFetchMore/fetchMore) as it scrolls.
+It holds one page, so it doesn't sort: header clicks re-query the pages
+in the clicked order (see MemberManagerDialog.sort_members).
+MemberActionDelegate paints the edit/delete buttons of the Actions column
+instead of creating a widget with two QPushButtons per row.
+"""
+import os
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QRect, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QIcon, QPainter
+from PyQt5.QtWidgets import QStyledItemDelegate, QToolTip
+
+from styles.app_styles import AppStyles
+
+FETCH_BATCH = 25
+
+MEMBER_COLUMNS = [
+    ("member_number", "सदस्य नं"),
+    ("member_name", "सदस्यको नाम"),
+    ("phone", "फोन"),
+    ("dob_bs", "जन्ममिति (वि.सं.)"),
+    ("citizenship_no", "ना.प्र. नं."),
+    ("address", "ठेगाना"),
+    ("ward_no", "वार्ड नं"),
+    ("father_name", "बाबुको नाम"),
+    ("grandfather_name", "बाजेको नाम"),
+    ("spouse_name", "पति/पत्नीको नाम"),
+    ("email", "ईमेल"),
+    ("profession", "पेशा"),
+    ("facebook_detail", "फेसबुक"),
+    ("whatsapp_detail", "Whatsapp/Viber"),
+    ("business_name", "व्यवसाय"),
+    ("business_address", "व्यवसाय ठेगाना"),
+    ("job_name", "रोजगारदाता"),
+    ("job_address", "ठेगाना (रोजगारदाता)"),
+]
+ACTIONS_COLUMN = len(MEMBER_COLUMNS)
+ACTIONS_HEADER = "Actions"
+MEMBER_ROLE = Qt.UserRole
+
+
+class MemberTableModel(QAbstractTableModel):
+    """Read-only table over a list of member dicts, fetched into the view lazily."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._members = []
+        self._fetched = 0
+
+    def set_members(self, members):
+        self.beginResetModel()
+        self._members = list(members)
+        self._fetched = min(FETCH_BATCH, len(self._members))
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else ACTIONS_COLUMN + 1
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._members)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH, len(self._members) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        member = self._members[index.row()]
+        if role == MEMBER_ROLE:
+            return member
+        if index.column() == ACTIONS_COLUMN:
+            return None
+        if role == Qt.DisplayRole:
+            value = member.get(MEMBER_COLUMNS[index.column()][0])
+            return str(value) if value else "—"
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return MEMBER_COLUMNS[section][1] if section < ACTIONS_COLUMN else ACTIONS_HEADER
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class MemberActionDelegate(QStyledItemDelegate):
+    """Paints the edit and delete buttons of a row and reports clicks on them."""
+
+    edit_clicked = pyqtSignal(dict)
+    delete_clicked = pyqtSignal(dict)
+
+    BUTTON_SIZE = 26
+    ICON_SIZE = 16
+    SPACING = 4
+    ACTIONS = [
+        ("edit", "edit.png", "✏️", AppStyles.SUCCESS_COLOR, "सम्पादन गर्नुहोस्"),
+        ("delete", "delete.png", "🗑️", AppStyles.DANGER_COLOR, "हटाउनुहोस"),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Icons are loaded once for the whole table, not once per row
+        icon_dir = os.path.join(os.path.dirname(__file__), "..", "..", "icons")
+        self._icons = {}
+        for name, icon_file, _, _, _ in self.ACTIONS:
+            path = os.path.join(icon_dir, icon_file)
+            self._icons[name] = QIcon(path) if os.path.exists(path) else None
+
+    def _button_rects(self, rect):
+        width = len(self.ACTIONS) * self.BUTTON_SIZE + (len(self.ACTIONS) - 1) * self.SPACING
+        left = rect.x() + (rect.width() - width) // 2
+        top = rect.y() + (rect.height() - self.BUTTON_SIZE) // 2
+        return [
+            QRect(left + i * (self.BUTTON_SIZE + self.SPACING), top, self.BUTTON_SIZE, self.BUTTON_SIZE)
+            for i in range(len(self.ACTIONS))
+        ]
+
+    def _action_at(self, rect, pos):
+        for (name, _, _, _, tooltip), button in zip(self.ACTIONS, self._button_rects(rect)):
+            if button.contains(pos):
+                return name, tooltip
+        return None, None
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        for (name, _, fallback, color, _), button in zip(self.ACTIONS, self._button_rects(option.rect)):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(button, 6, 6)
+            icon = self._icons[name]
+            if icon is not None:
+                offset = (self.BUTTON_SIZE - self.ICON_SIZE) // 2
+                icon.paint(painter, button.adjusted(offset, offset, -offset, -offset))
+            else:
+                painter.setPen(QColor("white"))
+                painter.drawText(button, Qt.AlignCenter, fallback)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        width = len(self.ACTIONS) * (self.BUTTON_SIZE + self.SPACING) + 2 * self.SPACING
+        return QSize(width, self.BUTTON_SIZE + 2 * self.SPACING)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == event.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action, _ = self._action_at(option.rect, event.pos())
+            member = index.data(MEMBER_ROLE)
+            if action and member is not None:
+                (self.edit_clicked if action == "edit" else self.delete_clicked).emit(member)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        _, tooltip = self._action_at(option.rect, event.pos())
+        if tooltip:
+            QToolTip.showText(event.globalPos(), tooltip, view)
+            return True
+        return super().helpEvent(event, view, option, index)
@@ -0,0 +1,96 @@
+# ui/widgets/row_table_model.py
+"""Read-only table model over query rows (tuples), updated by row-level diffs.
+
+apply_rows() compares a fresh query result with the rows already shown,
+by a key column, and only removes, changes or inserts the rows that
+differ, so the view keeps its selection, scroll position and sort when
+data is refreshed.
+"""
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+def _sort_key(value):
+    if value is None:
+        return (2, "")
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, str(value))
+
+
+class RowTableModel(QAbstractTableModel):
+    def __init__(self, headers, key_column=0, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._key = key_column
+        self._rows = []
+        self._sort_column = None
+        self._sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def row(self, row):
+        """The row tuple shown at `row`."""
+        return self._rows[row]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            value = self._rows[index.row()][index.column()]
+            return "" if value is None else str(value)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def apply_rows(self, rows):
+        """Bring the model in line with `rows`. Returns (removed, changed, inserted) counts."""
+        fresh = {row[self._key]: tuple(row) for row in rows}
+
+        removed = 0
+        for position in reversed(range(len(self._rows))):
+            if self._rows[position][self._key] not in fresh:
+                self.beginRemoveRows(QModelIndex(), position, position)
+                del self._rows[position]
+                self.endRemoveRows()
+                removed += 1
+
+        changed = 0
+        last_column = self.columnCount() - 1
+        for position, row in enumerate(self._rows):
+            new_row = fresh[row[self._key]]
+            if new_row != row:
+                self._rows[position] = new_row
+                self.dataChanged.emit(self.index(position, 0), self.index(position, last_column))
+                changed += 1
+
+        shown = {row[self._key] for row in self._rows}
+        added = [row for key, row in fresh.items() if key not in shown]
+        if added:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+            if self._sort_column is not None:
+                self.sort(self._sort_column, self._sort_order)
+        return removed, changed, len(added)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column, self._sort_order = column, order
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        keys = [(self._rows[index.row()][self._key], index.column()) for index in persistent]
+        self._rows.sort(key=lambda row: _sort_key(row[column]), reverse=order == Qt.DescendingOrder)
+        positions = {row[self._key]: position for position, row in enumerate(self._rows)}
+        self.changePersistentIndexList(persistent, [self.index(positions[key], column) for key, column in keys])
+        self.layoutChanged.emit()
@@ -7,6 +7,7 @@ from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QIcon
 from models.witness_model import save_witness
 from context import current_session
+from signal_bus import signal_bus
 from styles.app_styles import AppStyles
 
 class WitnessForm(QDialog):
@@ -118,6 +119,7 @@ class WitnessForm(QDialog):
 
         try:
             save_witness(member_number, data)
+            signal_bus.member_data_changed.emit(str(member_number))
             msg = QMessageBox()
             msg.setStyleSheet(AppStyles.get_messagebox_stylesheet())
             msg.information(self, "Saved", "साक्षी विवरण सुरक्षित भयो!")
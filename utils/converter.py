@@ -1,5 +1,21 @@
+import re
+from decimal import Decimal
 from nepali import number
 
+AMOUNT_PATTERN = r"\d+(?:\.\d+)?"
+
 def convert_to_nepali_digits(text):
     eng_to_nep = str.maketrans('0123456789', '०१२३४५६७८९')
-    return str(text).translate(eng_to_nep)
\ No newline at end of file
+    return str(text).translate(eng_to_nep)
+
+def parse_amount(text):
+    """Amount typed with Nepali or ASCII digits, thousands separators and decimals, as a Decimal (None if not a number)"""
+    nep_to_eng = str.maketrans('०१२३४५६७८९', '0123456789')
+    text = str(text or "").strip().translate(nep_to_eng).replace(",", "")
+    if not re.fullmatch(AMOUNT_PATTERN, text, re.ASCII):
+        return None
+    return Decimal(text)
+
+def format_amount(amount):
+    """A parsed amount in Nepali digits, with decimals only when there are paisa"""
+    return convert_to_nepali_digits(int(amount) if amount == int(amount) else amount)
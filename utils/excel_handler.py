@@ -1,59 +1,35 @@
-import sqlite3
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 from pathlib import Path
 from datetime import datetime
 from nepali_datetime import date as nepali_date
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
+from models.database import get_connection
+from services.member_import import import_members, member_columns, upsert_members
+from services.member_validation import COLUMN_TYPES
+from services.bulk_import import IMPORT_ORDER, TABLE_SPECS, column_type, table_columns
 
 class ExcelHandler:
     HEADER_FILL = PatternFill(start_color="FFD700", end_color="FFD700", fill_type="solid")
     NOTE_FILL = PatternFill(start_color="F0F0F0", end_color="F0F0F0", fill_type="solid")
     
     @staticmethod
-    def generate_template(db_path):
+    def generate_template():
         """Generate enhanced Excel template with versioning and instructions"""
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Get column info, excluding auto-filled columns
-        cursor.execute("PRAGMA table_info(member_info)")
-        columns = [col[1] for col in cursor.fetchall() 
-                  if col[1] not in ('id', 'date')]  # Skip auto-filled columns
+        conn = get_connection()
+        columns = member_columns(conn)  # Skips auto-filled columns
+        conn.close()
         
         wb = openpyxl.Workbook()
         ws = wb.active
         ws.title = "Member Import"
-        
-        # Add template metadata
-        current_date = nepali_date.today().strftime('%Y-%m-%d %H:%M')
-        ws.merge_cells('A1:D1')
-        ws['A1'] = "MEMBER IMPORT TEMPLATE"
-        ws['A1'].font = Font(bold=True, size=14)
-        ws['A1'].alignment = Alignment(horizontal='center')
-        
-        ws['A2'] = f"Generated on: {current_date}"
-        ws['A3'] = f"Template Version: 2.0"
-        ws['A4'] = "NOTE: Date will be auto-filled with current BS date"
-        
-        # Format note area
-        for row in ws.iter_rows(min_row=1, max_row=4, max_col=4):
-            for cell in row:
-                cell.fill = ExcelHandler.NOTE_FILL
-        
-        # Write headers starting from row 6
+        ExcelHandler._template_sheet(
+            ws, "MEMBER IMPORT TEMPLATE", columns, ExcelHandler._get_column_type,
+            "NOTE: Date will be auto-filled with current BS date"
+        )
         header_row = 6
-        for col_num, col_name in enumerate(columns, 1):
-            cell = ws.cell(row=header_row, column=col_num, value=col_name.replace('_', ' ').title())
-            cell.font = Font(bold=True)
-            cell.fill = ExcelHandler.HEADER_FILL
-            ws.column_dimensions[openpyxl.utils.get_column_letter(col_num)].width = 22
-            
-            # Add data type hints
-            type_cell = ws.cell(row=header_row+1, column=col_num, 
-                              value=f"Type: {ExcelHandler._get_column_type(col_name)}")
-            type_cell.font = Font(italic=True, color="808080")
-        
+
         # Add example data
         example_data = {
             'member_number': '001000001',
@@ -84,128 +60,169 @@ class ExcelHandler:
             if "INSTRUCTIONS" in text:
                 ws[cell_ref].font = Font(bold=True, color="FF0000")
         
+        return wb
+
+    @staticmethod
+    def _template_sheet(ws, title, columns, column_type, note):
+        """Write the import template layout: title and notes, headers on row 6, type hints on row 7"""
+        # Add template metadata
+        current_date = nepali_date.today().strftime('%Y-%m-%d %H:%M')
+        ws.merge_cells('A1:D1')
+        ws['A1'] = title
+        ws['A1'].font = Font(bold=True, size=14)
+        ws['A1'].alignment = Alignment(horizontal='center')
+        
+        ws['A2'] = f"Generated on: {current_date}"
+        ws['A3'] = f"Template Version: 2.0"
+        ws['A4'] = note
+        
+        # Format note area
+        for row in ws.iter_rows(min_row=1, max_row=4, max_col=4):
+            for cell in row:
+                cell.fill = ExcelHandler.NOTE_FILL
+        
+        # Write headers starting from row 6
+        header_row = 6
+        for col_num, col_name in enumerate(columns, 1):
+            cell = ws.cell(row=header_row, column=col_num, value=col_name.replace('_', ' ').title())
+            cell.font = Font(bold=True)
+            cell.fill = ExcelHandler.HEADER_FILL
+            ws.column_dimensions[openpyxl.utils.get_column_letter(col_num)].width = 22
+            
+            # Add data type hints
+            type_cell = ws.cell(row=header_row+1, column=col_num, 
+                              value=f"Type: {column_type(col_name)}")
+            type_cell.font = Font(italic=True, color="808080")
+
         # Freeze header row
         ws.freeze_panes = "A7"
-        
+
+    @staticmethod
+    def generate_bulk_template():
+        """Template for services.bulk_import: one sheet per table, in import order"""
+        conn = get_connection()
+
+        wb = openpyxl.Workbook()
+        for index, table in enumerate(IMPORT_ORDER):
+            sheet = TABLE_SPECS[table]["sheet"]
+            ws = wb.active if index == 0 else wb.create_sheet()
+            ws.title = sheet
+            ExcelHandler._template_sheet(
+                ws, f"{sheet.upper()} IMPORT TEMPLATE", table_columns(conn, table),
+                lambda col_name, table=table: column_type(table, col_name),
+                "NOTE: Member numbers must already exist in Member Info"
+            )
+
+        ws = wb.create_sheet("Instructions")
+        instructions = [
+            "INSTRUCTIONS:",
+            "1. Fill each sheet below its header row (Row 7); leave unused sheets empty or delete them",
+            "2. Do not modify column headers or sheet names",
+            "3. Sheets are imported in this order: " + ", ".join(TABLE_SPECS[t]["sheet"] for t in IMPORT_ORDER),
+            "4. Approvals need the member's loan, from the Loans sheet or already saved",
+            "5. Amount in words is filled in from the amount when left blank",
+            "6. Dates must be B.S. YYYY-MM-DD",
+            "7. Rows already in the database are skipped, so a corrected file can be imported again",
+        ]
+        for row_num, text in enumerate(instructions, 1):
+            ws.cell(row=row_num, column=1, value=text)
+        ws['A1'].font = Font(bold=True, color="FF0000")
+        ws.column_dimensions['A'].width = 100
+
         conn.close()
         return wb
     
     @staticmethod
     def _get_column_type(col_name):
         """Enhanced column type mapping with validation rules"""
-        type_map = {
-            'member_number': 'Text (Unique, Required)',
-            'member_name': 'Text (Required)',
-            'phone': 'Number (10 digits)',
-            'dob_bs': 'B.S. Date (YYYY-MM-DD)',
-            'citizenship_no': 'Text/Number',
-            'ward_no': 'Number (1-32)'
-        }
-        return type_map.get(col_name, 'Text')
+        return COLUMN_TYPES.get(col_name, 'Text')
 
     @staticmethod
-    def import_data(db_path, filepath):
-        """Enhanced import with automatic date, validation, and logging"""
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
+    def import_data(db_path, filepath, upsert=False):
+        """Import members from a filled-in template (see services.member_import).
+
+        With upsert=True existing members are updated where the file
+        differs, and a change report is written. db_path is kept for
+        callers; the import runs on the application's database connection.
+        """
         try:
-            wb = openpyxl.load_workbook(filepath)
-            ws = wb.active
-            
-            # Find headers (skip metadata rows)
-            # headers = []
-
-            # for row in ws.iter_rows(values_only=True):
-            #     if row and any("member_number" in str(cell).lower() for cell in row):
-            #         # headers = [str(cell).lower().replace(' ', '_') for cell in row]
-            #         headers = [str(cell).strip().lower().replace(' ', '_') for cell in row]
-            #         data_start_row = ws.min_row + list(ws.iter_rows()).index(row) + 2
-            #         break
-            # Explicitly set header row index (row 6 in template)
-            header_row_idx = 6
-            header_row = [cell.value for cell in ws[header_row_idx]]
-
-            # Clean header names
-            headers = [str(cell).strip().lower().replace(' ', '_') for cell in header_row if cell]
-
-            if not headers:
-                return False, "Could not find valid column headers"
-            
-            data_start_row = header_row_idx + 1
-            
-            # Validate against database schema
-            cursor.execute("PRAGMA table_info(member_info)")
-            db_columns = [col[1] for col in cursor.fetchall() 
-                         if col[1] not in ('id', 'date')]
-            
-            missing_cols = set(db_columns) - set(headers)
-            if missing_cols:
-                return False, f"Missing columns: {', '.join(missing_cols)}"
-            
-            # Get current BS date for all records
-            current_date = nepali_date.today().strftime('%Y-%m-%d')
-            
-            # Prepare SQL with date included
-            sql_columns = ['date'] + headers
-            placeholders = ', '.join(['?'] * len(sql_columns))
-            sql = f"INSERT INTO member_info ({', '.join(sql_columns)}) VALUES ({placeholders})"
-            
-            # Import statistics
-            imported = 0
-            skipped = 0
-            errors = []
-            
-            for row_idx, row in enumerate(ws.iter_rows(min_row=data_start_row, values_only=True), 1):
-                if not any(row):  # Skip empty rows
-                    continue
-                
-                # Validate required fields
-                if not row[headers.index('member_number')] or not row[headers.index('member_name')]:
-                    errors.append(f"Row {row_idx}: Missing required fields")
-                    skipped += 1
-                    continue
-                
-                # Add current date and import
-                try:
-                    # cursor.execute(sql, [current_date] + list(row)) -> old code
-                    cleaned_row = [str(cell).strip() if isinstance(cell, str) else cell for cell in row]
-                    cursor.execute(sql, [current_date] + cleaned_row)
-
-                    imported += 1
-                except sqlite3.IntegrityError as e:
-                    if "UNIQUE" in str(e):
-                        errors.append(f"Row {row_idx}: Duplicate member number")
-                    else:
-                        errors.append(f"Row {row_idx}: {str(e)}")
-                    skipped += 1
-                except Exception as e:
-                    errors.append(f"Row {row_idx}: {str(e)}")
-                    skipped += 1
-            
-            conn.commit()
-            
-            # Prepare result message
-            message = [
-                f"Import completed on {current_date}",
-                f"Successfully imported: {imported} members",
-                f"Skipped: {skipped} rows"
-            ]
-            
-            if errors:
-                error_log_path = Path("logs/import_errors.log")
-                error_log_path.parent.mkdir(exist_ok=True)
-                with open(error_log_path, "a") as f:
-                    f.write(f"\n\nImport on {datetime.now()}\n")
-                    f.write("\n".join(errors))
-                
-                message.append(f"Errors logged to: {error_log_path}")
-                message.append("First error: " + errors[0])
-            
-            return True, "\n".join(message)
-            
+            stats = upsert_members(filepath) if upsert else import_members(filepath)
+        except ValueError as e:
+            return False, str(e)
         except Exception as e:
-            conn.rollback()
             return False, f"Fatal import error: {str(e)}"
-        finally:
-            conn.close()
\ No newline at end of file
+
+        return True, ExcelHandler.import_summary(stats)
+
+    @staticmethod
+    def import_summary(stats):
+        """Result message for a services.member_import stats dict; row errors go to the import log."""
+        current_date = nepali_date.today().strftime('%Y-%m-%d')
+        message = [
+            f"Import {'cancelled' if stats['cancelled'] else 'completed'} on {current_date}",
+            f"Successfully imported: {stats['inserted']} members",
+            f"Skipped: {stats['skipped']} rows",
+            f"Speed: {stats['rows_per_sec']:.0f} rows/sec ({stats['elapsed']:.1f}s)",
+        ]
+        if stats["column_errors"]:
+            message.append("Invalid cells: " + ", ".join(
+                f"{column} {count}" for column, count in stats["column_errors"].items()
+            ))
+        if "changed" in stats:
+            message[1:2] = [
+                f"New members: {stats['inserted']}",
+                f"Updated: {stats['changed']} members ({len(stats['changes'])} fields)",
+                f"Unchanged: {stats['unchanged']} members",
+            ]
+            if not stats["cancelled"]:
+                report_path = Path("logs") / f"member_upsert_{datetime.now():%Y%m%d_%H%M%S}.xlsx"
+                report_path.parent.mkdir(exist_ok=True)
+                ExcelHandler.write_upsert_report(stats, report_path)
+                message.append(f"Change report: {report_path}")
+        if stats["resumed_from"]:
+            message.append(f"Resumed after row {stats['resumed_from']}")
+
+        errors = [f"Row {row_number}: {error}" for row_number, error in stats["errors"]]
+        if errors:
+            error_log_path = Path("logs/import_errors.log")
+            error_log_path.parent.mkdir(exist_ok=True)
+            with open(error_log_path, "a") as f:
+                f.write(f"\n\nImport on {datetime.now()}\n")
+                f.write("\n".join(errors))
+                if stats["error_count"] > len(errors):
+                    f.write(f"\n... and {stats['error_count'] - len(errors)} more")
+
+            message.append(f"Errors logged to: {error_log_path}")
+            message.append("First error: " + errors[0])
+
+        return "\n".join(message)
+
+    @staticmethod
+    def write_upsert_report(stats, filepath):
+        """Write an upsert's summary, field changes, new members and skipped rows to an .xlsx."""
+        wb = openpyxl.Workbook(write_only=True)
+
+        def add_sheet(title, headers, rows):
+            ws = wb.create_sheet(title)
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = Font(bold=True)
+                cell.fill = ExcelHandler.HEADER_FILL
+                header_cells.append(cell)
+            ws.append(header_cells)
+            for row in rows:
+                ws.append(list(row))
+
+        add_sheet("Summary", ["Item", "Count"], [
+            ("Rows read", stats["rows_read"]),
+            ("New members", stats["inserted"]),
+            ("Updated members", stats["changed"]),
+            ("Updated fields", len(stats["changes"])),
+            ("Unchanged members", stats["unchanged"]),
+            ("Skipped rows", stats["skipped"]),
+        ])
+        add_sheet("Changed", ["Member Number", "Column", "Old Value", "New Value"], stats["changes"])
+        add_sheet("New Members", ["Member Number", "Member Name"], stats["inserted_members"])
+        add_sheet("Skipped", ["Row", "Reason"], stats["errors"])
+        wb.save(filepath)
@@ -0,0 +1,158 @@
+"""Normalized search keys for mixed-script member search.
+
+Names are stored in Devanagari or Latin script, phone and DOB fields with
+Nepali or ASCII digits, and staff type whichever is handy. search_key()
+maps all of them onto one lowercase ASCII form so that "राम थापा",
+"Ram Thapa" and "raam thaapaa" give the same key, and "९८४१" equals "9841":
+
+  1. digits are folded to ASCII,
+  2. Devanagari is transliterated to Latin (inherent vowel dropped at the
+     end of a word unless it follows a conjunct: राम -> ram, कृष्ण -> krishna),
+  3. accents are stripped (José -> jose),
+  4. common romanization variants are folded (sh/s, aa/a, ee/i, ou/au/o,
+     w/v/b, doubled letters).
+
+The same function is applied to what the user types, so a prefix of a word
+folds to a prefix of the word's key.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+
+DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+VOWELS = {
+    "अ": "a", "आ": "aa", "इ": "i", "ई": "ee", "उ": "u", "ऊ": "oo", "ऋ": "ri",
+    "ए": "e", "ऐ": "ai", "ओ": "o", "औ": "au",
+}
+VOWEL_SIGNS = {
+    "ा": "aa", "ि": "i", "ी": "ee", "ु": "u", "ू": "oo", "ृ": "ri",
+    "े": "e", "ै": "ai", "ो": "o", "ौ": "au", "ॅ": "e", "ॉ": "o",
+}
+CONSONANTS = {
+    "क": "k", "ख": "kh", "ग": "g", "घ": "gh", "ङ": "ng",
+    "च": "ch", "छ": "chh", "ज": "j", "झ": "jh", "ञ": "n",
+    "ट": "t", "ठ": "th", "ड": "d", "ढ": "dh", "ण": "n",
+    "त": "t", "थ": "th", "द": "d", "ध": "dh", "न": "n",
+    "प": "p", "फ": "ph", "ब": "b", "भ": "bh", "म": "m",
+    "य": "y", "र": "r", "ल": "l", "व": "v",
+    "श": "sh", "ष": "sh", "स": "s", "ह": "h",
+}
+SIGNS = {"ं": "n", "ँ": "n", "ः": "h"}
+VIRAMA = "्"
+NUKTA = "़"
+SILENT = {NUKTA, "ऽ", "‌", "‍"}  # nukta, avagraha, ZWNJ, ZWJ
+
+# Applied in order to the Latin form
+ROMAN_FOLDS = [
+    ("chh", "ch"), ("sh", "s"), ("ph", "f"),
+    ("aa", "a"), ("ee", "i"), ("oo", "u"), ("ou", "o"), ("au", "o"),
+    ("w", "b"), ("v", "b"), ("z", "j"), ("q", "k"), ("x", "ks"),
+]
+REPEATED = re.compile(r"([a-z])\1+")
+NON_WORD = re.compile(r"[^\w\u0900-\u097f]+|_")
+
+
+def _is_devanagari_letter(char):
+    return char in CONSONANTS or char in VOWEL_SIGNS or char in VOWELS or char in SIGNS or char == VIRAMA
+
+
+def transliterate(text):
+    """Romanize the Devanagari in text; anything else is left as it is."""
+    out = []
+    chars = [c for c in text if c not in SILENT]
+    for i, char in enumerate(chars):
+        if char == "ज" and i + 2 < len(chars) and chars[i + 1] == VIRAMA and chars[i + 2] == "ञ":
+            out.append("g")  # ज्ञ is written gy
+            continue
+        if char == "ञ" and i >= 2 and chars[i - 1] == VIRAMA and chars[i - 2] == "ज":
+            out.append("y")
+        elif char in CONSONANTS:
+            out.append(CONSONANTS[char])
+        elif char in VOWELS:
+            out.append(VOWELS[char])
+            continue
+        elif char in VOWEL_SIGNS:
+            out.append(VOWEL_SIGNS[char])
+            continue
+        elif char in SIGNS:
+            out.append(SIGNS[char])
+            continue
+        elif char == VIRAMA:
+            continue
+        else:
+            out.append(char)
+            continue
+
+        # A consonant: add its inherent 'a' unless a vowel sign or virama follows
+        following = chars[i + 1] if i + 1 < len(chars) else ""
+        if following in VOWEL_SIGNS or following == VIRAMA:
+            continue
+        in_conjunct = i >= 1 and chars[i - 1] == VIRAMA
+        word_final = not _is_devanagari_letter(following)
+        if word_final and not in_conjunct:
+            continue
+        out.append("a")
+    return "".join(out)
+
+
+def strip_accents(text):
+    """Drop combining accents from non-Devanagari letters (José -> Jose)."""
+    return "".join(
+        c for c in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(c) or "\u0900" <= c <= "\u097f"
+    )
+
+
+def fold_roman(text):
+    """Fold common romanization variants of lowercase Latin text."""
+    for old, new in ROMAN_FOLDS:
+        text = text.replace(old, new)
+    return REPEATED.sub(r"\1", text)
+
+
+@lru_cache(maxsize=65536)
+def _fold_word(word):
+    # Names and places repeat across members, so the per-word work is cached
+    return fold_roman(transliterate(strip_accents(word)))
+
+
+def search_key(text):
+    """Normalized, space-separated search key for a field value."""
+    if text is None:
+        return ""
+    return _field_key(str(text))
+
+
+@lru_cache(maxsize=65536)
+def _field_key(text):
+    if not text.isascii():
+        text = text.translate(DEVANAGARI_DIGITS)
+    words = NON_WORD.split(text.casefold())
+    return " ".join(word if word.isdigit() else _fold_word(word) for word in words if word)
+
+
+def number_key(text):
+    """Key for phone/ID numbers: the words plus all digits run together,
+    so 98-41234567 is also found as 9841."""
+    key = search_key(text)
+    digits = "".join(c for c in key if c.isdigit())
+    return f"{key} {digits}" if digits and digits not in key.split() else key
+
+
+def member_number_key(member_number):
+    """The member number as stored and without its leading zeros."""
+    number = search_key(member_number)
+    short = number.lstrip("0")
+    return f"{number} {short}" if short and short != number else number
+
+
+def member_keys(member_number, member_name, father_name, grandfather_name, phone, citizenship_no, address):
+    """The five member_search_keys columns: name, number, family, contact, address."""
+    return (
+        search_key(member_name),
+        member_number_key(member_number),
+        f"{search_key(father_name)} {search_key(grandfather_name)}".strip(),
+        f"{number_key(phone)} {number_key(citizenship_no)}".strip(),
+        search_key(address),
+    )